@@ -0,0 +1,49 @@
+"""
+Benchmark of grouped ci_mean() against one call per stratum.
+
+Simulates --rows observations over --districts x --weeks strata and
+compares looping ci_mean() over the groups of a groupby with the single
+vectorized call ci_mean(df, value="y", by=["district", "week"]).
+
+Usage:
+    python benchmarks/bench_ci_mean.py [--rows N] [--districts D] [--weeks W]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from pyepidisplay.ci_mean import ci_mean
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--districts", type=int, default=200)
+    parser.add_argument("--weeks", type=int, default=52)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"district": rng.integers(0, args.districts, args.rows),
+                       "week": rng.integers(0, args.weeks, args.rows),
+                       "y": rng.normal(20, 5, args.rows)})
+
+    start = time.perf_counter()
+    looped = [ci_mean(group.to_numpy())
+              for _, group in df.groupby(["district", "week"])["y"]]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = ci_mean(df, value="y", by=["district", "week"])
+    batch_time = time.perf_counter() - start
+
+    print(f"{len(looped)} strata, {args.rows:,} rows")
+    print(f"loop of ci_mean(array) {loop_time:>8.3f}s")
+    print(f"ci_mean(df, by=...)    {batch_time:>8.3f}s  ({loop_time / batch_time:.1f}x)")
+    assert len(batched) == len(looped)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Scaling of the ci_mean() bootstrap with the number of resamples and workers.
+
+Times ci_mean(method="bca") on HW93.epg resampled to --n values, for a
+growing number of resamples with one process and with all cores. Time
+should grow linearly in n_boot, and the pooled runs should approach a
+speed-up equal to the number of cores once the pool start-up is amortised.
+
+Usage:
+    python benchmarks/bench_ci_mean_bootstrap.py [--n N] [--boots B1 B2 ...]
+"""
+
+import argparse
+import os
+import time
+
+from pyepidisplay.ci_mean import ci_mean
+from pyepidisplay.data import synthesize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=10_000)
+    parser.add_argument("--boots", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000])
+    args = parser.parse_args()
+
+    values = synthesize("HW93", n=args.n, seed=0)["epg"].to_numpy(dtype=float)
+    cores = os.cpu_count() or 1
+    print(f"{'n_boot':>10}{'1 process':>12}{f'{cores} processes':>16}")
+    for n_boot in args.boots:
+        times = []
+        for n_jobs in (1, -1):
+            start = time.perf_counter()
+            ci_mean(values, method="bca", n_boot=n_boot, seed=0, n_jobs=n_jobs)
+            times.append(time.perf_counter() - start)
+        print(f"{n_boot:>10,}{times[0]:>11.2f}s{times[1]:>15.2f}s")
+
+
+if __name__ == "__main__":
+    main()
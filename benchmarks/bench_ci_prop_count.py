@@ -0,0 +1,81 @@
+"""
+Benchmark of counting 0/1 data in ci_prop() on very large inputs.
+
+Compares the previous np.array(x) / x[~np.isnan(x)] / np.sum path with the
+counting path of ci_prop() for numpy bool, float with NaN, pandas
+`boolean` and `Int8` with missing values, and a two-level categorical.
+The previous path cannot handle nullable data with missing values, so it
+is run on their float conversion. Peak memory is the tracemalloc peak of
+each call (numpy and pandas buffers are traced).
+
+Usage:
+    python benchmarks/bench_ci_prop_count.py [--n 100000000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from pyepidisplay.ci_prop import ci_prop
+
+
+def previous(x):
+    """The counting code ci_prop() used before."""
+    x = np.array(x)
+    x = x[~np.isnan(x)]
+    return ci_prop(np.sum(x), len(x))
+
+
+def measure(func, x):
+    """Return (seconds, peak MB) of func(x)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(x)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def inputs(n, rng):
+    """Yield (label, data, data the previous path can read) one at a time."""
+    flags = rng.random(n) < 0.1
+    missing = rng.random(n) < 0.05
+    yield "numpy bool", flags, flags
+    del flags
+    floats = np.where(missing, np.nan, (rng.random(n) < 0.1).astype(float))
+    yield "numpy float + NaN", floats, floats
+    boolean = pd.array(floats, dtype="boolean")
+    yield "pandas boolean + NA", boolean, floats
+    del boolean
+    int8 = pd.array(floats, dtype="Int8")
+    yield "pandas Int8 + NA", int8, floats
+    del int8
+    codes = np.where(missing, -1, (rng.random(n) < 0.1)).astype(np.int8)
+    categorical = pd.Categorical.from_codes(codes, categories=["no", "yes"])
+    yield "categorical no/yes", categorical, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=100_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"n = {args.n:,}")
+    print(f"{'input':<22}{'previous':>20}{'ci_prop':>20}")
+    for label, data, old_data in inputs(args.n, rng):
+        new_time, new_peak = measure(ci_prop, data)
+        if old_data is None:
+            old = f"{'unsupported':>20}"
+        else:
+            old_time, old_peak = measure(previous, old_data)
+            old = f"{old_time:>8.2f}s {old_peak:>8.0f}MB"
+        print(f"{label:<22}{old}{new_time:>8.2f}s {new_peak:>8.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
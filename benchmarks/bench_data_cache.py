@@ -0,0 +1,49 @@
+"""
+Benchmark of repeated data() loads with and without the dataset cache.
+
+Compares reading the CSV on every call (the previous behaviour) with the
+cached data(), which parses each dataset once and returns cheap
+independent copies afterwards.
+
+Usage:
+    python benchmarks/bench_data_cache.py [--repeat N] [--datasets A B ...]
+"""
+
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from pyepidisplay.data import data, cache_clear, cache_info
+from pyepidisplay.datasets import DATA_PATH
+
+
+def time_loop(func, repeat):
+    """Return the total wall time in seconds of calling `func()` `repeat` times."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--datasets", nargs="+",
+                        default=["Outbreak", "Compaq", "IudFollowup"])
+    args = parser.parse_args()
+
+    print(f"{'dataset':<14}{'read_csv':>12}{'data()':>12}{'speed-up':>10}")
+    for name in args.datasets:
+        path = os.path.join(DATA_PATH, f"{name}.csv")
+        uncached = time_loop(lambda: pd.read_csv(path), args.repeat)
+        cache_clear()
+        cached = time_loop(lambda: data(name), args.repeat)
+        print(f"{name:<14}{uncached / args.repeat * 1e3:>10.3f}ms"
+              f"{cached / args.repeat * 1e3:>10.3f}ms{uncached / cached:>9.1f}x")
+    print(cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark of column projection and row filtering pushed into data().
+
+For the widest bundled datasets (Attitudes, Oswego) compares loading the
+full frame and selecting afterwards with passing columns=/filter= to
+data(), for both the CSV and the Parquet copy. The dataset cache is
+disabled so every call reads from disk. Reported memory is the
+tracemalloc peak of the call and the size of the returned frame.
+
+Usage:
+    python benchmarks/bench_data_projection.py [--repeat N]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from pyepidisplay.data import data, cache_resize
+
+CASES = {
+    "Attitudes": {"columns": ["sex", "qa1", "qa2"], "filter": [("sex", "==", "male")]},
+    "Oswego": {"columns": ["age", "ill", "vanilla"], "filter": [("ill", "==", True)]},
+}
+
+
+def measure(func, repeat):
+    """Return (mean seconds, peak MB, result MB) of `func()`."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    tracemalloc.stop()
+    return elapsed, peak, result.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    cache_resize(0)
+    print(f"{'dataset':<11}{'format':<9}{'read':<22}{'time':>10}{'peak':>10}{'result':>10}")
+    for name, case in CASES.items():
+        columns, filters = case["columns"], case["filter"]
+        col, _, value = filters[0]
+        variants = {
+            "full": lambda fmt: data(name, format=fmt),
+            "full, then select": lambda fmt: (
+                lambda df: df.loc[df[col] == value, columns])(data(name, format=fmt)),
+            "columns=": lambda fmt: data(name, format=fmt, columns=columns),
+            "columns= + filter=": lambda fmt: data(name, format=fmt, columns=columns,
+                                                   filter=filters),
+        }
+        for fmt in ("csv", "parquet"):
+            for label, read in variants.items():
+                elapsed, peak, size = measure(lambda: read(fmt), args.repeat)
+                print(f"{name:<11}{fmt:<9}{label:<22}{elapsed * 1e3:>8.2f}ms"
+                      f"{peak * 1024:>8.0f}kB{size * 1024:>8.1f}kB")
+    cache_resize(16)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Memory saved by the typed dataset schema.
+
+For every bundled dataset, compares the deep memory usage of the frame
+returned by data(name, typed=False) (what pd.read_csv guesses) with the
+typed frame (categories and datetimes) and the typed="compact" frame,
+which also downcasts integers.
+
+Usage:
+    python benchmarks/bench_dataset_schema.py
+"""
+
+import pandas as pd
+
+from pyepidisplay.data import data
+
+
+def main():
+    rows = []
+    for name in data():
+        raw = data(name, typed=False).memory_usage(deep=True).sum()
+        typed = data(name, format="csv").memory_usage(deep=True).sum()
+        compact = data(name, format="csv", typed="compact").memory_usage(deep=True).sum()
+        rows.append({"dataset": name, "raw_kB": raw / 1024,
+                     "typed_kB": typed / 1024, "compact_kB": compact / 1024,
+                     "saved_pct": 100 * (1 - compact / raw)})
+    table = pd.DataFrame(rows).set_index("dataset")
+    total = table[["raw_kB", "typed_kB", "compact_kB"]].sum()
+    table.loc["Total"] = [total["raw_kB"], total["typed_kB"], total["compact_kB"],
+                          100 * (1 - total["compact_kB"] / total["raw_kB"])]
+    print(table.round(1).to_string())
+
+
+if __name__ == "__main__":
+    main()
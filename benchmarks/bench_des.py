@@ -0,0 +1,74 @@
+"""
+Benchmark of des() on wide and tall frames.
+
+Compares the previous per-column implementation (three comprehensions over
+df.columns) with des() for the default table and with the memory=,
+missing= and distinct= profile columns, on a wide frame (--columns genomic
+style 0/1/2 columns) and a tall frame (--rows rows of mixed columns).
+
+Usage:
+    python benchmarks/bench_des.py [--columns 20000] [--rows 1000000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from pyepidisplay.des import des
+
+
+def previous(df):
+    """The table des() built before."""
+    var_labels = {col: "" for col in df.columns}
+    return pd.DataFrame({
+        "Variable": list(df.columns),
+        "Class": [df[col].dtype.name for col in df.columns],
+        "Description": [var_labels.get(col, "") for col in df.columns],
+    })
+
+
+def frames(columns, rows, rng):
+    """Return {label: frame} of the wide and the tall test frame."""
+    wide = pd.DataFrame(rng.integers(0, 3, (2000, columns)).astype(float),
+                        columns=[f"snp{i}" for i in range(columns)])
+    wide.iloc[::50, ::3] = np.nan
+    tall = pd.DataFrame({
+        "id": np.arange(rows),
+        "age": rng.integers(0, 100, rows),
+        "weight": rng.normal(70, 10, rows),
+        "district": rng.integers(0, 500, rows).astype(str),
+        "visit": pd.to_datetime(rng.integers(0, 10 ** 8, rows), unit="s"),
+        "ill": pd.array(rng.random(rows) < 0.2, dtype="boolean"),
+    })
+    return {f"wide 2000 x {columns}": wide, f"tall {rows} x 6": tall}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--columns", type=int, default=20_000)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    cases = {
+        "previous": previous,
+        "des": des,
+        "des missing=": lambda df: des(df, missing=True),
+        "des memory=": lambda df: des(df, memory=True),
+        "des distinct=": lambda df: des(df, distinct=True),
+        "des all": lambda df: des(df, memory=True, missing=True, distinct=True),
+        "des all, sample=100000": lambda df: des(df, memory=True, missing=True,
+                                                 distinct=True, sample=100_000),
+    }
+    rng = np.random.default_rng(0)
+    for label, df in frames(args.columns, args.rows, rng).items():
+        print(label)
+        for name, func in cases.items():
+            start = time.perf_counter()
+            func(df)
+            print(f"  {name:<26}{time.perf_counter() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark of des() on files against loading them first.
+
+Writes Outbreak resampled to --rows rows as CSV and Parquet with
+data.synthesize(), then times des(pd.read_csv(path)) / des(pd.read_parquet
+(path)) against des(path), which reads the Parquet metadata or a CSV sample
+plus a newline scan. Memory is the tracemalloc peak of each call.
+
+Usage:
+    python benchmarks/bench_des_file.py [--rows 10000000] [--dir DIR]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from pyepidisplay.data import synthesize
+from pyepidisplay.des import des
+
+
+def measure(func):
+    """Return (seconds, peak MB) of func()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--dir", help="directory for the generated files (default: a temporary one)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = args.dir or tmp
+        readers = {"csv": pd.read_csv, "parquet": pd.read_parquet}
+        print(f"{'file':<10}{'size':>10}{'load + des':>22}{'des(path)':>22}")
+        for fmt, read in readers.items():
+            path = os.path.join(folder, f"outbreak_{args.rows}.{fmt}")
+            if not os.path.exists(path):
+                synthesize("Outbreak", n=args.rows, seed=1, path=path, chunksize=1_000_000)
+            size = os.path.getsize(path) / 1024 ** 2
+            loaded = measure(lambda: des(read(path)))
+            direct = measure(lambda: des(path))
+            print(f"{fmt:<10}{size:>8.0f}MB"
+                  f"{loaded[0]:>11.2f}s{loaded[1]:>9.0f}MB"
+                  f"{direct[0]:>11.3f}s{direct[1]:>9.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark of the compute-only path of tab1(), tabpct() and dotplot().
+
+Times each function with graph=True (draw immediately, Agg backend),
+graph=False (no plot) and graph="lazy" (plot object built but not rendered)
+and reports the time saved per call.
+
+Usage:
+    python benchmarks/bench_headless_plots.py [--repeat N]
+"""
+
+import argparse
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+from pyepidisplay.data import data  # noqa: E402
+from pyepidisplay.dotplot import dotplot  # noqa: E402
+from pyepidisplay.tab1 import tab1  # noqa: E402
+from pyepidisplay.tabpct import tabpct  # noqa: E402
+
+
+def time_call(func, repeat):
+    """Return the mean wall time of `func()` in seconds over `repeat` calls."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+        plt.close("all")
+    return sum(times) / len(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    df = data("Outbreak")
+    cases = {
+        "tab1": lambda graph: tab1("age", df, graph=graph),
+        "tabpct": lambda graph: tabpct(df["sex"], df["beefcurry"], graph=graph,
+                                       percent="none"),
+        "dotplot": lambda graph: dotplot(df["age"], graph=graph),
+    }
+
+    print(f"{'function':<10}{'graph=True':>14}{'graph=False':>14}"
+          f"{'graph=lazy':>14}{'saved/call':>14}")
+    for name, call in cases.items():
+        eager = time_call(lambda: call(True), args.repeat)
+        headless = time_call(lambda: call(False), args.repeat)
+        lazy = time_call(lambda: call("lazy"), args.repeat)
+        print(f"{name:<10}{eager * 1e3:>12.2f}ms{headless * 1e3:>12.2f}ms"
+              f"{lazy * 1e3:>12.2f}ms{(eager - headless) * 1e3:>12.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
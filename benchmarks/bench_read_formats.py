@@ -0,0 +1,77 @@
+"""
+Benchmark of reading the bundled datasets as CSV, Parquet and Feather.
+
+Every dataset is read N times per format with pandas. Timings are taken
+without tracing; memory is the tracemalloc peak of a separate traced run.
+The rows are written to benchmarks/results/read_formats_summary.csv and
+read_formats_memory_summary.csv, using the same schema as the
+measurements written by read_speed.py but kept out of the package data,
+since they describe the machine they were run on. The `file` column
+carries the format extension (Outbreak.csv, Outbreak.parquet,
+Outbreak.feather).
+
+Note that tracemalloc only sees allocations made through Python/numpy;
+buffers held by pyarrow's own memory pool are not counted, so the memory
+figures of the binary formats are lower bounds.
+
+Usage:
+    python benchmarks/bench_read_formats.py [--repeat N] [--no-write] [--output DIR]
+"""
+
+import argparse
+import os
+import tempfile
+
+import pandas as pd
+
+from pyepidisplay.datasets import DATA_PATH
+from pyepidisplay.datasets.manifest import DATASETS
+from read_speed import measure, time_stats
+
+RESULTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--no-write", action="store_true",
+                        help="print the results without writing the CSVs")
+    parser.add_argument("--output", default=RESULTS,
+                        help="directory the CSVs are written to (default: benchmarks/results)")
+    args = parser.parse_args()
+
+    summary_rows, memory_rows = [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, entry in DATASETS.items():
+            csv_path = os.path.join(DATA_PATH, entry["file"])
+            parquet_path = os.path.join(DATA_PATH, f"{name}.parquet")
+            feather_path = os.path.join(tmp, f"{name}.feather")
+            pd.read_csv(csv_path).to_feather(feather_path)
+
+            for path, read in [(csv_path, pd.read_csv),
+                               (parquet_path, pd.read_parquet),
+                               (feather_path, pd.read_feather)]:
+                times, traced, peaks = measure(read, path, args.repeat)
+                file = os.path.basename(path)
+                summary_rows.append({"file": file, "library": "pandas",
+                                     **time_stats(times)})
+                memory_rows.append({"file": file, "library": "pandas",
+                                    **time_stats(traced),
+                                    "mean_mem_MB": round(peaks.mean(), 3),
+                                    "max_mem_MB": round(peaks.max(), 3)})
+
+    memory = pd.DataFrame(memory_rows)
+    memory[["dataset", "format"]] = memory["file"].str.rsplit(".", n=1, expand=True)
+    print(memory.pivot(index="dataset", columns="format",
+                       values=["mean_time_s", "mean_mem_MB"]).to_string())
+
+    if not args.no_write:
+        os.makedirs(args.output, exist_ok=True)
+        pd.DataFrame(summary_rows).to_csv(
+            os.path.join(args.output, "read_formats_summary.csv"), index=False)
+        memory.drop(columns=["dataset", "format"]).to_csv(
+            os.path.join(args.output, "read_formats_memory_summary.csv"), index=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Scaling benchmark of table_stack, tabpct, dotplot and logistic_display.
+
+Outbreak is resampled to growing sizes with data.synthesize() and each
+function is timed once per size with plotting disabled, so the table
+shows how the computations scale rather than how long drawing takes.
+A function that takes longer than --budget seconds is skipped at the
+larger sizes.
+
+Usage:
+    python benchmarks/bench_scale.py [--sizes 10000 100000 ...] [--budget S]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+from pyepidisplay.data import synthesize
+from pyepidisplay.dotplot import dotplot
+from pyepidisplay.logistic_display import logistic_display
+from pyepidisplay.table_stack import table_stack
+from pyepidisplay.tabpct import tabpct
+
+CASES = {
+    "table_stack": lambda df: table_stack(["sex", "nausea"], df, by=["beefcurry"]),
+    "tabpct": lambda df: tabpct(df["sex"], df["beefcurry"], graph=False),
+    "dotplot": lambda df: dotplot(df["age"], graph=False),
+    "logistic_display": lambda df: logistic_display("nausea ~ beefcurry + saltegg", df),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[10_000, 100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--budget", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'rows':>12}" + "".join(f"{name:>18}" for name in CASES))
+    too_slow = set()
+    for n in args.sizes:
+        df = synthesize("Outbreak", n=n, seed=args.seed)
+        cells = []
+        for name, func in CASES.items():
+            if name in too_slow:
+                cells.append(f"{'skipped':>18}")
+                continue
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                func(df)
+            elapsed = time.perf_counter() - start
+            if elapsed > args.budget:
+                too_slow.add(name)
+            cells.append(f"{elapsed:>17.3f}s")
+        print(f"{n:>12,}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark of summ() on a wide, grouped DataFrame.
+
+Builds a frame of --columns numeric columns (resampled from Outbreak with
+data.synthesize(), plus missing values) and compares summarising every
+column within every group by looping the Series summ() with the single
+grouped call summ(df, by=...).
+
+Usage:
+    python benchmarks/bench_summ.py [--rows N] [--columns K] [--by sex|beefcurry|age]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from pyepidisplay.data import synthesize
+from pyepidisplay.summ_function import summ
+
+# Candidate grouping columns: 2, 3 and about 50 groups
+GROUPS = ("sex", "beefcurry", "age")
+
+
+def wide_frame(rows, columns, seed=0):
+    """Outbreak resampled to `rows` rows and widened to `columns` numeric columns."""
+    base = synthesize("Outbreak", n=rows, seed=seed)
+    rng = np.random.default_rng(seed)
+    numeric = base[["age", "onset", "eclair"]].astype(float)
+    numeric["onset"] = numeric["onset"] - numeric["onset"].min()
+    wide = {f"x{i}": numeric.iloc[:, i % 3].to_numpy() * rng.uniform(0.5, 2)
+            for i in range(columns)}
+    return pd.DataFrame({"sex": base["sex"], "beefcurry": base["beefcurry"],
+                         "age": base["age"], **wide})
+
+
+def loop(df, by):
+    """summ() of every column within every group, one Series at a time."""
+    rows = []
+    for key, group in df.groupby(by):
+        for col in group.columns.drop(by):
+            rows.append({by: key, "variable": col, **summ(group[col])})
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=200)
+    parser.add_argument("--by", choices=GROUPS, default="age")
+    args = parser.parse_args()
+
+    df = wide_frame(args.rows, args.columns).drop(
+        columns=[c for c in GROUPS if c != args.by])
+    timings = {}
+    for label, func in [("loop of summ(series)", lambda: loop(df, args.by)),
+                        ("summ(df, by=...)", lambda: summ(df, by=args.by))]:
+        start = time.perf_counter()
+        result = func()
+        timings[label] = time.perf_counter() - start
+        print(f"{label:<22}{timings[label]:>9.3f}s  ({len(result)} rows)")
+    print(f"speed-up {timings['loop of summ(series)'] / timings['summ(df, by=...)']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
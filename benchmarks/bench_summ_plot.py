@@ -0,0 +1,42 @@
+"""
+Render time of the summ() dot chart as the number of observations grows.
+
+The chart draws at most 2,000 order statistics per group, so the time to
+render and save it should stay roughly flat in n; what still grows is the
+sort that picks the order statistics and the summary itself.
+
+Usage:
+    python benchmarks/bench_summ_plot.py [--sizes 1000 100000 ...]
+"""
+
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+from pyepidisplay.summ_function import summ
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000, 1_000_000, 10_000_000])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'n':>12}{'summary':>12}{'render':>12}")
+    for n in args.sizes:
+        values = pd.Series(rng.lognormal(3, 1, n), name="x")
+        start = time.perf_counter()
+        _, plot = summ(values, graph="lazy")
+        summarised = time.perf_counter() - start
+        start = time.perf_counter()
+        plot.savefig(io.BytesIO(), format="png")
+        rendered = time.perf_counter() - start
+        print(f"{n:>12,}{summarised:>11.3f}s{rendered:>11.3f}s")
+
+
+if __name__ == "__main__":
+    main()
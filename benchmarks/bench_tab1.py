@@ -0,0 +1,74 @@
+"""
+Benchmark of tab1() against its previous implementation.
+
+The previous tab1() checked for missing values with a Python loop calling
+pd.isna() on every element, then built the table through value_counts(),
+reset_index() and set_index(). tab1() now factorizes the column (or takes
+its category codes) once and counts with np.bincount. Both are timed with
+plotting disabled on an int16 column with 100 levels and a categorical
+column, at each of --sizes rows; an implementation that takes longer than
+--budget seconds is skipped for the remaining cases.
+
+Usage:
+    python benchmarks/bench_tab1.py [--sizes 1000000 100000000] [--budget S]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from pyepidisplay.tab1 import tab1
+
+
+def previous(column, df):
+    """The unweighted tab1() table as it was built before."""
+    for i in df[column]:
+        if pd.isna(i):
+            raise ValueError("Column contains NA values.")
+    counts = df[column].value_counts(dropna=False).sort_index()
+    table = counts.reset_index()
+    table.columns = [column, "Frequency"]
+    table = table.set_index(column)
+    table["Percent"] = ((table["Frequency"] / len(df)) * 100).round(2)
+    table["Cumulative Percent"] = table["Percent"].cumsum().round(2)
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 100_000_000])
+    parser.add_argument("--budget", type=float, default=30.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    cases = {
+        "previous": previous,
+        "tab1": lambda column, df: tab1(column, df, graph=False),
+        "tab1 na='count'": lambda column, df: tab1(column, df, graph=False, na="count"),
+    }
+    print(f"{'rows':>12}{'column':>10}" + "".join(f"{name:>18}" for name in cases))
+    too_slow = set()
+    for n in args.sizes:
+        df = pd.DataFrame({"age": rng.integers(0, 100, n, dtype=np.int16)})
+        df["district"] = pd.Categorical.from_codes(
+            rng.integers(0, 20, n, dtype=np.int8), [f"d{i:02d}" for i in range(20)])
+        for column in ("age", "district"):
+            cells = []
+            for name, func in cases.items():
+                if name in too_slow:
+                    cells.append(f"{'skipped':>18}")
+                    continue
+                start = time.perf_counter()
+                func(column, df)
+                elapsed = time.perf_counter() - start
+                if elapsed > args.budget:
+                    too_slow.add(name)
+                cells.append(f"{elapsed:>17.3f}s")
+            print(f"{n:>12,}{column:>10}" + "".join(cells))
+        del df
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark of tab1_many() against one tab1() call per column.
+
+A survey-like frame of --columns columns (a mix of categorical, text and
+boolean answers) and --rows rows is tabulated with a loop of tab1(graph=
+False) calls and with tab1_many() for each of --jobs thread counts.
+
+Usage:
+    python benchmarks/bench_tab1_many.py [--columns 300] [--rows 100000] [--jobs 1 4]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from pyepidisplay.tab1 import tab1, tab1_many
+
+
+def survey(columns, rows, rng):
+    """Frame of categorical, text and boolean answers."""
+    answers = ["never", "rarely", "sometimes", "often", "always"]
+    data = {}
+    for i in range(columns):
+        if i % 3 == 0:
+            data[f"q{i}"] = pd.Categorical.from_codes(rng.integers(0, 5, rows), answers)
+        elif i % 3 == 1:
+            data[f"q{i}"] = np.array(answers, dtype=object)[rng.integers(0, 5, rows)]
+        else:
+            data[f"q{i}"] = rng.random(rows) < 0.3
+    return pd.DataFrame(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--columns", type=int, default=300)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    df = survey(args.columns, args.rows, np.random.default_rng(0))
+    cases = {"tab1 per column": lambda: {col: tab1(col, df, graph=False) for col in df}}
+    for n_jobs in args.jobs:
+        cases[f"tab1_many n_jobs={n_jobs}"] = lambda n_jobs=n_jobs: tab1_many(df, n_jobs=n_jobs)
+    cases["tab1_many long=True"] = lambda: tab1_many(df, long=True)
+    print(f"{args.rows:,} rows x {args.columns} columns")
+    for name, func in cases.items():
+        start = time.perf_counter()
+        func()
+        print(f"  {name:<24}{time.perf_counter() - start:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
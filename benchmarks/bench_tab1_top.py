@@ -0,0 +1,69 @@
+"""
+Benchmark of tab1() on high-cardinality columns with and without top=.
+
+A facility-code column of --rows rows with Zipf-distributed codes drawn
+from each of --levels distinct values is tabulated with graph="lazy" and
+the plot is rendered to PNG (Agg backend). The full table draws one bar
+per distinct value; top=--top draws at most top + 1 bars. Full renders
+are skipped once one takes longer than --budget seconds. The chunked
+Misra-Gries path of tab1_chunks() is timed on the same data.
+
+Usage:
+    python benchmarks/bench_tab1_top.py [--rows N] [--levels 100 1000 100000]
+                                        [--top K] [--budget S]
+"""
+
+import argparse
+import io
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from pyepidisplay.tab1 import tab1, tab1_chunks  # noqa: E402
+
+
+def table_and_render(df, **kwargs):
+    """Return (table seconds, render seconds) of tab1(graph="lazy")."""
+    start = time.perf_counter()
+    _, plot = tab1("facility", df, graph="lazy", **kwargs)
+    built = time.perf_counter()
+    plot.savefig(io.BytesIO(), format="png")
+    rendered = time.perf_counter()
+    plt.close("all")
+    return built - start, rendered - built
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--levels", type=int, nargs="+", default=[100, 1_000, 100_000])
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--budget", type=float, default=60.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'levels':>10}{'full table':>12}{'full plot':>12}"
+          f"{'top table':>12}{'top plot':>12}{'chunks top':>12}")
+    too_slow = False
+    for levels in args.levels:
+        df = pd.DataFrame({"facility": np.minimum(rng.zipf(1.2, args.rows), levels)})
+        if too_slow:
+            full = f"{'skipped':>12}{'skipped':>12}"
+        else:
+            table_time, plot_time = table_and_render(df)
+            too_slow = plot_time > args.budget
+            full = f"{table_time:>11.3f}s{plot_time:>11.3f}s"
+        table_time, plot_time = table_and_render(df, top=args.top)
+        start = time.perf_counter()
+        chunks = (df.iloc[i:i + 100_000] for i in range(0, len(df), 100_000))
+        tab1_chunks("facility", chunks, graph=False, top=args.top)
+        chunk_time = time.perf_counter() - start
+        print(f"{levels:>10,}{full}{table_time:>11.3f}s{plot_time:>11.3f}s{chunk_time:>11.3f}s")
+
+
+if __name__ == "__main__":
+    main()
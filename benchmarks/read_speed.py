@@ -0,0 +1,211 @@
+"""
+Regenerate the read_speed_*.csv benchmark files shipped with the datasets.
+
+Every bundled dataset is loaded N times with each available backend:
+
+    pyreadr  .rdata (pyreadr.read_r)
+    pandas   .rdata: converting the frame pyreadr loaded (pd.DataFrame copy)
+    polars   .rdata: converting the frame pyreadr loaded (pl.from_pandas)
+
+These are the (file, library) rows of the shipped CSVs, so a rerun gives a
+comparable diff. With --formats csv parquet, pandas and polars also read
+the CSV and Parquet copies (pd/pl.read_csv, pd/pl.read_parquet); those rows
+are not part of the shipped schema, so --output must then name another
+directory.
+
+The .rdata files are taken from --rdata-dir when given, otherwise they
+are written from the bundled CSVs into a temporary directory (this needs
+pyreadr). Backends or formats that are not installed are skipped with a
+note. Timings are taken without tracing; memory is the tracemalloc peak
+of a separate traced run, so allocations made outside the Python
+allocator (pyarrow and polars buffers) are not counted.
+
+Four files are rewritten, keeping their existing schema:
+
+    read_speed_summary.csv           file, library, time stats
+    read_speed_memory_summary.csv    file, library, traced time and memory
+    read_speed_overview.csv          per-library aggregate of the summary
+    read_speed_memory_overview.csv   per-library aggregate of the memory summary
+
+Usage:
+    python benchmarks/read_speed.py [--repeat N] [--formats rdata csv parquet]
+                                    [--rdata-dir DIR] [--output DIR]
+"""
+
+import argparse
+import importlib
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from pyepidisplay.datasets import DATA_PATH
+from pyepidisplay.datasets.manifest import DATASETS
+
+FORMATS = ("csv", "parquet", "rdata")
+
+# library -> (module to import, {format: name of the reader in that module})
+BACKENDS = {
+    "pyreadr": ("pyreadr", {"rdata": "read_r"}),
+    "pandas": ("pandas", {"csv": "read_csv", "parquet": "read_parquet"}),
+    "polars": ("polars", {"csv": "read_csv", "parquet": "read_parquet"}),
+}
+
+# library -> (module to import, conversion of the pandas frame pyreadr loaded)
+CONVERTERS = {
+    "pandas": ("pandas", lambda mod, frame: mod.DataFrame(frame, copy=True)),
+    "polars": ("polars", lambda mod, frame: mod.from_pandas(frame)),
+}
+
+
+def measure(read, path, repeat):
+    """Return (untraced times, traced times, traced peak MB) of `read(path)`."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        read(path)
+        times.append(time.perf_counter() - start)
+
+    traced_times, peaks = [], []
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        read(path)
+        traced_times.append(time.perf_counter() - start)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024 ** 2)
+        tracemalloc.stop()
+    return np.array(times), np.array(traced_times), np.array(peaks)
+
+
+def time_stats(times):
+    return {
+        "min_time_s": round(times.min(), 5),
+        "max_time_s": round(times.max(), 5),
+        "mean_time_s": round(times.mean(), 5),
+        "sd_time_s": round(times.std(ddof=1), 5),
+    }
+
+
+def available_readers(formats):
+    """Return {library: {format: reader}} for the installed backends."""
+    readers = {}
+    for library, (module, functions) in BACKENDS.items():
+        wanted = {fmt: name for fmt, name in functions.items() if fmt in formats}
+        if not wanted:
+            continue
+        try:
+            mod = importlib.import_module(module)
+        except ImportError:
+            print(f"skipping {library}: not installed")
+            continue
+        if "parquet" in wanted and module == "pandas":
+            try:
+                importlib.import_module("pyarrow")
+            except ImportError:
+                print("skipping pandas parquet: pyarrow not installed")
+                del wanted["parquet"]
+        readers[library] = {fmt: getattr(mod, name) for fmt, name in wanted.items()}
+    if "pyreadr" in readers:
+        for library, (module, convert) in CONVERTERS.items():
+            try:
+                mod = importlib.import_module(module)
+            except ImportError:
+                print(f"skipping {library} rdata: not installed")
+                continue
+            readers.setdefault(library, {})["rdata"] = lambda frame, m=mod, c=convert: c(m, frame)
+    return readers
+
+
+def dataset_files(name, formats, rdata_dir):
+    """Return {format: path} of dataset `name` for the requested formats."""
+    files = {"csv": os.path.join(DATA_PATH, DATASETS[name]["file"]),
+             "parquet": os.path.join(DATA_PATH, f"{name}.parquet")}
+    if "rdata" in formats:
+        path = os.path.join(rdata_dir, f"{name}.rdata")
+        if not os.path.exists(path):
+            import pyreadr
+            pyreadr.write_rdata(path, pd.read_csv(files["csv"]), df_name=name)
+        files["rdata"] = path
+    return {fmt: path for fmt, path in files.items()
+            if fmt in formats and os.path.exists(path)}
+
+
+def overview(summary, memory=False):
+    """Aggregate per-file rows into one row per library."""
+    grouped = summary.groupby("library", sort=True)
+    table = pd.DataFrame({
+        "avg_time_s": grouped["mean_time_s"].mean(),
+        "sd_time_s": grouped["sd_time_s"].mean(),
+        "min_time_s": grouped["min_time_s"].min(),
+        "max_time_s": grouped["max_time_s"].max(),
+    })
+    if memory:
+        table["avg_mem_MB"] = grouped["mean_mem_MB"].mean()
+        table["max_mem_MB"] = grouped["max_mem_MB"].max()
+    else:
+        table = table[["avg_time_s", "min_time_s", "max_time_s", "sd_time_s"]]
+    return table.reset_index()
+
+
+def run(repeat=10, formats=("rdata",), rdata_dir=None):
+    """Measure every dataset and return the (summary, memory summary) frames."""
+    readers = available_readers(formats)
+    if "rdata" in formats and "pyreadr" not in readers:
+        formats = [fmt for fmt in formats if fmt != "rdata"]
+
+    summary_rows, memory_rows = [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in DATASETS:
+            files = dataset_files(name, formats, rdata_dir or tmp)
+            for library, by_format in readers.items():
+                for fmt, read in by_format.items():
+                    if fmt not in files:
+                        continue
+                    if fmt == "rdata" and library != "pyreadr":
+                        # time the conversion of the frame pyreadr loaded
+                        loaded = next(iter(readers["pyreadr"]["rdata"](files[fmt]).values()))
+                        read = lambda _path, convert=read, frame=loaded: convert(frame)  # noqa: E731
+                    times, traced, peaks = measure(read, files[fmt], repeat)
+                    file = os.path.basename(files[fmt])
+                    summary_rows.append({"file": file, "library": library,
+                                         **time_stats(times)})
+                    memory_rows.append({"file": file, "library": library,
+                                        **time_stats(traced),
+                                        "mean_mem_MB": round(peaks.mean(), 3),
+                                        "max_mem_MB": round(peaks.max(), 3)})
+    return pd.DataFrame(summary_rows), pd.DataFrame(memory_rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=["rdata"])
+    parser.add_argument("--rdata-dir", help="directory holding <name>.rdata files")
+    parser.add_argument("--output", default=DATA_PATH,
+                        help="directory the CSVs are written to (default: the datasets)")
+    args = parser.parse_args()
+    if args.repeat < 2:
+        parser.error("--repeat must be at least 2 to estimate the spread")
+    if set(args.formats) != {"rdata"} and os.path.abspath(args.output) == os.path.abspath(DATA_PATH):
+        parser.error("--output must name another directory when timing csv or parquet; "
+                     "the shipped CSVs only hold rdata rows")
+
+    summary, memory = run(args.repeat, args.formats, args.rdata_dir)
+    if summary.empty:
+        parser.error("no backend could read the requested formats")
+    outputs = {
+        "read_speed_summary.csv": summary,
+        "read_speed_memory_summary.csv": memory,
+        "read_speed_overview.csv": overview(summary),
+        "read_speed_memory_overview.csv": overview(memory, memory=True),
+    }
+    for file, table in outputs.items():
+        table.to_csv(os.path.join(args.output, file), index=False)
+    print(outputs["read_speed_memory_overview.csv"].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
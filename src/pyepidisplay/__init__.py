@@ -1,9 +1,19 @@
 import pkgutil
 import importlib
 
-__all__ = []
+# Submodules are imported on first attribute access (PEP 562) so that
+# ``import pyepidisplay`` does not pull in matplotlib, seaborn, scikit-learn
+# or statsmodels before any of them is actually needed.
+__all__ = [module_info.name for module_info in pkgutil.iter_modules(__path__)]
 
-for module_info in pkgutil.iter_modules(__path__):
-    module_name = module_info.name
-    globals()[module_name] = importlib.import_module(f"{__name__}.{module_name}")
-    __all__.append(module_name)
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
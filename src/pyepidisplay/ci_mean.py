@@ -4,24 +4,59 @@
 This module provides a Python implementation of R's epiDisplay ci.mean() function.
 """
 
+import os
+
 import numpy as np
+import pandas as pd
 from scipy import stats
 
-def ci_mean(x, ci=0.95):
+def ci_mean(x, ci=0.95, weights=None, value=None, by=None, method="t",
+            n_boot=10_000, seed=None, n_jobs=1):
     """Calculate confidence interval for a mean.
 
     Args:
-        x: Array or list of numeric values.
+        x: Array or list of numeric values, a DataFrame holding the
+            `value` column, or a MeanStats of (merged) partial data.
         ci: Confidence level (default: 0.95).
+        weights: Optional frequency weights, one per value of x (or a column
+            name when x is a DataFrame). The result equals that of x expanded
+            with np.repeat(x, weights), without building the expanded array.
+        value: Column of the DataFrame x to summarize.
+        by: Column name(s) of the DataFrame x; one interval is computed per
+            group, e.g. per district x week stratum.
+        method: "t" (default) for the t-interval, or a bootstrap interval:
+            "percentile" or "bca" (bias-corrected and accelerated), which
+            suit skewed data such as egg counts. With a bootstrap method, se
+            is the bootstrap standard error.
+        n_boot: Number of bootstrap resamples.
+        seed: Seed (int or np.random.SeedSequence) of the resampling; the
+            same seed gives the same interval for any n_jobs.
+        n_jobs: Number of worker processes for the resampling; -1 uses all
+            cores.
 
     Returns:
-        dict: Dictionary containing mean, sd, se, and CI bounds.
-    """
-    x = np.array(x)
-    x = x[~np.isnan(x)]
+        dict: Dictionary containing mean, sd, se, and CI bounds. For a
+        DataFrame, a DataFrame with the columns [*by, n, mean, sd, se,
+        ci_lower, ci_upper] and one row per group.
 
-    mean = np.mean(x)
-    n = len(x)
+    Example:
+        >>> ci_mean(df, value="age", by=["district", "week"])
+    """
+    if method not in ("t", "percentile", "bca"):
+        raise ValueError("method must be 't', 'percentile' or 'bca'.")
+    if isinstance(x, pd.DataFrame):
+        if method != "t":
+            raise ValueError("Bootstrap intervals are computed for one array at a time.")
+        return _ci_mean_frame(x, value, by, ci, weights)
+    if isinstance(x, MeanStats):
+        if method != "t":
+            raise ValueError("Bootstrap intervals need the values, not MeanStats.")
+        n, mean, m2 = x.n, x.mean if x.n > 0 else np.nan, x.m2
+    else:
+        x, weights = _clean(x, weights)
+        n = weights.sum()
+        mean = np.sum(weights * x) / n if n > 0 else np.nan
+        m2 = np.sum(weights * (x - mean) ** 2)
 
     # If n < 2, we can't compute sd/se/CI (degrees of freedom would be <= 0)
     if n < 2:
@@ -29,8 +64,11 @@ def ci_mean(x, ci=0.95):
         se = np.nan
         lower = np.nan
         upper = np.nan
+    elif method != "t":
+        sd = np.sqrt(m2 / (n - 1))
+        se, lower, upper = _bootstrap_ci(x, weights, mean, ci, method, n_boot, seed, n_jobs)
     else:
-        sd = np.std(x, ddof=1)
+        sd = np.sqrt(m2 / (n - 1))
         se = sd / np.sqrt(n)
 
         alpha = 1 - ci
@@ -48,6 +86,215 @@ def ci_mean(x, ci=0.95):
     }
 
 
+def _clean(x, weights):
+    """Return x without missing values and the matching frequency weights."""
+    x = np.asarray(x)
+    if weights is None:
+        weights = np.ones(len(x))
+    else:
+        weights = np.array(weights, dtype=float)
+        if weights.shape != x.shape:
+            raise ValueError("weights must have the same length as x.")
+        if np.isnan(weights).any() or (weights < 0).any():
+            raise ValueError("weights must be non-negative numbers.")
+    keep = ~np.isnan(x)
+    if not keep.all():
+        x, weights = x[keep], weights[keep]
+    return x, weights
+
+
+class MeanStats:
+    """Sufficient statistics of a mean, for data split across workers.
+
+    Holds the count, the mean and the sum of squared deviations from the
+    mean (equivalent to n, sum and sum of squares, but without their loss of
+    precision). Instances are small, picklable and merge with ``+`` (Chan's
+    parallel update), so workers can return a MeanStats instead of their
+    values and ci_mean(total) gives the usual t-interval.
+
+    Example:
+        >>> parts = pool.map(lambda chunk: MeanStats.from_values(chunk["age"]), chunks)
+        >>> ci_mean(sum(parts, MeanStats()))
+    """
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self, n=0, mean=0.0, m2=0.0):
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def from_values(cls, x, weights=None):
+        """Statistics of the non-missing values of x (with frequency weights)."""
+        x, weights = _clean(x, weights)
+        n = weights.sum()
+        if n == 0:
+            return cls()
+        mean = np.sum(weights * x) / n
+        # Plain Python numbers keep the pickled form to a few dozen bytes.
+        return cls(int(n) if n == int(n) else float(n), float(mean),
+                   float(np.sum(weights * (x - mean) ** 2)))
+
+    @property
+    def sum(self):
+        return self.n * self.mean
+
+    @property
+    def sum_of_squares(self):
+        return self.m2 + self.n * self.mean ** 2
+
+    def __add__(self, other):
+        if isinstance(other, int) and other == 0:
+            return self
+        if not isinstance(other, MeanStats):
+            return NotImplemented
+        n = self.n + other.n
+        if n == 0:
+            return MeanStats()
+        delta = other.mean - self.mean
+        return MeanStats(n, self.mean + delta * other.n / n,
+                         self.m2 + other.m2 + delta ** 2 * self.n * other.n / n)
+
+    __radd__ = __add__
+
+    def __repr__(self):
+        return f"MeanStats(n={self.n!r}, mean={self.mean!r}, m2={self.m2!r})"
+
+
+def _ci_mean_frame(df, value, by, ci, weights):
+    """ci_mean() of one column for every group of a DataFrame, vectorized."""
+    keys = [] if by is None else [by] if isinstance(by, str) else list(by)
+    if value is None:
+        raise ValueError("value= is required when x is a DataFrame.")
+    for column in [value] + keys + ([weights] if isinstance(weights, str) else []):
+        if column not in df.columns:
+            raise ValueError(f"Column '{column}' not found in DataFrame.")
+
+    x = df[value].to_numpy(dtype=float, na_value=np.nan)
+    if weights is None:
+        w = np.ones(len(df))
+    else:
+        w = (df[weights] if isinstance(weights, str) else pd.Series(weights)).to_numpy(
+            dtype=float, na_value=np.nan)
+        if len(w) != len(df):
+            raise ValueError("weights must have the same length as x.")
+        if np.isnan(w).any() or (w < 0).any():
+            raise ValueError("weights must be non-negative numbers.")
+    if keys:
+        grouped = df.groupby(keys, observed=True)
+        # Rows with a missing key have no group (code -1, skipped).
+        codes = grouped.ngroup().fillna(-1).to_numpy(dtype=np.intp)
+        index = grouped.size().index
+    else:
+        codes = np.zeros(len(df), dtype=np.intp)
+        index = pd.RangeIndex(1)
+
+    keep = ~np.isnan(x) & (codes >= 0)
+    x, w, g = x[keep], w[keep], codes[keep]
+    n = np.bincount(g, w, minlength=len(index))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(g, w * x, minlength=len(index)) / n
+        sd = np.sqrt(np.bincount(g, w * (x - mean[g]) ** 2, minlength=len(index)) / (n - 1))
+        se = sd / np.sqrt(n)
+    sd[n < 2] = np.nan
+    se[n < 2] = np.nan
+
+    # One t-quantile per distinct degrees of freedom, not one per group
+    dof, inverse = np.unique(np.where(n < 2, np.nan, n - 1), return_inverse=True)
+    tval = stats.t.ppf(1 - (1 - ci) / 2, df=dof)[inverse.ravel()]
+
+    result = pd.DataFrame({"n": n if weights is not None else n.astype(np.int64),
+                           "mean": mean, "sd": sd, "se": se,
+                           "ci_lower": mean - tval * se, "ci_upper": mean + tval * se},
+                          index=index)
+    return result.reset_index() if keys else result.reset_index(drop=True)
+
+
+# Maximum number of resampled values held in memory per bootstrap block
+_BOOT_BLOCK_VALUES = 2 ** 22
+
+# Data shared with the bootstrap worker processes, set by _init_boot_worker
+_boot_data = None
+
+
+def _bootstrap_ci(x, weights, mean, ci, method, n_boot, seed, n_jobs):
+    """
+    Bootstrap (se, lower, upper) of the mean of x with frequency weights.
+
+    Resamples are drawn as index arrays of at most _BOOT_BLOCK_VALUES
+    values: blocks of several resamples for small data, and a single
+    resample drawn in slices once the data exceed that size, so memory
+    grows neither with n_boot nor with the number of observations. Every
+    block has its own stream spawned from one SeedSequence; blocks do not
+    depend on n_jobs, so the interval only depends on the seed.
+    """
+    if int(n_boot) < 2:
+        raise ValueError("n_boot must be at least 2.")
+    n_boot = int(n_boot)
+    total = int(round(weights.sum()))
+    per_block = max(1, min(n_boot, _BOOT_BLOCK_VALUES // total))
+    width = max(1, _BOOT_BLOCK_VALUES // per_block)
+    sizes = [per_block] * (n_boot // per_block)
+    if n_boot % per_block:
+        sizes.append(n_boot % per_block)
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    tasks = list(zip(sizes, root.spawn(len(sizes))))
+    # Rows are drawn with probability proportional to their frequency, which
+    # resamples the expanded data without building it.
+    prob = None if np.all(weights == 1) else weights / weights.sum()
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks)),
+                                 initializer=_init_boot_worker,
+                                 initargs=(x, prob, total, width)) as pool:
+            boot = np.concatenate(list(pool.map(_boot_block, tasks)))
+    else:
+        _init_boot_worker(x, prob, total, width)
+        boot = np.concatenate([_boot_block(task) for task in tasks])
+
+    alpha = 1 - ci
+    levels = np.array([alpha / 2, 1 - alpha / 2])
+    if method == "bca":
+        # Bias correction from the share of resamples below the estimate and
+        # acceleration from the jackknife (leave-one-unit-out) means.
+        z0 = stats.norm.ppf((np.sum(boot < mean) + 0.5 * np.sum(boot == mean)) / n_boot)
+        jack = (np.sum(weights * x) - x) / (weights.sum() - 1)
+        spread = np.sum(weights * jack) / weights.sum() - jack
+        denominator = 6 * np.sum(weights * spread ** 2) ** 1.5
+        accel = np.sum(weights * spread ** 3) / denominator if denominator > 0 else 0.0
+        z = stats.norm.ppf(levels)
+        levels = stats.norm.cdf(z0 + (z0 + z) / (1 - accel * (z0 + z)))
+    lower, upper = np.quantile(boot, levels)
+    return np.std(boot, ddof=1), lower, upper
+
+
+def _init_boot_worker(x, prob, total, width):
+    global _boot_data  # pylint: disable=global-statement
+    _boot_data = (x, prob, total, width)
+
+
+def _boot_block(task):
+    """Means of `size` resamples drawn from the stream of `seed_seq`."""
+    size, seed_seq = task
+    x, prob, total, width = _boot_data
+    rng = np.random.default_rng(seed_seq)
+    # Each resample is drawn `width` values at a time and summed.
+    sums = np.zeros(size)
+    for start in range(0, total, width):
+        shape = (size, min(width, total - start))
+        if prob is None:
+            index = rng.integers(0, len(x), size=shape)
+        else:
+            index = rng.choice(len(x), size=shape, p=prob)
+        sums += x[index].sum(axis=1)
+    return sums / total
+
+
 # ## A pretty printer
 
 def print_ci_mean(result):
@@ -5,39 +5,74 @@ This module replicates the ci.prop() function from R into Python.
 """
 
 import numpy as np
-from scipy.stats import norm
+import pandas as pd
+from scipy.stats import beta, norm
 
-def ci_prop(x, n=None, ci=0.95):
+def ci_prop(x, n=None, ci=0.95, value=None, by=None, method="wald"):
     """Calculate confidence interval for a proportion.
 
     Args:
-        x: Either a list/array of 0/1 data, or the number of successes.
-        n: Total number of observations (required if x is number of successes).
+        x: Either a list/array of 0/1 data, the number of successes (a
+            number or an array, one per stratum), a PropStats of (merged)
+            partial data, or a DataFrame holding the 0/1 `value` column.
+        n: Total number of observations (required if x is number of
+            successes); a number or an array broadcastable against x.
         ci: Confidence level (default: 0.95).
+        value: Column of 0/1 data when x is a DataFrame.
+        by: Column name(s) of the DataFrame x; one interval per stratum.
+        method: "wald" (default, as R's ci.prop), "wilson" (score),
+            "agresti-coull" or "clopper-pearson" (exact, from beta
+            quantiles). The last three keep sensible bounds near 0 and 1 and
+            for rare outcomes. se is always the Wald standard error.
 
     Returns:
-        dict: Dictionary containing proportion, standard error, CI bounds, n, and x.
+        dict: Dictionary containing proportion, standard error, CI bounds, n,
+        and x; the values are arrays when x or n are arrays. For a DataFrame,
+        a DataFrame with the columns [*by, x, n, proportion, se, ci_lower,
+        ci_upper] and one row per stratum.
+
+    Example:
+        >>> ci_prop([12, 30, 7], [40, 95, 20])
+        >>> ci_prop(survey, value="infected", by="village")
     """
+    if method not in _METHODS:
+        raise ValueError(f"method must be one of {', '.join(map(repr, _METHODS))}.")
+    if isinstance(x, pd.DataFrame):
+        counts = count_successes(x, value, by)
+        result = ci_prop(counts["x"].to_numpy(), counts["n"].to_numpy(), ci=ci,
+                         method=method)
+        for key in ("proportion", "se", "ci_lower", "ci_upper"):
+            counts[key] = result[key]
+        return counts
+    if isinstance(x, PropStats):
+        x, n = x.x, x.n
+
     # Case 1: x is a list/array of 0/1 data
     if n is None:
-        x = np.array(x)
-        x = x[~np.isnan(x)]          # remove NA
-        n = len(x)
-        x = np.sum(x)                # count successes
+        x, n = _count(x)
+
+    # Case 2: x is number of successes, n is provided; arrays of them
+    # (one per stratum) are computed element-wise.
+    elif np.ndim(x) or np.ndim(n):
+        x, n = np.broadcast_arrays(np.asarray(x), np.asarray(n))
 
-    # Case 2: x is number of successes, n is provided
-    p = x / n
-    se = np.sqrt(p * (1 - p) / n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = np.true_divide(x, n)
+        se = np.sqrt(p * (1 - p) / n)
 
     alpha = 1 - ci
     z = norm.ppf(1 - alpha / 2)
 
-    lower = p - z * se
-    upper = p + z * se
+    if method == "wald":
+        lower, upper = p - z * se, p + z * se
+    elif method == "clopper-pearson":
+        lower, upper = _clopper_pearson(x, n, alpha)
+    else:
+        lower, upper = _score_interval(x, n, z, method)
 
     # Keep between 0 and 1
-    lower = max(lower, 0)
-    upper = min(upper, 1)
+    lower = np.clip(lower, 0, 1)
+    upper = np.clip(upper, 0, 1)
 
     return {
         "proportion": p,
@@ -49,6 +84,199 @@ def ci_prop(x, n=None, ci=0.95):
     }
 
 
+_METHODS = ("wald", "wilson", "agresti-coull", "clopper-pearson")
+
+
+def _count(x):
+    """
+    Return (successes, non-missing count) of 0/1 data without copying it.
+
+    - numpy bool / integer data is counted in place
+    - float data skips NaN through a mask instead of a filtered copy
+    - pandas nullable data (boolean, Int8, ...) is reduced over its mask
+    - a two-level categorical counts its codes; the success level is 1 (or
+      True) when the levels are 0/1, otherwise the second level
+    - object data (e.g. True/False/None) is read as nullable floats
+    """
+    if isinstance(x, (pd.Series, pd.Index)):
+        x = x.array
+    if isinstance(x, pd.Categorical):
+        levels = x.categories.tolist()
+        if len(levels) != 2:
+            raise ValueError("Categorical data must have exactly two levels.")
+        success = levels.index(1) if set(levels) <= {0, 1} else 1
+        codes = x.codes
+        return np.count_nonzero(codes == success), int(len(codes) - np.count_nonzero(codes == -1))
+    if isinstance(x, pd.api.extensions.ExtensionArray) and not isinstance(
+            x, pd.arrays.NumpyExtensionArray):
+        if not (pd.api.types.is_bool_dtype(x.dtype) or pd.api.types.is_numeric_dtype(x.dtype)):
+            # e.g. strings, whose arrays have no sum()
+            raise TypeError("x must hold 0/1, boolean or two-level categorical data.")
+        # Masked reductions skip missing values without materialising the data.
+        return x.sum(), len(x) - int(x.isna().sum())
+
+    values = np.asarray(x)
+    kind = values.dtype.kind
+    if kind == "b":
+        return np.count_nonzero(values), len(values)
+    if kind in "iu":
+        return values.sum(), len(values)
+    if kind == "f":
+        missing = np.isnan(values)
+        return np.sum(values, where=~missing), int(len(values) - np.count_nonzero(missing))
+    if kind == "O":
+        try:
+            return _count(pd.array(values, dtype="Float64"))
+        except (TypeError, ValueError) as err:
+            raise TypeError("x must hold 0/1, boolean or two-level categorical data.") from err
+    raise TypeError("x must hold 0/1, boolean or two-level categorical data.")
+
+
+def _score_interval(x, n, z, method):
+    """Wilson score or Agresti-Coull bounds, element-wise."""
+    x, n = np.asarray(x, dtype=float), np.asarray(n, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n_tilde = n + z ** 2
+        centre = (x + z ** 2 / 2) / n_tilde
+        if method == "wilson":
+            half = z / n_tilde * np.sqrt(x * (n - x) / n + z ** 2 / 4)
+        else:
+            half = z * np.sqrt(centre * (1 - centre) / n_tilde)
+    return (centre - half)[()], (centre + half)[()]
+
+
+# Clopper-Pearson bounds of (alpha, x, n) for small n, shared across calls:
+# surveillance tables repeat the same small counts many times.
+_BETA_MEMO = {}
+_BETA_MEMO_MAX_N = 1_000
+_BETA_MEMO_SIZE = 2 ** 16
+
+
+def _clopper_pearson(x, n, alpha):
+    """
+    Exact bounds from beta quantiles, element-wise.
+
+    Quantiles are evaluated once per distinct (x, n) pair, in one scipy
+    call, and memoised for pairs with n <= _BETA_MEMO_MAX_N.
+    """
+    x, n = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(n, dtype=float))
+    shape = x.shape
+    x, n = x.ravel(), n.ravel()
+    whole = (x == np.round(x)) & (n == np.round(n)) & (x >= 0)
+    if whole.all() and x.size and x.max() * n.max() < 2 ** 52:
+        # Integer counts: one int64 key per pair is much faster to unique
+        # than rows of a 2D array.
+        _, first, inverse = np.unique(n * (x.max() + 1) + x, return_index=True,
+                                      return_inverse=True)
+        pairs = np.stack([x[first], n[first]], axis=1)
+    else:
+        pairs, inverse = np.unique(np.stack([x, n], axis=1), axis=0, return_inverse=True)
+    bounds = np.full((len(pairs), 2), np.nan)
+    todo = []
+    for i, (xi, ni) in enumerate(pairs.tolist()):
+        cached = _BETA_MEMO.get((alpha, xi, ni)) if ni <= _BETA_MEMO_MAX_N else None
+        if cached is None:
+            todo.append(i)
+        else:
+            bounds[i] = cached
+    if todo:
+        xs, ns = pairs[todo, 0], pairs[todo, 1]
+        with np.errstate(invalid="ignore"):
+            lower = np.where(xs == 0, 0.0, beta.ppf(alpha / 2, xs, ns - xs + 1))
+            upper = np.where(xs == ns, 1.0, beta.ppf(1 - alpha / 2, xs + 1, ns - xs))
+        invalid = (ns <= 0) | (xs < 0) | (xs > ns)
+        lower[invalid], upper[invalid] = np.nan, np.nan
+        bounds[todo, 0], bounds[todo, 1] = lower, upper
+        if len(_BETA_MEMO) > _BETA_MEMO_SIZE:
+            _BETA_MEMO.clear()
+        for i, xi, ni, lo, up in zip(todo, xs.tolist(), ns.tolist(), lower.tolist(),
+                                     upper.tolist()):
+            if ni <= _BETA_MEMO_MAX_N:
+                _BETA_MEMO[(alpha, xi, ni)] = (lo, up)
+    bounds = bounds[inverse.ravel()]
+    return bounds[:, 0].reshape(shape)[()], bounds[:, 1].reshape(shape)[()]
+
+
+def count_successes(df, value, by=None):
+    """Count successes and trials of 0/1 data per stratum, in one pass.
+
+    Missing values of `value` are not counted as trials.
+
+    Args:
+        df: DataFrame of raw 0/1 (or boolean) data.
+        value: Name of the 0/1 column.
+        by: Column name(s) defining the strata (default: one stratum).
+
+    Returns:
+        pd.DataFrame: [*by, x, n] with one row per stratum.
+
+    Example:
+        >>> count_successes(survey, "infected", by=["district", "village"])
+    """
+    keys = [] if by is None else [by] if isinstance(by, str) else list(by)
+    if value is None:
+        raise ValueError("value= is required when x is a DataFrame.")
+    for column in [value] + keys:
+        if column not in df.columns:
+            raise ValueError(f"Column '{column}' not found in DataFrame.")
+
+    values = df[value].to_numpy(dtype=float, na_value=np.nan)
+    if keys:
+        grouped = df.groupby(keys, observed=True)
+        # Rows with a missing key have no group (code -1, skipped).
+        codes = grouped.ngroup().fillna(-1).to_numpy(dtype=np.intp)
+        index = grouped.size().index
+    else:
+        codes = np.zeros(len(df), dtype=np.intp)
+        index = pd.RangeIndex(1)
+    keep = ~np.isnan(values) & (codes >= 0)
+    counts = pd.DataFrame(
+        {"x": np.bincount(codes[keep], values[keep], minlength=len(index)),
+         "n": np.bincount(codes[keep], minlength=len(index))},
+        index=index)
+    if (counts["x"] == counts["x"].round()).all():
+        counts["x"] = counts["x"].astype(np.int64)
+    return counts.reset_index() if keys else counts.reset_index(drop=True)
+
+
+class PropStats:
+    """Sufficient statistics of a proportion: successes and trials.
+
+    Instances are small, picklable and merge with ``+``, so workers that
+    each see part of the data can return a PropStats instead of their 0/1
+    values; ci_prop(total) gives the usual result.
+
+    Example:
+        >>> parts = pool.map(lambda chunk: PropStats.from_values(chunk["ill"]), chunks)
+        >>> ci_prop(sum(parts, PropStats()))
+    """
+
+    __slots__ = ("x", "n")
+
+    def __init__(self, x=0, n=0):
+        self.x = x
+        self.n = n
+
+    @classmethod
+    def from_values(cls, values):
+        """Successes and trials of the non-missing values of 0/1 data."""
+        successes, n = _count(values)
+        return cls(int(successes) if successes == int(successes) else float(successes),
+                   int(n))
+
+    def __add__(self, other):
+        if isinstance(other, int) and other == 0:
+            return self
+        if not isinstance(other, PropStats):
+            return NotImplemented
+        return PropStats(self.x + other.x, self.n + other.n)
+
+    __radd__ = __add__
+
+    def __repr__(self):
+        return f"PropStats(x={self.x!r}, n={self.n!r})"
+
+
 # ## Pretty Printer
 
 def print_ci_prop(res, ci=0.95):
@@ -3,20 +3,69 @@ crosstab_function module.
 Provides a general-purpose cross-tabulation function with counts, percentages, and chi-square test.
 """
 
+import numpy as np
 import pandas as pd
 from scipy.stats import chi2_contingency
 
 
 # Read rdata file
 
-def my_crosstab(x_var, y_var, chisq=True):
+def my_crosstab(x_var, y_var, chisq=True, weights=None):
     """
     General-purpose cross-tabulation function.
     Displays counts, row percentages, column percentages,
     and optionally runs a chi-square test.
+
+    With `weights` (one frequency per row, for aggregated data) the counts
+    are the summed weights, as if each row were repeated that many times.
+    """
+    if weights is None:
+        tab = pd.crosstab(x_var, y_var, dropna=False)
+    else:
+        tab = weighted_crosstab(x_var, y_var, weights)
+    _display(tab, chisq)
+
+
+def weighted_crosstab(x_var, y_var, weights):
+    """
+    Cross-tabulate summed frequency weights instead of counting rows.
+
+    Cells without rows are 0; the table is integer when all weights are.
     """
-    tab = pd.crosstab(x_var, y_var, dropna=False)
+    weights = pd.Series(weights).to_numpy(dtype=float, na_value=np.nan)
+    if len(weights) != len(x_var) or len(weights) != len(y_var):
+        raise ValueError("weights must have the same length as the data.")
+    if np.isnan(weights).any() or (weights < 0).any():
+        raise ValueError("weights must be non-negative numbers.")
+    tab = pd.crosstab(x_var, y_var, values=weights, aggfunc="sum", dropna=False).fillna(0)
+    if (tab == tab.round()).all().all():
+        tab = tab.astype("int64")
+    return tab
+
+
+def my_crosstab_chunks(x_col, y_col, chunks, chisq=True):
+    """
+    my_crosstab for data that arrives in chunks, e.g. from data.stream().
+    The counts of each chunk are added up, so peak memory is bounded by the
+    chunk size; the display is the same as my_crosstab() on all the data.
+
+    Args:
+        x_col, y_col: Names of the row and column variables.
+        chunks: Iterable of DataFrames holding both columns.
+        chisq: Whether to run the chi-square test.
+    """
+    tab = None
+    for chunk in chunks:
+        chunk_tab = pd.crosstab(chunk[x_col], chunk[y_col], dropna=False)
+        tab = chunk_tab if tab is None else tab.add(chunk_tab, fill_value=0)
+    if tab is None:
+        tab = pd.crosstab(pd.Series([], name=x_col), pd.Series([], name=y_col))
+    tab = tab.fillna(0).astype("int64").sort_index().sort_index(axis=1)
+    _display(tab, chisq)
+
 
+def _display(tab, chisq):
+    """Print counts, row/column percentages and the chi-square test of `tab`."""
     print("\nCounts:")
     print(tab)
 
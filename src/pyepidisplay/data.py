@@ -53,48 +53,715 @@ Example:
 
 import os
 import builtins
+import threading
+import importlib.util
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from pyepidisplay.datasets import DATA_PATH
 
+from pyepidisplay.datasets.manifest import DATASETS
+
+# Files in the datasets directory that record benchmark results rather than
+# example data; they are left out of the manifest.
+_NON_DATASETS = ("rdata_summary", "read_speed_")
+
+# Format of the date columns stored in the dataset CSVs
+_DATE_FORMAT = "%Y-%m-%d"
+
+# Case-insensitive name lookup, resolved from the manifest without touching
+# the datasets directory.
+_LOOKUP = {_name.lower(): _name for _name in DATASETS}
+
 # -------------------------------------------------------------------------
 # Register dataset name constants globally so tests like data(Outbreak) work
 # -------------------------------------------------------------------------
-_files = [f for f in os.listdir(DATA_PATH) if f.lower().endswith(".csv")]
-
-for _filename in _files:
-    _base = os.path.splitext(_filename)[0]  # "Outbreak"
+for _base in DATASETS:
     for _variant in [_base, _base.lower(), _base.upper(), _base.capitalize()]:
         setattr(builtins, _variant, _base)
 # -------------------------------------------------------------------------
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _DatasetCache:
+    """
+    Least-recently-used cache of parsed datasets.
+
+    Entries are keyed by (dataset name, file mtime) so that an edited file is
+    parsed again instead of being served stale.
+    """
+
+    def __init__(self, maxsize=16):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is None:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return frame
+
+    def put(self, key, frame):
+        with self._lock:
+            # Drop entries of the same dataset with an older mtime
+            for old_key in [k for k in self._frames if k[0] == key[0]]:
+                del self._frames[old_key]
+            if self.maxsize <= 0:
+                return
+            self._frames[key] = frame
+            while len(self._frames) > self.maxsize:
+                self._frames.popitem(last=False)
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._frames) > max(maxsize, 0):
+                self._frames.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._frames))
+
+
+_cache = _DatasetCache()
+
+
+def _copy_on_write():
+    """Return True when pandas defers copies until a frame is modified."""
+    if int(pd.__version__.split(".", maxsplit=1)[0]) >= 3:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def _independent(df):
+    """Return a frame that can be modified without touching `df`."""
+    return df.copy(deep=not _copy_on_write())
+
+
+def cache_info():
+    """
+    Report statistics of the dataset cache used by data().
+
+    Returns:
+        CacheInfo: Named tuple (hits, misses, maxsize, currsize).
+    """
+    return _cache.info()
+
+
+def cache_clear():
+    """Empty the dataset cache and reset its hit/miss counters."""
+    _cache.clear()
+
+
+def cache_resize(maxsize):
+    """
+    Set the maximum number of datasets kept in the cache.
+
+    Least recently used datasets are evicted first; 0 disables caching.
+
+    Args:
+        maxsize (int): Maximum number of cached datasets.
+    """
+    _cache.resize(maxsize)
+
 
-def data(name: str = None):
+def data(name: str = None, format: str = "auto",  # pylint: disable=redefined-builtin
+         typed=True, columns=None, filter=None):
     """
     Load an example dataset by name.
 
     Args:
         name (str): Name of the dataset.
+        format (str): "auto" (default) reads the bundled Parquet copy when
+            pyarrow is installed and falls back to the CSV; "csv" or
+            "parquet" force one of them.
+        typed (bool or str): Apply the dataset schema recorded in the
+            manifest (default). Low-cardinality strings load as `category`
+            and ISO dates as datetime64; integers stay int64. "compact" also
+            downcasts integers to the smallest of int8/int16/int32 that holds
+            twice the magnitude of the loaded values, which saves memory but
+            lets arithmetic such as squares overflow. False returns the
+            columns exactly as pd.read_csv guesses them.
+        columns (list): Only load these columns, in this order.
+        filter (list): Only load rows matching every (column, op, value)
+            condition; op is one of ==, !=, <, <=, >, >=, in, not in. Rows
+            where the column is missing never match. The conditions are
+            pushed into the Parquet reader, or applied chunk by chunk while
+            the CSV is read, so the full dataset is never materialised.
     Example:
         >>> df = data("Outbreak")
         >>> df.head()
 
+        >>> data("Attitudes", columns=["sex", "qa1"], filter=[("qa1", ">=", 4)])
+
     Returns:
         pd.DataFrame: The requested dataset.
+
+    Parsed datasets are kept in a least-recently-used cache (see
+    cache_info(), cache_clear() and cache_resize()). Every call returns an
+    independent frame, so modifying it never alters the cached copy.
     """
-    files = [f for f in os.listdir(DATA_PATH) if f.lower().endswith(".csv")]
-    name_original = name
     # no name → return list
     if name is None:
-        return [os.path.splitext(f)[0] for f in files]
+        return list(DATASETS)
+
+    if typed not in (True, False, "compact"):
+        raise ValueError("typed must be True, False or 'compact'.")
+    canonical = _resolve(name)
+    if not typed:
+        if format == "parquet":
+            raise ValueError("The Parquet copies are typed; use format='csv' with typed=False.")
+        format = "csv"
+    dtypes = DATASETS[canonical]["dtypes"] if typed else None
+    projected = columns is not None or filter is not None
+    if projected:
+        known = dict(dtypes or [(col, None) for col, _ in DATASETS[canonical]["dtypes"]])
+        filter = _check_projection(known, f"dataset '{canonical}'", columns, filter)
+
+    filepath, mtime = _locate(canonical, format)
+    key = (canonical, filepath, mtime, typed)
+    df = _cache.get(key)
+    if df is None:
+        if projected:
+            # Narrow reads are not cached; only full datasets are.
+            df = _read(filepath, dtypes, columns, filter)
+            return _compact(df) if typed == "compact" else df
+        df = _read(filepath, dtypes)
+        if typed == "compact":
+            df = _compact(df)
+        _cache.put(key, df)
+    if projected:
+        df = df[_apply_filter(df, filter)] if filter else df
+        df = df[list(columns)] if columns is not None else df
+        df = df.reset_index(drop=True)
+    return _independent(df)
+
+
+# Rows read at a time when a filter is applied to a CSV
+_CSV_CHUNKSIZE = 100_000
+
+_OPERATORS = {
+    "==": lambda s, v: s == v,
+    "!=": lambda s, v: s != v,
+    "<": lambda s, v: s < v,
+    "<=": lambda s, v: s <= v,
+    ">": lambda s, v: s > v,
+    ">=": lambda s, v: s >= v,
+    "in": lambda s, v: s.isin(v),
+    "not in": lambda s, v: ~s.isin(v),
+}
+
+
+def _check_projection(known, source, columns, filters):
+    """
+    Validate the columns and filter arguments against the columns of `source`.
+
+    `known` maps column names to their load dtype (None when untyped).
+    Returns the filter with values on date columns converted to timestamps.
+    """
+    for condition in filters or []:
+        if len(condition) != 3 or condition[1] not in _OPERATORS:
+            raise ValueError(
+                f"Invalid filter {condition!r}: expected (column, op, value) "
+                f"with op in {', '.join(_OPERATORS)}."
+            )
+    wanted = list(columns or []) + [condition[0] for condition in filters or []]
+    for col in wanted:
+        if col not in known:
+            raise ValueError(f"Column '{col}' not found in {source}.")
+
+    normalized = []
+    for col, op, value in filters or []:
+        if str(known[col]).startswith("datetime64"):
+            if op in ("in", "not in"):
+                value = [pd.Timestamp(v) for v in value]
+            else:
+                value = pd.Timestamp(value)
+        normalized.append((col, op, value))
+    return normalized or None
+
+
+def _apply_filter(df, filters):
+    """Boolean mask of the rows of `df` matching every filter condition."""
+    mask = np.ones(len(df), dtype=bool)
+    for col, op, value in filters:
+        mask &= np.asarray(_OPERATORS[op](df[col], value) & df[col].notna(), dtype=bool)
+    return mask
+
+
+def _read(filepath, dtypes, columns=None, filters=None):
+    """Read a dataset file, projecting `columns` and keeping rows matching `filters`."""
+    needed = None
+    if columns is not None:
+        needed = list(dict.fromkeys([*columns, *(condition[0] for condition in filters or [])]))
+    if filepath.endswith(".parquet"):
+        df = pd.read_parquet(filepath, columns=needed,
+                             filters=[tuple(f) for f in filters] if filters else None)
+        if filters:
+            # pyarrow's "not in" and "!=" keep missing values; re-apply the
+            # conditions so missing values never match, as for CSV files.
+            df = df[_apply_filter(df, filters)]
+        df = df.reset_index(drop=True)
+        return df[list(columns)] if columns is not None else df
+
+    usecols = None
+    if needed is not None:
+        usecols = lambda col: col in needed  # noqa: E731
+    if not filters:
+        df = next(_iter_csv(filepath, dtypes, usecols))
+    else:
+        chunks = (chunk[_apply_filter(chunk, filters)]
+                  for chunk in _iter_csv(filepath, dtypes, usecols, _CSV_CHUNKSIZE))
+        df = pd.concat(chunks, ignore_index=True)
+    return df[list(columns)] if columns is not None else df
+
+
+def _iter_csv(filepath, dtypes=None, usecols=None, chunksize=None):
+    """
+    Yield a CSV as typed frames: one frame, or one per `chunksize` rows.
+
+    `dtypes` is the (column, dtype) schema; None keeps pandas' own guesses.
+    """
+    kwargs = {"usecols": usecols}
+    dates = []
+    if dtypes is not None:
+        dates = [col for col, dtype in dtypes if str(dtype).startswith("datetime64")]
+        kwargs.update(
+            dtype={col: dtype for col, dtype in dtypes
+                   if col not in dates and dtype is not None},
+            parse_dates=[col for col in dates if usecols is None or usecols(col)],
+            date_format=_DATE_FORMAT,
+        )
+    date_types = {col: dtype for col, dtype in dtypes or [] if col in dates}
+
+    def typed(frame):
+        return frame.astype({col: t for col, t in date_types.items() if col in frame})
+
+    if chunksize is None:
+        yield typed(pd.read_csv(filepath, **kwargs))
+        return
+    with pd.read_csv(filepath, chunksize=chunksize, **kwargs) as reader:
+        for chunk in reader:
+            yield typed(chunk)
+
+
+def stream(source, chunksize=100_000, columns=None, filter=None, dtype=None):  # pylint: disable=redefined-builtin
+    """
+    Read a bundled dataset or a large CSV/Parquet file in typed chunks.
+
+    Only one chunk is held in memory at a time, so files larger than memory
+    can be fed to the chunk-aware functions (summ_chunks, tab1_chunks,
+    my_crosstab_chunks).
+
+    Args:
+        source (str): Name of a bundled dataset, or path to a CSV or Parquet file.
+        chunksize (int): Maximum number of rows per chunk.
+        columns (list): Only read these columns, in this order.
+        filter (list): (column, op, value) conditions, as in data().
+        dtype (dict): Column dtypes of a CSV file. For columns not listed,
+            dates, booleans and low-cardinality strings are detected by
+            infer_schema() on the first `chunksize` rows; numbers are typed
+            by the parser. A later chunk whose values do not fit a detected
+            date or boolean type keeps that column as the parser reads it.
+
+    Returns:
+        Iterator of pd.DataFrame chunks.
+
+    Example:
+        >>> for chunk in stream("extract.csv", chunksize=1_000_000, columns=["age"]):
+        ...     ...
+    """
+    if chunksize is None or int(chunksize) < 1:
+        raise ValueError("chunksize must be a positive integer.")
+    chunksize = int(chunksize)
+
+    soft = {}
+    if os.path.exists(str(source)):
+        filepath = str(source)
+        label = f"file '{filepath}'"
+        if filepath.endswith(".parquet"):
+            import pyarrow.parquet as pq
+            schema = [(field.name, None) for field in pq.read_schema(filepath)]
+        else:
+            # Only the typing a sample can safely decide is kept; numbers are
+            # left to the parser since a later chunk may hold missing values.
+            sample = pd.read_csv(filepath, nrows=chunksize)
+            schema = [
+                (col, inferred if inferred in ("category", "boolean")
+                 or inferred.startswith("datetime64") else None)
+                for col, inferred in infer_schema(sample, downcast=False)
+            ]
+            schema = [(col, (dtype or {}).get(col, inferred)) for col, inferred in schema]
+            # Categories fit any chunk; detected dates and booleans may not,
+            # so they are cast chunk by chunk after an untyped read.
+            soft = {col: inferred for col, inferred in schema
+                    if col not in (dtype or {}) and inferred not in (None, "category")}
+    else:
+        canonical = _resolve(source)
+        filepath, _ = _locate(canonical, "auto")
+        label = f"dataset '{canonical}'"
+        schema = DATASETS[canonical]["dtypes"]
 
-    name = str(name).lower()
-    lookup = {os.path.splitext(f)[0].lower(): f for f in files}
+    filter = _check_projection(dict(schema), label, columns, filter)
+    return _iter_chunks(filepath, schema, chunksize, columns, filter, soft)
 
-    if name not in lookup:
+
+def _iter_chunks(filepath, schema, chunksize, columns, filters, soft=None):
+    """Generator behind stream(): read, filter and project one chunk at a time."""
+    needed = None
+    if columns is not None:
+        needed = set(columns) | {condition[0] for condition in filters or []}
+
+    if filepath.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        batch_columns = None if needed is None else [c for c, _ in schema if c in needed]
+        chunks = (batch.to_pandas() for batch in
+                  pq.ParquetFile(filepath).iter_batches(batch_size=chunksize,
+                                                        columns=batch_columns))
+    else:
+        usecols = None if needed is None else (lambda col: col in needed)
+        hard = [(col, None if col in (soft or {}) else dtype) for col, dtype in schema]
+        chunks = (_soft_cast(chunk, soft)
+                  for chunk in _iter_csv(filepath, hard, usecols, chunksize))
+
+    for chunk in chunks:
+        if filters:
+            chunk = chunk[_apply_filter(chunk, filters)]
+        if columns is not None:
+            chunk = chunk[list(columns)]
+        yield chunk
+
+
+def _soft_cast(chunk, soft):
+    """Cast the columns of `soft` that are in `chunk`, keeping those that do not fit."""
+    for col, dtype in (soft or {}).items():
+        if col not in chunk:
+            continue
+        try:
+            if str(dtype).startswith("datetime64"):
+                chunk[col] = pd.to_datetime(chunk[col], format=_DATE_FORMAT).astype(dtype)
+            else:
+                chunk[col] = chunk[col].astype(dtype)
+        except (ValueError, TypeError):
+            pass
+    return chunk
+
+
+def synthesize(name, n, seed=None, chunksize=None, path=None):
+    """
+    Generate a large synthetic dataset that resembles a bundled one.
+
+    Each column is resampled, with replacement, from its observed
+    non-missing values, so dtypes and marginal distributions are kept.
+    Missingness is resampled as whole rows of the observed missing/present
+    pattern, so the share of missing values and which columns tend to be
+    missing together are kept as well. Associations between columns are not
+    preserved.
+
+    Args:
+        name (str or pd.DataFrame): Name of a bundled dataset, or a frame to
+            resemble.
+        n (int): Number of rows to generate.
+        seed (int): Seed of the random generator; the same seed and chunksize
+            give the same rows.
+        chunksize (int): Generate the rows in chunks of this size. Without
+            `path`, an iterator of chunks is returned.
+        path (str): Write the rows chunk by chunk to this .csv or .parquet
+            file instead of returning them (chunksize defaults to 100,000).
+
+    Returns:
+        pd.DataFrame, an iterator of pd.DataFrame chunks, or `path`.
+
+    Example:
+        >>> synthesize("Outbreak", n=10_000_000, seed=1, path="outbreak_10m.parquet")
+        'outbreak_10m.parquet'
+    """
+    if n is None or int(n) < 0:
+        raise ValueError("n must be a non-negative integer.")
+    if chunksize is not None and int(chunksize) < 1:
+        raise ValueError("chunksize must be a positive integer.")
+    if path is not None and not str(path).endswith((".csv", ".parquet")):
+        raise ValueError("path must end with '.csv' or '.parquet'.")
+    source = name if isinstance(name, pd.DataFrame) else data(name)
+    if len(source) == 0 and n:
+        raise ValueError("Cannot synthesize rows from an empty dataset.")
+
+    n = int(n)
+    if chunksize is None and path is not None:
+        chunksize = _CSV_CHUNKSIZE
+    rng = np.random.default_rng(seed)
+    chunks = _synthesize_chunks(source.reset_index(drop=True), n,
+                                int(chunksize or max(n, 1)), rng)
+    if path is not None:
+        _write_chunks(chunks, str(path), source.iloc[:0])
+        return path
+    if chunksize is not None:
+        return chunks
+    return next(chunks, source.iloc[:0].reset_index(drop=True))
+
+
+def _synthesize_chunks(source, n, chunksize, rng):
+    """Generator behind synthesize()."""
+    missing = source.isna().to_numpy()
+    present = [np.flatnonzero(~missing[:, j]) for j in range(source.shape[1])]
+    for start in range(0, n, chunksize):
+        size = min(chunksize, n - start)
+        pattern = missing[rng.integers(0, len(source), size)]
+        columns = {}
+        for j, col in enumerate(source.columns):
+            pool = present[j] if len(present[j]) else np.zeros(1, dtype=np.intp)
+            values = source[col].iloc[rng.choice(pool, size)].reset_index(drop=True)
+            columns[col] = values.mask(pattern[:, j]) if pattern[:, j].any() else values
+        chunk = pd.DataFrame(columns)
+        chunk.index = pd.RangeIndex(start, start + size)
+        yield chunk
+
+
+def _write_chunks(chunks, path, empty):
+    """Write DataFrame chunks to one CSV or Parquet file."""
+    if path.endswith(".parquet"):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+            if writer is None:
+                empty.to_parquet(path, index=False)
+        finally:
+            if writer is not None:
+                writer.close()
+        return
+
+    header = True
+    for chunk in chunks:
+        chunk.to_csv(path, mode="w" if header else "a", header=header,
+                     index=False, date_format=_DATE_FORMAT)
+        header = False
+    if header:
+        empty.to_csv(path, index=False)
+
+
+@lru_cache(maxsize=None)
+def _has_pyarrow():
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _binary_file(csv_file):
+    """Name of the Parquet copy that sits next to a dataset CSV."""
+    return os.path.splitext(csv_file)[0] + ".parquet"
+
+
+def _locate(canonical, format):  # pylint: disable=redefined-builtin
+    """Pick the file to read for a dataset and return (path, mtime_ns)."""
+    if format not in ("auto", "csv", "parquet"):
+        raise ValueError("format must be 'auto', 'csv' or 'parquet'.")
+    csv_path = os.path.join(DATA_PATH, DATASETS[canonical]["file"])
+    if format == "csv" or (format == "auto" and not _has_pyarrow()):
+        return csv_path, os.stat(csv_path).st_mtime_ns
+
+    parquet_path = os.path.join(DATA_PATH, _binary_file(DATASETS[canonical]["file"]))
+    try:
+        return parquet_path, os.stat(parquet_path).st_mtime_ns
+    except FileNotFoundError:
+        if format == "parquet":
+            raise
+        return csv_path, os.stat(csv_path).st_mtime_ns
+
+
+def _resolve(name):
+    """Map a case-insensitive dataset name to its manifest key."""
+    canonical = _LOOKUP.get(str(name).lower())
+    if canonical is None:
         raise ValueError(
-            f"Dataset '{name_original}' not found.\n"
-            f"Available datasets: {', '.join(os.path.splitext(f)[0] for f in files)}"
+            f"Dataset '{name}' not found.\n"
+            f"Available datasets: {', '.join(DATASETS)}"
         )
+    return canonical
+
+
+def info(name: str = None):
+    """
+    Describe bundled datasets from the manifest, without reading any CSV.
+
+    Args:
+        name (str): Name of a dataset (case-insensitive). If omitted, all
+            datasets are summarised.
+
+    Returns:
+        dict: Manifest entry (file, n_rows, n_cols, size_bytes, dtypes) of
+            `name`, or pd.DataFrame with one row per dataset if no name is given.
+
+    Example:
+        >>> info("Outbreak")["n_rows"]
+        1094
+    """
+    if name is not None:
+        entry = DATASETS[_resolve(name)]
+        return {**entry, "dtypes": dict(entry["dtypes"])}
+    return pd.DataFrame(
+        [
+            {"name": key, "n_rows": entry["n_rows"], "n_cols": entry["n_cols"],
+             "size_bytes": entry["size_bytes"]}
+            for key, entry in DATASETS.items()
+        ]
+    )
+
+
+def infer_schema(df, max_categories=50, downcast=False):
+    """
+    Choose a compact dtype for every column of a freshly parsed dataset.
+
+    - strings that are all ISO dates (YYYY-MM-DD) become datetime64[ns]
+    - True/False columns with missing values become the nullable `boolean`
+    - other strings with at most `max_categories` distinct values (and fewer
+      distinct values than half the rows) become `category`
+    - integers keep the parser's int64; with `downcast` they become the
+      smallest of int8/int16/int32 that holds twice their largest
+      magnitude, so differences such as max - min and reversed scales
+      cannot overflow
+    - floats are kept as float64 to preserve precision
+
+    Args:
+        df (pd.DataFrame): Dataset as returned by pd.read_csv.
+        max_categories (int): Largest number of levels stored as category.
+        downcast (bool): Downcast integers (data(typed="compact")). Leave
+            off when `df` is only a sample of the data, whose range may not
+            cover later rows.
+
+    Returns:
+        list: (column, dtype name) pairs.
+    """
+    schema = []
+    for col in df.columns:
+        series = df[col]
+        dtype = series.dtype.name
+        if pd.api.types.is_bool_dtype(series) or pd.api.types.is_float_dtype(series):
+            pass
+        elif pd.api.types.is_integer_dtype(series):
+            if downcast:
+                dtype = _smallest_int(series)
+        else:
+            values = series.dropna()
+            kind = pd.api.types.infer_dtype(values)
+            n_unique = values.nunique()
+            if kind == "boolean":
+                dtype = "boolean"
+            elif kind == "string" and len(values) and pd.to_datetime(
+                    values, format=_DATE_FORMAT, errors="coerce").notna().all():
+                dtype = "datetime64[ns]"
+            elif n_unique <= max_categories and n_unique < len(values) / 2:
+                dtype = "category"
+        schema.append((str(col), dtype))
+    return schema
+
+
+def _compact(df):
+    """Downcast the integer columns of a loaded dataset (typed="compact")."""
+    return df.astype({col: _smallest_int(df[col]) for col in df.columns
+                      if pd.api.types.is_integer_dtype(df[col].dtype)
+                      and isinstance(df[col].dtype, np.dtype) and len(df)})
+
+
+def _smallest_int(series):
+    magnitude = 2 * max(abs(int(series.min())), abs(int(series.max())), 1)
+    for dtype in ("int8", "int16", "int32"):
+        if magnitude <= np.iinfo(dtype).max:
+            return dtype
+    return "int64"
+
+
+def build_manifest(path=DATA_PATH):
+    """
+    Scan the CSV datasets in `path` and describe each of them.
+
+    Args:
+        path (str): Directory holding the dataset CSV files.
+
+    Returns:
+        dict: Mapping of dataset name to its manifest entry.
+    """
+    manifest = {}
+    for filename in sorted(os.listdir(path), key=str.lower):
+        base, ext = os.path.splitext(filename)
+        if ext.lower() != ".csv" or base.startswith(_NON_DATASETS):
+            continue
+        filepath = os.path.join(path, filename)
+        df = pd.read_csv(filepath)
+        manifest[base] = {
+            "file": filename,
+            "n_rows": int(df.shape[0]),
+            "n_cols": int(df.shape[1]),
+            "size_bytes": os.path.getsize(filepath),
+            "dtypes": infer_schema(df),
+        }
+    return manifest
+
+
+def write_manifest(path=DATA_PATH):
+    """
+    Regenerate datasets/manifest.py after datasets were added or changed.
+
+    Args:
+        path (str): Directory holding the dataset CSV files.
+    """
+    manifest = build_manifest(path)
+    lines = [
+        '"""',
+        "Manifest of the bundled datasets.",
+        "",
+        "Generated by pyepidisplay.data.write_manifest(); do not edit by hand.",
+        '"""',
+        "",
+        "DATASETS = {",
+    ]
+    for name, entry in manifest.items():
+        lines.append(f"    {name!r}: {{")
+        for field in ("file", "n_rows", "n_cols", "size_bytes"):
+            lines.append(f"        {field!r}: {entry[field]!r},")
+        lines.append("        'dtypes': [")
+        lines.extend(f"            {column!r}," for column in entry["dtypes"])
+        lines.append("        ],")
+        lines.append("    },")
+    lines.append("}")
+    with open(os.path.join(path, "manifest.py"), "w", encoding="utf-8") as handle:
+        handle.write("\n".join(lines) + "\n")
+
+
+def write_binary(path=DATA_PATH):
+    """
+    Write a typed Parquet copy next to every dataset CSV in `path`.
+
+    The copies keep the schema dtypes (categories, dates, nullable booleans)
+    and are what data() reads by default when pyarrow is installed.
+    Requires pyarrow.
+
+    Args:
+        path (str): Directory holding the dataset CSV files.
+    """
+    for entry in build_manifest(path).values():
+        df = _read(os.path.join(path, entry["file"]), entry["dtypes"])
+        df.to_parquet(os.path.join(path, _binary_file(entry["file"])), index=False)
+
 
-    filepath = os.path.join(DATA_PATH, lookup[name])
-    return pd.read_csv(filepath)
+if __name__ == "__main__":
+    write_manifest()
+    write_binary()
@@ -0,0 +1,324 @@
+"""
+Manifest of the bundled datasets.
+
+Generated by pyepidisplay.data.write_manifest(); do not edit by hand.
+"""
+
+DATASETS = {
+    'ANCdata': {
+        'file': 'ANCdata.csv',
+        'n_rows': 755,
+        'n_cols': 3,
+        'size_bytes': 6878,
+        'dtypes': [
+            ('death', 'category'),
+            ('anc', 'category'),
+            ('clinic', 'category'),
+        ],
+    },
+    'Attitudes': {
+        'file': 'Attitudes.csv',
+        'n_rows': 136,
+        'n_cols': 21,
+        'size_bytes': 7984,
+        'dtypes': [
+            ('id', 'int64'),
+            ('sex', 'category'),
+            ('dep', 'category'),
+            ('qa1', 'int64'),
+            ('qa2', 'int64'),
+            ('qa3', 'int64'),
+            ('qa4', 'int64'),
+            ('qa5', 'int64'),
+            ('qa6', 'float64'),
+            ('qa7', 'int64'),
+            ('qa8', 'int64'),
+            ('qa9', 'int64'),
+            ('qa10', 'int64'),
+            ('qa11', 'int64'),
+            ('qa12', 'float64'),
+            ('qa13', 'int64'),
+            ('qa14', 'int64'),
+            ('qa15', 'float64'),
+            ('qa16', 'float64'),
+            ('qa17', 'float64'),
+            ('qa18', 'int64'),
+        ],
+    },
+    'BP': {
+        'file': 'BP.csv',
+        'n_rows': 100,
+        'n_cols': 6,
+        'size_bytes': 3079,
+        'dtypes': [
+            ('id', 'int64'),
+            ('sex', 'category'),
+            ('sbp', 'int64'),
+            ('dbp', 'int64'),
+            ('saltadd', 'category'),
+            ('birthdate', 'datetime64[ns]'),
+        ],
+    },
+    'Compaq': {
+        'file': 'Compaq.csv',
+        'n_rows': 1064,
+        'n_cols': 7,
+        'size_bytes': 66186,
+        'dtypes': [
+            ('id', 'int64'),
+            ('hospital', 'category'),
+            ('status', 'int64'),
+            ('stage', 'category'),
+            ('agegr', 'category'),
+            ('ses', 'category'),
+            ('year', 'float64'),
+        ],
+    },
+    'Decay': {
+        'file': 'Decay.csv',
+        'n_rows': 436,
+        'n_cols': 2,
+        'size_bytes': 4140,
+        'dtypes': [
+            ('decay', 'float64'),
+            ('strep', 'float64'),
+        ],
+    },
+    'Ectopic': {
+        'file': 'Ectopic.csv',
+        'n_rows': 723,
+        'n_cols': 4,
+        'size_bytes': 14373,
+        'dtypes': [
+            ('id', 'int64'),
+            ('outc', 'category'),
+            ('hia', 'category'),
+            ('gravi', 'category'),
+        ],
+    },
+    'HW93': {
+        'file': 'HW93.csv',
+        'n_rows': 637,
+        'n_cols': 6,
+        'size_bytes': 20365,
+        'dtypes': [
+            ('id', 'int64'),
+            ('epg', 'float64'),
+            ('age', 'int64'),
+            ('shoe', 'category'),
+            ('intense', 'category'),
+            ('agegr', 'category'),
+        ],
+    },
+    'IudAdmit': {
+        'file': 'IudAdmit.csv',
+        'n_rows': 918,
+        'n_cols': 4,
+        'size_bytes': 22807,
+        'dtypes': [
+            ('id', 'float64'),
+            ('idate', 'datetime64[ns]'),
+            ('lmptime', 'float64'),
+            ('a122', 'int64'),
+        ],
+    },
+    'IudDiscontinue': {
+        'file': 'IudDiscontinue.csv',
+        'n_rows': 398,
+        'n_cols': 3,
+        'size_bytes': 10726,
+        'dtypes': [
+            ('id', 'float64'),
+            ('discdate', 'datetime64[ns]'),
+            ('d23', 'category'),
+        ],
+    },
+    'IudFollowup': {
+        'file': 'IudFollowup.csv',
+        'n_rows': 4235,
+        'n_cols': 6,
+        'size_bytes': 172541,
+        'dtypes': [
+            ('id', 'float64'),
+            ('vlmpdate', 'datetime64[ns]'),
+            ('vdate', 'datetime64[ns]'),
+            ('f22', 'category'),
+            ('f51', 'category'),
+            ('f61', 'category'),
+        ],
+    },
+    'Marryage': {
+        'file': 'Marryage.csv',
+        'n_rows': 27,
+        'n_cols': 7,
+        'size_bytes': 1067,
+        'dtypes': [
+            ('id', 'int64'),
+            ('sex', 'category'),
+            ('birthyr', 'int64'),
+            ('educ', 'category'),
+            ('marital', 'category'),
+            ('maryr', 'float64'),
+            ('endyr', 'int64'),
+        ],
+    },
+    'Oswego': {
+        'file': 'Oswego.csv',
+        'n_rows': 75,
+        'n_cols': 20,
+        'size_bytes': 7790,
+        'dtypes': [
+            ('age', 'float64'),
+            ('sex', 'category'),
+            ('timesupper', 'float64'),
+            ('ill', 'bool'),
+            ('onsetdate', 'category'),
+            ('onsettime', 'float64'),
+            ('bakedham', 'bool'),
+            ('spinach', 'bool'),
+            ('mashedpota', 'boolean'),
+            ('cabbagesal', 'bool'),
+            ('jello', 'bool'),
+            ('rolls', 'bool'),
+            ('brownbread', 'bool'),
+            ('milk', 'bool'),
+            ('coffee', 'bool'),
+            ('water', 'bool'),
+            ('cakes', 'bool'),
+            ('vanilla', 'bool'),
+            ('chocolate', 'boolean'),
+            ('fruitsalad', 'bool'),
+        ],
+    },
+    'Outbreak': {
+        'file': 'Outbreak.csv',
+        'n_rows': 1094,
+        'n_cols': 13,
+        'size_bytes': 55446,
+        'dtypes': [
+            ('id', 'int64'),
+            ('sex', 'int64'),
+            ('age', 'int64'),
+            ('exptime', 'float64'),
+            ('beefcurry', 'int64'),
+            ('saltegg', 'int64'),
+            ('eclair', 'float64'),
+            ('water', 'int64'),
+            ('onset', 'float64'),
+            ('nausea', 'int64'),
+            ('vomiting', 'int64'),
+            ('abdpain', 'int64'),
+            ('diarrhea', 'int64'),
+        ],
+    },
+    'Sleep3': {
+        'file': 'Sleep3.csv',
+        'n_rows': 15,
+        'n_cols': 8,
+        'size_bytes': 522,
+        'dtypes': [
+            ('id', 'int64'),
+            ('gender', 'category'),
+            ('dbirth', 'datetime64[ns]'),
+            ('sleepy', 'int64'),
+            ('lecture', 'float64'),
+            ('grwork', 'float64'),
+            ('kg', 'int64'),
+            ('cm', 'int64'),
+        ],
+    },
+    'Suwit': {
+        'file': 'Suwit.csv',
+        'n_rows': 15,
+        'n_cols': 3,
+        'size_bytes': 416,
+        'dtypes': [
+            ('id', 'float64'),
+            ('worm', 'float64'),
+            ('bloss', 'float64'),
+        ],
+    },
+    'Timing': {
+        'file': 'Timing.csv',
+        'n_rows': 18,
+        'n_cols': 11,
+        'size_bytes': 714,
+        'dtypes': [
+            ('id', 'int64'),
+            ('gender', 'category'),
+            ('age', 'int64'),
+            ('marital', 'category'),
+            ('child', 'int64'),
+            ('bedhr', 'int64'),
+            ('bedmin', 'int64'),
+            ('wokhr', 'int64'),
+            ('wokmin', 'int64'),
+            ('arrhr', 'int64'),
+            ('arrmin', 'int64'),
+        ],
+    },
+    'VC1to1': {
+        'file': 'VC1to1.csv',
+        'n_rows': 52,
+        'n_cols': 5,
+        'size_bytes': 1109,
+        'dtypes': [
+            ('matset', 'float64'),
+            ('case', 'float64'),
+            ('smoking', 'float64'),
+            ('rubber', 'float64'),
+            ('alcohol', 'float64'),
+        ],
+    },
+    'VC1to6': {
+        'file': 'VC1to6.csv',
+        'n_rows': 119,
+        'n_cols': 5,
+        'size_bytes': 1317,
+        'dtypes': [
+            ('matset', 'int64'),
+            ('case', 'int64'),
+            ('smoking', 'int64'),
+            ('rubber', 'int64'),
+            ('alcohol', 'int64'),
+        ],
+    },
+    'VCT': {
+        'file': 'VCT.csv',
+        'n_rows': 200,
+        'n_cols': 12,
+        'size_bytes': 16307,
+        'dtypes': [
+            ('QID', 'int64'),
+            ('A1', 'int64'),
+            ('A2', 'category'),
+            ('A3', 'category'),
+            ('A4', 'int64'),
+            ('A5', 'int64'),
+            ('A6', 'int64'),
+            ('A7', 'category'),
+            ('A8', 'category'),
+            ('A16', 'category'),
+            ('A17', 'category'),
+            ('A18', 'category'),
+        ],
+    },
+    'Xerop': {
+        'file': 'Xerop.csv',
+        'n_rows': 1200,
+        'n_cols': 10,
+        'size_bytes': 33596,
+        'dtypes': [
+            ('id', 'int64'),
+            ('respinfect', 'int64'),
+            ('age.month', 'int64'),
+            ('xerop', 'int64'),
+            ('sex', 'int64'),
+            ('ht.for.age', 'int64'),
+            ('stunted', 'int64'),
+            ('time', 'int64'),
+            ('baseline.age', 'int64'),
+            ('season', 'int64'),
+        ],
+    },
+}
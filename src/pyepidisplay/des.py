@@ -4,8 +4,25 @@ Module `des` provides a descriptive summary function for pandas DataFrames,
 similar to R's epiDisplay::des().
 """
 
+import json
+import os
+
+import numpy as np
 import pandas as pd
 
+# Distinct values are counted exactly (by sorting) up to this many rows and
+# estimated beyond with HyperLogLog sketches of 2**12 registers, which have
+# about 1.6% standard error.
+_EXACT_DISTINCT_ROWS = 2 ** 16
+_HLL_PRECISION = 12
+# Columns are hashed in blocks of at most this many values.
+_HASH_BLOCK_VALUES = 2 ** 22
+# Rows of a CSV file parsed to infer its column classes.
+_CSV_SAMPLE_ROWS = 10_000
+# Bytes read at a time when counting the lines of a CSV file.
+_LINE_COUNT_BLOCK = 2 ** 24
+_COMPRESSED = (".gz", ".bz2", ".zip", ".xz", ".zst", ".tar")
+
 class DesResult:  # pylint: disable=too-few-public-methods
     """
     Represents the descriptive summary of a DataFrame, including
@@ -19,47 +36,267 @@ class DesResult:  # pylint: disable=too-few-public-methods
         return f"{self.header}\n{self.table.to_string(index=False)}"
 
 
-def des(df: pd.DataFrame) -> DesResult:
+def des(df, memory=False, missing=False, distinct=False, sample=None,
+        seed=None) -> DesResult:
     """
     Display variables and their description.
     Equivalent to R's epiDisplay::des() behavior.
-    
+
+    `df` may also be the name of a bundled dataset (e.g. "Outbreak") or the
+    path of a CSV or Parquet file, which are described without loading the
+    data:
+        dataset  → classes and row count from the dataset manifest
+        Parquet  → classes and row count from the file metadata
+        CSV      → classes of the first 10,000 rows as parsed by
+                   pd.read_csv, rows counted by a scan for newlines (quoted
+                   fields spanning lines are counted once per line)
+    Labels of a file are read from a JSON sidecar next to it,
+    "<name>.labels.json", holding "datalabel" and "var.labels"; a Parquet
+    file written from a DataFrame also carries the frame's attrs.
+
     Expected DataFrame attributes:
         df.attrs["var.labels"] → list or dict of variable descriptions
         df.attrs["datalabel"]  → dataset label
+
+    The optional columns profile the data of each variable:
+        memory   → "Memory": bytes used, including Python objects
+        missing  → "Missing": number of missing values
+        distinct → "Distinct": number of distinct non-missing values, exact
+                   up to 65,536 rows and a HyperLogLog estimate (about 1.6%
+                   standard error) for taller frames
+
+    `sample` limits profiling to a random sample of that many rows.
+    Memory and missing counts are then scaled up to the whole frame, while
+    distinct counts are those seen in the sample. `seed` seeds the sample.
     """
+    if isinstance(df, (str, os.PathLike)):
+        if memory or missing or distinct:
+            raise ValueError("memory, missing and distinct need a loaded DataFrame.")
+        if os.path.isfile(df):
+            return _des_file(os.fspath(df))
+        if isinstance(df, os.PathLike):
+            raise FileNotFoundError(f"File '{os.fspath(df)}' not found.")
+        return _des_dataset(df)
 
-    # --- Handle var.labels ---
-    var_labels = df.attrs.get("var.labels", None)
+    header, table = _describe(df.columns, df.dtypes, len(df), df.attrs)
 
-    # Normalize to dict
-    if isinstance(var_labels, list):
-        # list must match number of columns
-        var_labels = {col: (var_labels[i] if i < len(var_labels) else "")
-                      for i, col in enumerate(df.columns)}
-    elif isinstance(var_labels, dict):
-        pass
-    else:
-        var_labels = {col: "" for col in df.columns}
+    if sample is not None and sample < 1:
+        raise ValueError("sample must be a positive number of rows.")
+    if memory or missing or distinct:
+        rows, scale = df, 1.0
+        if sample is not None and len(df) > sample:
+            rng = np.random.default_rng(seed)
+            rows = df.take(np.sort(rng.choice(len(df), sample, replace=False)))
+            scale = len(df) / sample
+            header += f"Profiled on a random sample of {sample} rows\n"
+        if memory:
+            table["Memory"] = _memory_usage(df, rows, scale)
+        if missing:
+            counts = rows.isna().sum().to_numpy()
+            table["Missing"] = np.rint(counts * scale).astype("int64")
+        if distinct:
+            table["Distinct"] = _approx_distinct(rows)
 
-    # --- Variable names ---
-    var_names = list(df.columns)
+    return DesResult(header=header, table=table)
 
-    # --- Classes/types ---
-    classes = [df[col].dtype.name for col in df.columns]
 
-    # --- Descriptions ---
-    descriptions = [var_labels.get(col, "") for col in df.columns]
+def _describe(columns, dtypes, n_rows, attrs):
+    """Header and Variable / Class / Description table of a dataset."""
+    # --- Classes/types: one name lookup per distinct dtype ---
+    codes, uniques = pd.factorize(pd.Series(dtypes, dtype=object))
+    classes = np.array([dtype.name for dtype in uniques], dtype=object)[codes]
 
     # --- Create table ---
     table = pd.DataFrame({
-        "Variable": var_names,
+        "Variable": list(columns),
         "Class": classes,
-        "Description": descriptions
+        "Description": _descriptions(attrs.get("var.labels", None), columns)
     })
 
     # --- Header ---
-    datalabel = df.attrs.get("datalabel", "")
-    header = f"{datalabel}\nNo. of observations: {len(df)}\n"
+    datalabel = attrs.get("datalabel", "")
+    header = f"{datalabel}\nNo. of observations: {n_rows}\n"
+    return header, table
+
+
+def _descriptions(var_labels, columns):
+    """Return one description per column from a list or dict of labels."""
+    if isinstance(var_labels, list):
+        # a short list leaves the remaining columns without a description
+        return var_labels[:len(columns)] + [""] * (len(columns) - len(var_labels))
+    if isinstance(var_labels, dict):
+        return pd.Series(columns, dtype=object).map(var_labels).fillna("").tolist()
+    return [""] * len(columns)
+
+
+def _memory_usage(df, rows, scale):
+    """Bytes per column; only object and extension columns are measured."""
+    usage = np.zeros(df.shape[1], dtype="int64")
+    measured = []
+    for i, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, np.dtype) and dtype.kind != "O":
+            usage[i] = dtype.itemsize * len(df)
+        else:
+            measured.append(i)
+    if measured:
+        deep = rows.iloc[:, measured].memory_usage(index=False, deep=True).to_numpy()
+        usage[measured] = np.rint(deep * scale)
+    return usage
+
+
+def _approx_distinct(df):
+    """Distinct non-missing values of every column, estimated for tall frames."""
+    precision = _HLL_PRECISION
+    exact = len(df) <= _EXACT_DISTINCT_ROWS
+    estimates = np.zeros(df.shape[1])
+    codes, dtypes = pd.factorize(df.dtypes)
+    for code, dtype in enumerate(dtypes):
+        positions = np.flatnonzero(codes == code)
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufmM":
+            # numeric columns of one dtype are hashed together, a block at a time
+            step = max(1, _HASH_BLOCK_VALUES // max(len(df), 1))
+            for start in range(0, len(positions), step):
+                block = positions[start:start + step]
+                if exact:
+                    estimates[block] = _sorted_distinct(df.iloc[:, block].to_numpy())
+                    continue
+                hashes, valid = _hash_numeric(df.iloc[:, block].to_numpy())
+                column = np.broadcast_to(np.arange(len(block)), hashes.shape)
+                registers = _registers(hashes[valid], column[valid], len(block), precision)
+                estimates[block] = _hll_estimate(registers)
+        else:
+            for i in positions:
+                if exact:
+                    estimates[i] = df.iloc[:, i].nunique()
+                    continue
+                values = df.iloc[:, i].dropna()
+                hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+                registers = _registers(hashes, np.zeros(len(hashes), dtype=np.intp),
+                                       1, precision)
+                estimates[i] = _hll_estimate(registers)[0]
+    # the estimate can never exceed the number of non-missing values
+    return np.minimum(np.rint(estimates), df.count().to_numpy()).astype("int64")
+
+
+def _sorted_distinct(block):
+    """Exact distinct non-missing values of each column of a numeric block."""
+    if len(block) == 0:
+        return np.zeros(block.shape[1])
+    ordered = np.sort(block, axis=0)
+    # NaN and NaT sort last, so a change into a missing value is not counted
+    if block.dtype.kind == "f":
+        valid = ~np.isnan(ordered)
+    elif block.dtype.kind in "mM":
+        valid = ~np.isnat(ordered)
+    else:
+        valid = np.ones(ordered.shape, dtype=bool)
+    changes = np.count_nonzero((ordered[1:] != ordered[:-1]) & valid[1:], axis=0)
+    return changes + valid[0]
 
+
+def _hash_numeric(block):
+    """64-bit hashes (splitmix64 finalizer) and validity mask of a numeric block."""
+    kind = block.dtype.kind
+    if kind == "f":
+        valid = ~np.isnan(block)
+        # adding 0.0 maps -0.0 onto 0.0 so equal values share a bit pattern
+        bits = (block.astype(np.float64) + 0.0).view(np.uint64)
+    elif kind in "mM":
+        valid = ~np.isnat(block)
+        bits = block.view(np.int64).view(np.uint64)
+    else:
+        valid = np.ones(block.shape, dtype=bool)
+        bits = block.astype(np.int64 if kind != "u" else np.uint64).view(np.uint64)
+    z = bits + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31)), valid
+
+
+def _registers(hashes, column, n_columns, precision):
+    """HyperLogLog registers, shape (n_columns, 2**precision), of the hashes."""
+    width = 64 - precision
+    index = (hashes >> np.uint64(width)).astype(np.intp)
+    # rank = position of the leftmost 1-bit in the remaining bits (exact in a float)
+    rest = (hashes & np.uint64((1 << width) - 1)).astype(np.float64)
+    rank = (width + 1 - np.frexp(rest)[1]).astype(np.uint8)
+    registers = np.zeros(n_columns << precision, dtype=np.uint8)
+    np.maximum.at(registers, (column << precision) + index, rank)
+    return registers.reshape(n_columns, 1 << precision)
+
+
+def _hll_estimate(registers):
+    """Cardinality estimate of each row of registers, with the small-range correction."""
+    m = registers.shape[1]
+    alpha = 0.7213 / (1 + 1.079 / m)
+    raw = alpha * m * m / np.exp2(-registers.astype(np.float64)).sum(axis=1)
+    zeros = np.count_nonzero(registers == 0, axis=1)
+    with np.errstate(divide="ignore"):
+        linear = m * np.log(m / zeros)
+    return np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)
+
+
+def _des_dataset(name: str) -> DesResult:
+    """Describe a bundled dataset from its manifest entry."""
+    from pyepidisplay.data import info
+    from pyepidisplay.datasets import DATA_PATH
+
+    entry = info(name)
+    header, table = _describe(
+        list(entry["dtypes"]), [pd.api.types.pandas_dtype(t) for t in entry["dtypes"].values()],
+        entry["n_rows"], _sidecar_labels(os.path.join(DATA_PATH, entry["file"])))
     return DesResult(header=header, table=table)
+
+
+def _des_file(path: str) -> DesResult:
+    """Describe a CSV or Parquet file from its metadata or a bounded sample."""
+    if path.lower().endswith(_COMPRESSED):
+        raise ValueError("des() describes uncompressed CSV or Parquet files only.")
+    attrs = {}
+    if path.lower().endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+
+        metadata = pq.read_metadata(path)
+        schema = metadata.schema.to_arrow_schema()
+        # an empty table converts with the pandas metadata (categories, nullable types)
+        dtypes = schema.empty_table().to_pandas().dtypes
+        columns, n_rows = list(dtypes.index), metadata.num_rows
+        saved = (schema.metadata or {}).get(b"PANDAS_ATTRS")
+        if saved:
+            attrs = json.loads(saved)
+    else:
+        head = pd.read_csv(path, nrows=_CSV_SAMPLE_ROWS)
+        columns, dtypes = head.columns, head.dtypes
+        n_rows = len(head) if len(head) < _CSV_SAMPLE_ROWS else _count_data_lines(path)
+    header, table = _describe(columns, dtypes, n_rows, _sidecar_labels(path, attrs))
+    return DesResult(header=header, table=table)
+
+
+def _sidecar_labels(path, attrs=None):
+    """Labels from "<name>.labels.json" next to `path`, over `attrs`."""
+    attrs = dict(attrs or {})
+    sidecar = os.path.splitext(path)[0] + ".labels.json"
+    if os.path.isfile(sidecar):
+        with open(sidecar, encoding="utf-8") as f:
+            labels = json.load(f)
+        attrs.update({key: labels[key] for key in ("datalabel", "var.labels") if key in labels})
+    return attrs
+
+
+def _count_data_lines(path):
+    """Number of lines after the header of a text file, from a newline scan."""
+    lines = 0
+    last = b"\n"
+    buffer = bytearray(_LINE_COUNT_BLOCK)
+    with open(path, "rb") as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            block = buffer if size == len(buffer) else buffer[:size]
+            lines += block.count(b"\n")
+            last = block[-1:]
+    # a last line without a trailing newline still holds a row
+    if last != b"\n":
+        lines += 1
+    return max(lines - 1, 0)
@@ -1,10 +1,10 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from pyepidisplay.lazyplot import LazyPlot
 
 def dotplot(x, bin="auto", by=None, xmin=None, xmax=None, time_format=None, 
             time_step=None, pch=18, dot_col="auto", main="auto", ylab="auto", 
-            cex_X_axis=1, cex_Y_axis=1, **kwargs):
+            cex_X_axis=1, cex_Y_axis=1, graph=True, **kwargs):
     """
     Create a dot plot similar to R's epiDisplay::dotplot
     
@@ -34,8 +34,19 @@ def dotplot(x, bin="auto", by=None, xmin=None, xmax=None, time_format=None,
         X-axis label size multiplier
     cex_Y_axis : float
         Y-axis label size multiplier
+    graph : bool or "lazy"
+        True draws and shows the plot immediately; "lazy" computes the dot
+        positions and returns a LazyPlot that draws only when rendered,
+        saved or shown (matplotlib is not imported until then)
+
+    Returns:
+    --------
+    None, or a LazyPlot when graph="lazy"
     """
     
+    if graph not in (True, False, "lazy"):
+        raise ValueError("graph must be True, False or 'lazy'.")
+
     # Validation for dot_col
     if by is not None:
         if isinstance(dot_col, list) and len(dot_col) > 1:
@@ -160,112 +171,117 @@ def dotplot(x, bin="auto", by=None, xmin=None, xmax=None, time_format=None,
     # Main title
     string3 = f"Distribution of {character_x}"
     
-    # Create figure
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Plot based on whether 'by' is specified
+    # Compute dot positions based on whether 'by' is specified
+    marker = 'D' if pch == 18 else 'o'
+
     if by is None:
         # Single group plot
         if dot_col == "auto":
             dot_col = "black"
-        
+
         xgr_sorted = np.sort(xgr)
         freq = np.zeros(len(value_numeric))
-        
+
         # Calculate frequencies for each x position
         for i in np.unique(xgr):
             mask = xgr_sorted == i
             freq[xgr_sorted == i] = np.arange(1, np.sum(mask) + 1)
-        
+
         max_freq = freq.max()
         ylim = [0, 20] if max_freq < 20 else [0, max_freq]
-        
-        # Get marker style
-        marker = 'D' if pch == 18 else 'o'
-        
-        ax.scatter(xgr_sorted, freq, marker=marker, c=dot_col, s=50, **kwargs)
-        ax.set_ylim(ylim)
-        ax.set_xlim(xlim)
-        ax.set_ylabel(ylab if ylab != "auto" else "Frequency", 
-                     fontsize=10*cex_Y_axis)
-        ax.set_title(main if main != "auto" else string3, fontsize=12)
-        
+        x_points, y_points, point_colors = xgr_sorted, freq, dot_col
+        main_lab = main if main != "auto" else string3
+        yline = None
+        by1 = None
+
     else:
         # Grouped plot
         order = np.lexsort((value_numeric, by0))
         xgr = xgr[order]
-        value_numeric_sorted = value_numeric[order]
         by1 = pd.Categorical(by0).categories
         by0_sorted = by0[order]
-        
+
         y = np.zeros(len(value_numeric))
         add_i = 0
         yline = []
-        
+
         # Assign colors
         if dot_col == "auto":
-            colors = plt.cm.tab10(np.linspace(0, 1, len(by1)))
             dot_col = [f'C{i}' for i in range(len(by1))]
-        
+
         by_cat = pd.Categorical(by0_sorted, categories=by1)
-        
+
         # Calculate y positions for each group
         for i, category in enumerate(by1):
             yline.append(add_i)
             mask = by_cat == category
             xgr_group = xgr[mask]
-            
+
             for j in np.unique(xgr_group):
                 mask_j = (xgr == j) & (by_cat == category)
                 count = np.sum(mask_j)
                 y[mask_j] = np.arange(1, count + 1) + add_i
-            
+
             add_i = y.max() + 2
-        
+
         # Plot title
         byname = "by"
         main_lab = main if main != "auto" else f"{string3} by {byname}"
         if len(main_lab) > 45:
             main_lab = f"{string3}\nby {byname}"
-        
+
         # Assign colors to points
         if isinstance(dot_col, list):
             color_map = {cat: col for cat, col in zip(by1, dot_col)}
             point_colors = [color_map[cat] for cat in by_cat]
         else:
             point_colors = [f'C{i}' for i, cat in enumerate(by_cat)]
-        
-        # Get marker style
-        marker = 'D' if pch == 18 else 'o'
-        
+
         ylim = [-1, 20] if y.max() < 20 else [-1, y.max()]
-        
-        ax.scatter(xgr, y, marker=marker, c=point_colors, s=50, **kwargs)
+        x_points, y_points = xgr, y
+
+    # X-axis tick labels
+    if is_datetime:
+        xticklabels = [pd.Timestamp(v, unit='s').strftime(format_time)
+                       for v in value_pretty]
+    else:
+        xticklabels = [f'{v:.1f}' for v in value_pretty]
+
+    def draw(ax):
+        ax.scatter(x_points, y_points, marker=marker, c=point_colors, s=50, **kwargs)
         ax.set_xlim(xlim)
         ax.set_ylim(ylim)
-        ax.set_ylabel('')
         ax.set_title(main_lab, fontsize=12)
-        
-        # Add horizontal lines
-        for yl in yline:
-            ax.axhline(y=yl, color='blue', linewidth=0.5)
-        
-        # Set y-axis labels
-        ax.set_yticks(yline)
-        ax.set_yticklabels(by1, fontsize=10*cex_Y_axis)
-    
-    # Set x-axis
-    ax.set_xticks(xgr_pretty)
-    
-    if is_datetime:
-        labels = [pd.Timestamp(v, unit='s').strftime(format_time) 
-                 for v in value_pretty]
-        ax.set_xticklabels(labels, fontsize=10*cex_X_axis, rotation=45, ha='right')
-        ax.set_xlabel('Date')
-    else:
-        ax.set_xticklabels([f'{v:.1f}' for v in value_pretty], 
-                          fontsize=10*cex_X_axis)
-        ax.set_xlabel('')
-    
-    plt.tight_layout()
-    plt.show()
\ No newline at end of file
+
+        if by is None:
+            ax.set_ylabel(ylab if ylab != "auto" else "Frequency",
+                          fontsize=10*cex_Y_axis)
+        else:
+            ax.set_ylabel('')
+
+            # Add horizontal lines
+            for yl in yline:
+                ax.axhline(y=yl, color='blue', linewidth=0.5)
+
+            # Set y-axis labels
+            ax.set_yticks(yline)
+            ax.set_yticklabels(by1, fontsize=10*cex_Y_axis)
+
+        # Set x-axis
+        ax.set_xticks(xgr_pretty)
+
+        if is_datetime:
+            ax.set_xticklabels(xticklabels, fontsize=10*cex_X_axis, rotation=45, ha='right')
+            ax.set_xlabel('Date')
+        else:
+            ax.set_xticklabels(xticklabels, fontsize=10*cex_X_axis)
+            ax.set_xlabel('')
+
+    if graph is False:
+        return None
+
+    plot = LazyPlot(draw, figsize=(10, 6))
+    if graph == "lazy":
+        return plot
+    plot.show()
+    return None
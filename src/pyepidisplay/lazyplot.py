@@ -0,0 +1,71 @@
+"""
+Module `lazyplot` provides a deferred plot object for the display functions.
+
+A LazyPlot keeps the drawing instructions of a figure without importing
+matplotlib. The figure is only built when it is rendered, saved, shown or
+displayed in a notebook, so compute-only callers never pay for the plotting
+backend.
+"""
+
+import io
+
+
+class LazyPlot:
+    """
+    A figure that is drawn on demand.
+
+    Args:
+        draw: Callable taking a matplotlib Axes and drawing the plot on it.
+        figsize: Figure size in inches (default: (10, 6)).
+
+    Example:
+        >>> table, plot = tab1("age", df, graph="lazy")
+        >>> plot.savefig("age.png")
+    """
+
+    def __init__(self, draw, figsize=(10, 6)):
+        self._draw = draw
+        self.figsize = figsize
+        self._figure = None
+
+    def render(self):
+        """
+        Build the figure (once) and return it.
+
+        The figure is a matplotlib.figure.Figure that pyplot does not manage,
+        so it is never shown and never has to be closed. Drawing functions
+        that use seaborn (tab1) still import matplotlib.pyplot on the way.
+
+        Returns:
+            matplotlib.figure.Figure: The rendered figure.
+        """
+        if self._figure is None:
+            from matplotlib.figure import Figure
+
+            fig = Figure(figsize=self.figsize)
+            self._draw(fig.add_subplot())
+            fig.tight_layout()
+            self._figure = fig
+        return self._figure
+
+    def savefig(self, fname, **kwargs):
+        """Render the figure and save it to `fname` (see Figure.savefig)."""
+        self.render().savefig(fname, **kwargs)
+
+    def show(self):
+        """Draw the figure through pyplot and show it, like the eager path."""
+        import matplotlib.pyplot as plt
+
+        fig = plt.figure(figsize=self.figsize)
+        self._draw(fig.add_subplot())
+        plt.tight_layout()
+        plt.show()
+
+    def _repr_png_(self):
+        buffer = io.BytesIO()
+        self.render().savefig(buffer, format="png")
+        return buffer.getvalue()
+
+    def __repr__(self):
+        state = "rendered" if self._figure is not None else "not rendered"
+        return f"<LazyPlot {self.figsize[0]}x{self.figsize[1]} ({state})>"
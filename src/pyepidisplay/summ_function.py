@@ -6,17 +6,451 @@ cse583_summ_function module.
 Provides a summary function for pandas Series and example usage.
 """
 
-def summ(series):
+import numpy as np
+import pandas as pd
+from pyepidisplay.lazyplot import LazyPlot
+
+# pandas reductions behind each summ() statistic, in output order
+_STATS = {"obs": "count", "mean": "mean", "median": "median", "s.d.": "std",
+          "min": "min", "max": "max"}
+
+
+def summ(series, by=None, graph=False, weights=None):
     """
     Summarize a pandas Series with count, mean, median, std, min, and max.
+
+    A DataFrame is summarized column by column: every numeric column (other
+    than the `by` columns) gets one row per group in a tidy DataFrame with
+    the columns [*by, "variable", "obs", "mean", "median", "s.d.", "min",
+    "max"]. Each column is reduced from its own NumPy array for all groups
+    at once, skipping missing values, so no copy of the frame is made; the
+    s.d. sums squared deviations from the group mean, so it stays accurate
+    for values large relative to their spread (e.g. epoch times).
+
+    A Series can be plotted as a sorted dot chart, as in R's epiDisplay::summ,
+    with the mean and median marked. At most 2,000 dots per group are drawn:
+    larger groups are shown by evenly spaced order statistics (always
+    including the minimum and maximum), so drawing time does not grow with
+    the number of observations while the statistics stay exact.
+
+    Aggregated data, one row per value (or covariate pattern) with a count,
+    is summarized directly with `weights`: obs is the sum of the weights and
+    every statistic equals that of the data expanded with np.repeat.
+
+    Args:
+        series (pd.Series, pd.DataFrame or SummAccumulator): Values to
+            summarize; an accumulator is finalised into the summary dict.
+        by: Column name(s) of a DataFrame to group by, or for a Series an
+            array of group labels of the same length.
+        graph: False (default) only returns the summary, True also shows the
+            dot chart of a Series and "lazy" returns a ``(summary, LazyPlot)``
+            pair.
+        weights: Frequency weights; an array of the same length as the data,
+            or the name of a column of a DataFrame.
+
+    Returns:
+        dict for an ungrouped Series, pd.DataFrame otherwise.
+
+    Example:
+        >>> summ(data("Outbreak"), by="sex")
+        >>> summ(df["age"], by=df["sex"], graph=True)
+    """
+    if graph not in (True, False, "lazy"):
+        raise ValueError("graph must be True, False or 'lazy'.")
+    if isinstance(series, SummAccumulator):
+        if graph is not False:
+            raise ValueError("graph requires the values, not a SummAccumulator.")
+        return series.summary()
+    if isinstance(series, pd.DataFrame):
+        if graph is not False:
+            raise ValueError("graph is only available for a single variable (a Series).")
+        return _summ_frame(series, by, weights)
+
+    series = pd.Series(series)
+    if weights is not None:
+        weights = _check_weights(weights, len(series))
+    if by is None and weights is None:
+        # Reductions skip missing values themselves, so no dropna() copy is made.
+        result = {name: getattr(series, method)() for name, method in _STATS.items()}
+        groups = [(None, series, result, None)]
+    elif by is None:
+        stats = _weighted_stats(series.to_numpy(dtype=float, na_value=np.nan), weights,
+                                np.zeros(len(series), dtype=np.intp), 1)
+        result = {name: values[0] for name, values in stats.items()}
+        groups = [(None, series, result, weights)]
+    else:
+        if isinstance(by, str) or len(by) != len(series):
+            raise ValueError("by= of a Series must be group labels of the same length.")
+        value_name = series.name if series.name is not None else "x"
+        by_name = getattr(by, "name", None) or "group"
+        by = pd.Series(pd.Series(by).array, index=series.index, name=by_name)
+        # Fixed column names: the value and the groups may share a name, as
+        # in summ(df["age"], by=df["age"] > 30).
+        frame = pd.DataFrame({"by": by, "value": series})
+        result = _summ_frame(frame, "by", weights).rename(columns={"by": by_name})
+        result["variable"] = value_name
+    if graph is False:
+        return result
+
+    if by is not None:
+        positions = series.groupby(by, observed=True).indices
+        groups = [(row[by.name], series.iloc[positions[row[by.name]]],
+                   {key: row[key] for key in _STATS},
+                   None if weights is None else weights[positions[row[by.name]]])
+                  for row in result.to_dict("records")]
+
+    plot = LazyPlot(lambda ax: _draw_summ(ax, groups, series.name), figsize=(10, 6))
+    if graph == "lazy":
+        return result, plot
+    plot.show()
+    return result
+
+
+# Dots drawn per group by summ(graph=...)
+_MAX_DOTS = 2000
+
+
+def _sorted_sample(values, weights=None):
+    """Return (ranks, values) of at most _MAX_DOTS evenly spaced order statistics."""
+    values = pd.Series(values).to_numpy(dtype=float, na_value=np.nan)
+    if weights is None:
+        values = np.sort(values[~np.isnan(values)])
+        ranks = np.unique(np.linspace(0, len(values) - 1,
+                                      min(len(values), _MAX_DOTS)).round().astype(np.intp))
+        return ranks + 1, values[ranks]
+    # Order statistics of the data expanded by the frequency weights
+    keep = ~np.isnan(values) & (weights > 0)
+    order = np.argsort(values[keep], kind="stable")
+    values, cumulative = values[keep][order], np.cumsum(weights[keep][order])
+    if len(values) == 0:
+        return np.array([], dtype=np.intp), values
+    total = int(round(cumulative[-1]))
+    ranks = np.unique(np.linspace(0, total - 1, min(total, _MAX_DOTS)).round().astype(np.intp))
+    return ranks + 1, values[np.minimum(np.searchsorted(cumulative, ranks, side="right"),
+                                        len(values) - 1)]
+
+
+def _draw_summ(ax, groups, name):
+    """Draw the sorted dot chart of summ() with mean and median marked."""
+    offset = 0
+    for i, (label, values, stats, weights) in enumerate(groups):
+        ranks, sample = _sorted_sample(values, weights)
+        y = ranks + offset
+        color = f"C{i}"
+        ax.scatter(sample, y, s=6, color=color,
+                   label=None if label is None else f"{label} (n={stats['obs']:g})")
+        if len(sample):
+            ax.vlines(stats["mean"], y[0], y[-1], colors=color, linestyles="solid")
+            ax.vlines(stats["median"], y[0], y[-1], colors=color, linestyles="dashed")
+        offset += stats["obs"]
+
+    ax.set_xlabel(name if name is not None else "x")
+    ax.set_ylabel("Subject sorted by X-axis values")
+    if len(groups) == 1:
+        stats = groups[0][2]
+        ax.set_title(
+            f"Sorted values of {name if name is not None else 'x'}\n"
+            f"obs. {stats['obs']:g}, mean {stats['mean']:.3g}, median {stats['median']:.3g}, "
+            f"s.d. {stats['s.d.']:.3g}, min {stats['min']:.3g}, max {stats['max']:.3g}")
+    else:
+        ax.set_title(f"Sorted values of {name if name is not None else 'x'} by group "
+                     "(solid: mean, dashed: median)")
+        ax.legend()
+
+
+def _summ_frame(df, by, weights=None):
+    """Tidy summ() table of the numeric columns of `df`, optionally grouped."""
+    keys = [] if by is None else [by] if isinstance(by, str) else list(by)
+    for key in keys + ([weights] if isinstance(weights, str) else []):
+        if key not in df.columns:
+            raise ValueError(f"Column '{key}' not found in DataFrame.")
+    columns = [col for col in df.select_dtypes(include="number").columns
+               if col not in keys and not (isinstance(weights, str) and col == weights)]
+    if not columns:
+        raise ValueError("DataFrame has no numeric columns to summarize.")
+    if weights is not None:
+        weights = _check_weights(df[weights] if isinstance(weights, str) else weights,
+                                 len(df))
+    return _weighted_frame(df, keys, columns, weights)
+
+
+def _check_weights(weights, n):
+    """Validate frequency weights and return them as a float array."""
+    weights = pd.Series(weights).to_numpy(dtype=float, na_value=np.nan)
+    if len(weights) != n:
+        raise ValueError("weights must have the same length as the data.")
+    if np.isnan(weights).any() or (weights < 0).any():
+        raise ValueError("weights must be non-negative numbers.")
+    return weights
+
+
+def _weighted_frame(df, keys, columns, weights=None):
+    """
+    _summ_frame() table, one vectorized pass per column.
+
+    Every column is reduced from its own NumPy array, so no copy of the
+    frame is made; without weights each row counts once.
+    """
+    if keys:
+        grouped = df.groupby(keys, observed=True)
+        # Rows with a missing key have no group (code -1, skipped).
+        codes = grouped.ngroup().fillna(-1).to_numpy(dtype=np.intp)
+        index = grouped.size().index
+    else:
+        codes = np.zeros(len(df), dtype=np.intp)
+        index = None
+    n_groups = 1 if index is None else len(index)
+    unweighted = weights is None
+    if unweighted:
+        weights = np.ones(len(df))
+    parts = {}
+    for col in columns:
+        stats = _weighted_stats(df[col].to_numpy(dtype=float, na_value=np.nan),
+                                weights, codes, n_groups)
+        parts[col] = pd.DataFrame(stats, index=index)
+    table = pd.concat(parts, names=["variable"])
+    if index is None:
+        table = table.droplevel(-1)
+    else:
+        table = table.reorder_levels(keys + ["variable"]).sort_index(
+            level=keys, sort_remaining=False)
+        if not unweighted:
+            # Groups whose weights are all zero are not observed.
+            table = table[table["obs"] > 0]
+    return table.reset_index()
+
+
+def _weighted_stats(values, weights, codes, n_groups):
+    """
+    summ() statistics of `values` with frequency `weights`, per group code.
+
+    The results equal those of the data expanded with np.repeat: the s.d.
+    uses sum(weights) - 1 degrees of freedom and the median averages the
+    two middle order statistics of the expanded data.
+    """
+    keep = ~np.isnan(values) & (weights > 0) & (codes >= 0)
+    x, w, g = values[keep], weights[keep], codes[keep]
+    total = np.bincount(g, w, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(g, w * x, minlength=n_groups) / total
+        deviation = x - mean[g]
+        sd = np.sqrt(np.bincount(g, w * deviation ** 2, minlength=n_groups) / (total - 1))
+    sd[total <= 1] = np.nan
+
+    # Sort by group, then value; every group is then a contiguous run.
+    order = np.lexsort((x, g))
+    x, g = x[order], g[order]
+    cumulative = np.cumsum(w[order])
+    start = np.searchsorted(g, np.arange(n_groups))
+    end = np.searchsorted(g, np.arange(n_groups), side="right")
+    present = end > start
+    before = np.concatenate([[0.0], cumulative])[start]
+
+    def value_at(rank):
+        position = np.searchsorted(cumulative, before + rank, side="right")
+        return x[np.clip(position, start, end - 1)[present]]
+
+    minimum, maximum, median = (np.full(n_groups, np.nan) for _ in range(3))
+    minimum[present] = x[start[present]]
+    maximum[present] = x[end[present] - 1]
+    median[present] = (value_at(np.floor((total - 1) / 2)) + value_at(np.floor(total / 2))) / 2
+    if np.array_equal(weights, np.round(weights)):
+        total = total.astype(np.int64)
+    return {"obs": total, "mean": mean, "median": median, "s.d.": sd,
+            "min": minimum, "max": maximum}
+
+
+class SummAccumulator:
+    """
+    Mergeable running summary of a numeric variable, for data in chunks.
+
+    obs, mean, s.d., min and max are exact: each chunk is reduced to its
+    count, mean and sum of squared deviations, which are combined with
+    Chan's parallel update (Welford's algorithm generalised to batches), so
+    no raw values are kept. Accumulators filled in different processes can
+    be pickled and merged.
+
+    The median comes from a logarithmic-bucket quantile sketch (as in
+    DDSketch): a value x is counted in bucket ceil(log(|x|) / log(gamma)),
+    gamma = (1 + a) / (1 - a), so the reported median is within a relative
+    error `a` of a value of the data whose rank is the median rank. Memory
+    is bounded by `max_bins` buckets per sign; if more are needed the
+    buckets closest to zero are collapsed, which only affects accuracy
+    there. With relative_accuracy=None exact value counts are kept instead,
+    bounded by the number of distinct values.
+
+    Args:
+        relative_accuracy (float): Relative error bound `a` of the median,
+            0 < a < 1, or None for an exact median.
+        max_bins (int): Maximum number of sketch buckets per sign.
+
+    Example:
+        >>> acc = SummAccumulator()
+        >>> for chunk in stream("extract.csv", columns=["age"]):
+        ...     acc.update(chunk["age"])
+        >>> summ(acc)
+    """
+
+    def __init__(self, relative_accuracy=0.01, max_bins=2048):
+        if relative_accuracy is not None and not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1, or None.")
+        if int(max_bins) < 1:
+            raise ValueError("max_bins must be a positive integer.")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = int(max_bins)
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+        # Exact mode: {value: count}. Sketch mode: {bucket: count} per sign,
+        # plus the count of zeros.
+        self.counts = {}
+        self.negative = {}
+        self.zeros = 0
+
+    @property
+    def _gamma(self):
+        accuracy = self.relative_accuracy
+        return (1 + accuracy) / (1 - accuracy)
+
+    def update(self, values):
+        """Add a chunk of values (missing values are skipped); returns self."""
+        values = pd.Series(values).to_numpy(dtype=float, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n == 0:
+            return self
+        mean = values.mean()
+        self._combine(n, mean, ((values - mean) ** 2).sum(), values.min(), values.max())
+
+        if self.relative_accuracy is None:
+            _add_counts(self.counts, *np.unique(values, return_counts=True))
+            return self
+        log_gamma = np.log(self._gamma)
+        for store, part in ((self.counts, values[values > 0]),
+                            (self.negative, -values[values < 0])):
+            if len(part):
+                keys = np.ceil(np.log(part) / log_gamma).astype(np.int64)
+                _add_counts(store, *np.unique(keys, return_counts=True))
+                self._collapse(store)
+        self.zeros += int((values == 0).sum())
+        return self
+
+    def merge(self, other):
+        """Add the values summarised by another accumulator; returns self."""
+        if not isinstance(other, SummAccumulator):
+            raise ValueError("Can only merge another SummAccumulator.")
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge accumulators with different relative_accuracy.")
+        if other.n == 0:
+            return self
+        self._combine(other.n, other.mean, other.m2, other.min, other.max)
+        for store, part in ((self.counts, other.counts), (self.negative, other.negative)):
+            _add_counts(store, list(part), list(part.values()))
+            if self.relative_accuracy is not None:
+                self._collapse(store)
+        self.zeros += other.zeros
+        return self
+
+    def _combine(self, n, mean, m2, minimum, maximum):
+        """Chan's update of count, mean and M2 with another batch."""
+        total = self.n + n
+        delta = mean - self.mean
+        self.m2 += m2 + delta ** 2 * self.n * n / total
+        self.mean += delta * n / total
+        self.n = total
+        self.min = np.fmin(self.min, minimum)
+        self.max = np.fmax(self.max, maximum)
+
+    def _collapse(self, store):
+        """Fold the buckets closest to zero together until max_bins remain."""
+        if len(store) <= self.max_bins:
+            return
+        keys = sorted(store)
+        excess = keys[:len(keys) - self.max_bins + 1]
+        store[excess[-1]] = sum(store.pop(key) for key in excess)
+
+    def _value_at(self, rank):
+        """Value (or its sketch estimate) of the 0-based `rank`-th smallest value."""
+        if self.relative_accuracy is None:
+            values = sorted(self.counts)
+            cumulative = np.cumsum([self.counts[value] for value in values])
+            return values[np.searchsorted(cumulative, rank, side="right")]
+
+        gamma = self._gamma
+        negative = sorted(self.negative, reverse=True)
+        cumulative = np.cumsum([self.negative[key] for key in negative])
+        if rank < (cumulative[-1] if len(negative) else 0):
+            key = negative[np.searchsorted(cumulative, rank, side="right")]
+            return max(-2 * gamma ** key / (gamma + 1), self.min)
+        rank -= cumulative[-1] if len(negative) else 0
+        if rank < self.zeros:
+            return 0.0
+        rank -= self.zeros
+        positive = sorted(self.counts)
+        cumulative = np.cumsum([self.counts[key] for key in positive])
+        key = positive[np.searchsorted(cumulative, rank, side="right")]
+        return min(2 * gamma ** key / (gamma + 1), self.max)
+
+    def median(self):
+        """Median: exact, or within relative_accuracy of a median value."""
+        if self.n == 0:
+            return np.nan
+        return (self._value_at((self.n - 1) // 2) + self._value_at(self.n // 2)) / 2
+
+    def summary(self):
+        """The summ() statistics: obs, mean, median, s.d., min and max."""
+        return {
+            "obs": self.n,
+            "mean": self.mean if self.n else np.nan,
+            "median": self.median(),
+            "s.d.": np.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else np.nan,
+            "min": self.min,
+            "max": self.max
+        }
+
+
+def _add_counts(store, keys, counts):
+    """Add `counts` of `keys` into the dict `store`."""
+    for key, count in zip(np.asarray(keys).tolist(), np.asarray(counts).tolist()):
+        store[key] = store.get(key, 0) + count
+
+
+def summ_chunks(column, chunks=None, relative_accuracy=None):
+    """
+    Summarize a variable that arrives in chunks, e.g. from data.stream().
+
+    The column comes first, as in tab1_chunks() and my_crosstab_chunks().
+    Chunks that are already Series can be passed alone: summ_chunks(chunks).
+
+    Only a SummAccumulator is kept between chunks. obs, mean, s.d., min
+    and max need constant memory, but the exact median (the default) keeps
+    a count per distinct value, so memory grows with the number of distinct
+    values: fine for ages or coded variables, not for continuous
+    measurements or timestamps over millions of rows. Pass
+    relative_accuracy (e.g. 0.01) there to bound memory by the chunk size
+    plus a fixed-size quantile sketch. Returns the same statistics as
+    summ().
+
+    Args:
+        column (str): Column to summarize in each DataFrame chunk, or None
+            when the chunks are Series.
+        chunks: Iterable of DataFrames holding `column`, or of Series.
+        relative_accuracy (float): None (default) for an exact median,
+            using memory proportional to the number of distinct values, or
+            the relative error bound of an approximate median whose memory
+            is bounded.
+
+    Returns:
+        dict: obs, mean, median, s.d., min and max.
+
+    Example:
+        >>> summ_chunks("age", stream("extract.csv", columns=["age"]))
     """
-    clean_series = series.dropna()
-    summary = {
-        "obs": clean_series.count(),
-        "mean": clean_series.mean(),
-        "median": clean_series.median(),
-        "s.d.": clean_series.std(),
-        "min": clean_series.min(),
-        "max": clean_series.max()
-    }
-    return summary
\ No newline at end of file
+    if chunks is None and not (column is None or isinstance(column, str)):
+        column, chunks = None, column
+    accumulator = SummAccumulator(relative_accuracy)
+    for chunk in chunks:
+        accumulator.update(chunk[column] if column is not None else chunk)
+    return accumulator.summary()
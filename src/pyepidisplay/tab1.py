@@ -1,16 +1,33 @@
 """
 Docstring for pyepidisplay.tab1
 """
+import os
+
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from pyepidisplay.lazyplot import LazyPlot
 
-def tab1(column, df):
+def tab1(column, df, graph=True, weights=None, na="error", top=None, min_freq=None):
     """
     Docstring for tab1
-    
+
     :param column: Description
     :param df: Description
+    :param graph: True draws the bar chart immediately, False skips plotting
+        (matplotlib is never imported) and "lazy" returns a
+        ``(table, LazyPlot)`` pair that draws only when rendered or saved.
+    :param weights: Frequency weights for aggregated data: the name of a
+        column of `df` or an array with one count per row. Frequencies and
+        percentages are those of the rows repeated `weights` times.
+    :param na: What to do with missing values: "error" raises, "drop"
+        leaves them out (percentages are of the non-missing rows) and
+        "count" tabulates them as a level of their own, listed last.
+    :param top: Keep only the `top` most frequent levels, in decreasing
+        order of frequency, and lump the others into an "Other" row. The
+        bar chart then has at most top + 1 bars whatever the number of
+        distinct values.
+    :param min_freq: Lump levels with a frequency below `min_freq` into
+        "Other"; can be combined with `top`.
     """
     if not isinstance(column, str):
         raise ValueError("Column name must be a string.")
@@ -18,25 +35,304 @@ def tab1(column, df):
         raise ValueError("Input data must be a pandas DataFrame.")
     if column not in df.columns:
         raise ValueError("Column is not found in DataFrame.")
-    for i in df[column]:
-        if pd.isna(i):
+    if graph not in (True, False, "lazy"):
+        raise ValueError("graph must be True, False or 'lazy'.")
+    if na not in ("error", "drop", "count"):
+        raise ValueError("na must be 'error', 'drop' or 'count'.")
+
+    _check_lumping(top, min_freq)
+
+    table = _table(df[column], column, _check_weights(df, weights), na, top, min_freq)
+    return _finish(table, column, graph)
+
+
+def tab1_many(df, columns=None, graph=False, weights=None, na="error", n_jobs=1,
+              long=False, top=None, min_freq=None):
+    """
+    tab1 tables of many columns of one DataFrame at once.
+
+    The frame, weights and options are checked once and the columns are
+    counted in a pool of `n_jobs` threads; factorizing and counting release
+    the GIL, and threads share the frame without copying it.
+
+    :param df: DataFrame holding the columns.
+    :param columns: Names of the columns to tabulate. By default every
+        categorical, boolean and text column (other than a weights column).
+    :param graph: False (the default) only counts, True draws one bar chart
+        per column and "lazy" also returns a ``{column: LazyPlot}`` dict.
+    :param weights: Frequency weights, as in tab1().
+    :param na: "error", "drop" or "count", as in tab1().
+    :param n_jobs: Number of threads; -1 uses all cores.
+    :param long: Return one long DataFrame with `variable` and `level`
+        columns instead of a ``{column: table}`` dict.
+    :param top: Keep the `top` most frequent levels of each column, as in tab1().
+    :param min_freq: Lump rarer levels into "Other", as in tab1().
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError("Input data must be a pandas DataFrame.")
+    if graph not in (True, False, "lazy"):
+        raise ValueError("graph must be True, False or 'lazy'.")
+    if na not in ("error", "drop", "count"):
+        raise ValueError("na must be 'error', 'drop' or 'count'.")
+    _check_lumping(top, min_freq)
+    if columns is None:
+        skip = weights if isinstance(weights, str) else None
+        columns = [col for col, dtype in df.dtypes.items()
+                   if col != skip and (isinstance(dtype, pd.CategoricalDtype)
+                                          or pd.api.types.is_bool_dtype(dtype)
+                                          or pd.api.types.is_string_dtype(dtype))]
+    else:
+        if isinstance(columns, str) or not all(isinstance(col, str) for col in columns):
+            raise ValueError("columns must be a list of column names.")
+        missing = [col for col in columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Columns not found in DataFrame: {', '.join(missing)}.")
+    weights = _check_weights(df, weights)
+
+    def count(column):
+        try:
+            return _table(df[column], column, weights, na, top, min_freq)
+        except ValueError as err:
+            raise ValueError(f"Column '{column}': {err}") from err
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs > 1 and len(columns) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(n_jobs, len(columns))) as pool:
+            tables = dict(zip(columns, pool.map(count, columns)))
+    else:
+        tables = {column: count(column) for column in columns}
+
+    plots = {}
+    if graph is not False:
+        for column, table in tables.items():
+            plots[column] = LazyPlot(lambda ax, t=table, c=column: _draw_tab1(ax, t, c),
+                                     figsize=(10, 6))
+            if graph is True:
+                plots[column].show()
+
+    if long:
+        names = list(tables)
+        stats = ["Frequency", "Percent", "Cumulative Percent"]
+        tables = pd.DataFrame({
+            "variable": np.repeat(np.array(names, dtype=object),
+                                  [len(tables[name]) for name in names]),
+            "level": np.concatenate([tables[name].index.astype(object) for name in names]
+                                    or [np.empty(0, dtype=object)]),
+            **{stat: np.concatenate([tables[name][stat].to_numpy() for name in names]
+                                    or [np.empty(0)]) for stat in stats},
+        })
+    return (tables, plots) if graph == "lazy" else tables
+
+
+def _check_weights(df, weights):
+    """Frequency weights of the rows of `df` as a float array, or None."""
+    if weights is None:
+        return None
+    if isinstance(weights, str):
+        if weights not in df.columns:
+            raise ValueError("Weights column is not found in DataFrame.")
+        weights = df[weights]
+    weights = pd.Series(weights).to_numpy(dtype=float, na_value=float("nan"))
+    if len(weights) != len(df):
+        raise ValueError("weights must have the same length as the DataFrame.")
+    if pd.isna(weights).any() or (weights < 0).any():
+        raise ValueError("weights must be non-negative numbers.")
+    return weights
+
+
+def _table(values, column, weights, na, top=None, min_freq=None):
+    """Frequency table of one column, counted from its level codes."""
+    # One pass turns the column into level codes, with -1 for missing values.
+    codes, levels = _codes(values)
+    missing = codes < 0
+    n_missing = np.count_nonzero(missing)
+    if n_missing and na == "error":
+        raise ValueError("Column contains NA values.")
+    if n_missing and na == "count":
+        # missing values become the last level
+        codes = np.where(missing, len(levels), codes)
+        levels = levels.insert(len(levels), np.nan)
+    elif n_missing:
+        codes = codes[~missing]
+        if weights is not None:
+            weights = weights[~missing]
+
+    if weights is None:
+        counts = pd.Series(np.bincount(codes, minlength=len(levels)), index=levels)
+        return _frequency_table(_lump(counts, top, min_freq), column, len(codes))
+
+    counts = pd.Series(np.bincount(codes, weights=weights, minlength=len(levels)),
+                       index=levels)
+    # unused categories stay at zero, like the unweighted table
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        counts = counts[counts > 0]
+    if (counts == counts.round()).all():
+        counts = counts.astype("int64")
+    return _frequency_table(_lump(counts, top, min_freq), column, counts.sum())
+
+
+def _codes(values):
+    """Sorted level codes of a Series (-1 for missing) and the matching Index."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # every category is a level, used or not, in category order
+        return (values.cat.codes.to_numpy(dtype=np.intp),
+                pd.CategoricalIndex(values.cat.categories, dtype=values.dtype))
+    codes, levels = pd.factorize(values, sort=True)
+    return codes.astype(np.intp, copy=False), levels
+
+
+def tab1_chunks(column, chunks, graph=True, weights=None, na="error", top=None,
+                min_freq=None, counters=None):
+    """
+    tab1 for data that arrives in chunks, e.g. from data.stream().
+
+    Frequencies are summed chunk by chunk, so peak memory is bounded by the
+    chunk size and the number of distinct values. The result is the same
+    table as tab1() on the concatenated data.
+
+    With `top` or `min_freq` the frequencies are kept in a Misra-Gries
+    summary of `counters` levels instead (default: 10,000 or 10 * top),
+    so memory no longer grows with the number of distinct values. The
+    table is exact while at most `counters` distinct values have been seen;
+    beyond that each kept frequency may be undercounted by at most
+    (rows / (counters + 1)), and the difference is counted in "Other".
+
+    :param column: Name of the column to tabulate.
+    :param chunks: Iterable of DataFrames holding `column`.
+    :param graph: True, False or "lazy", as in tab1().
+    :param weights: Name of a column of frequency weights in every chunk,
+        as in tab1(); arrays cannot be lined up with chunks.
+    :param na: "error", "drop" or "count", as in tab1().
+    :param top: Keep the `top` most frequent levels, as in tab1().
+    :param min_freq: Lump rarer levels into "Other", as in tab1().
+    :param counters: Number of levels kept by the Misra-Gries summary.
+    """
+    if not isinstance(column, str):
+        raise ValueError("Column name must be a string.")
+    if graph not in (True, False, "lazy"):
+        raise ValueError("graph must be True, False or 'lazy'.")
+    if na not in ("error", "drop", "count"):
+        raise ValueError("na must be 'error', 'drop' or 'count'.")
+    if weights is not None and not isinstance(weights, str):
+        raise ValueError("weights of chunked data must be a column name.")
+    _check_lumping(top, min_freq)
+    lumping = top is not None or min_freq is not None
+    if counters is None:
+        counters = max(10_000, 10 * (top or 0))
+    elif int(counters) < 1 or (top is not None and int(counters) < top):
+        raise ValueError("counters must be a positive integer of at least top.")
+    counts = None
+    total = 0
+    for chunk in chunks:
+        if not isinstance(chunk, pd.DataFrame):
+            raise ValueError("Input data must be a pandas DataFrame.")
+        if column not in chunk.columns:
+            raise ValueError("Column is not found in DataFrame.")
+        values = chunk[column]
+        if na == "error" and values.isna().any():
             raise ValueError("Column contains NA values.")
+        if weights is None:
+            chunk_counts = values.value_counts(dropna=na == "drop")
+        else:
+            chunk_weights = pd.Series(_check_weights(chunk, weights), index=chunk.index)
+            chunk_counts = chunk_weights.groupby(values, dropna=na == "drop",
+                                                 observed=False).sum()
+        counts = chunk_counts if counts is None else counts.add(chunk_counts, fill_value=0)
+        if lumping and len(counts) > counters:
+            counts = _misra_gries_reduce(counts, int(counters))
+        if weights is None:
+            total += len(values) if na == "count" else int(values.notna().sum())
+        else:
+            total += chunk_counts.sum()
+    if counts is None:
+        counts = pd.Series(dtype="int64")
+    if weights is not None and not (counts == counts.round()).all():
+        counts = counts.sort_index()
+    else:
+        counts = counts.astype("int64").sort_index()
+        total = int(total)
+    if weights is not None and len(counts) and not isinstance(counts.index,
+                                                              pd.CategoricalIndex):
+        counts = counts[counts > 0]
+    if lumping:
+        counts = _lump(counts, top, min_freq, total)
+    return _finish(_frequency_table(counts, column, total), column, graph)
+
+
+def _misra_gries_reduce(counts, counters):
+    """
+    Shrink a Misra-Gries summary back to `counters` levels.
+
+    The (counters + 1)-th largest count is subtracted from every level and
+    levels that drop to zero are forgotten, which keeps the summaries of
+    successive chunks mergeable by plain addition.
+    """
+    values = counts.to_numpy()
+    cut = np.partition(values, len(values) - counters - 1)[len(values) - counters - 1]
+    return counts[values > cut] - cut
+
+
+def _check_lumping(top, min_freq):
+    """Validate the top= and min_freq= options of tab1."""
+    if top is not None and (isinstance(top, bool) or not float(top).is_integer()
+                            or top < 1):
+        raise ValueError("top must be a positive integer.")
+    if min_freq is not None and (isinstance(min_freq, bool) or not min_freq >= 0):
+        raise ValueError("min_freq must be a non-negative number.")
 
-    df_col = df[column].value_counts(dropna=False).sort_index()
-    df_col_1 = df_col.reset_index()
-    df_col_1.columns = [column, 'Frequency']
-    df_col_1 = df_col_1.set_index(column)
-    df_col_1['Percent'] = ((df_col_1['Frequency'] / len(df)) * 100).round(2)
+
+def _lump(counts, top, min_freq, total=None):
+    """
+    Keep the frequent levels of `counts` and lump the others into "Other".
+
+    `total` is the number of rows counted, when `counts` may fall short of it.
+    """
+    if top is None and min_freq is None:
+        return counts
+    kept = counts if min_freq is None else counts[counts.to_numpy() >= min_freq]
+    if top is not None:
+        kept = kept.sort_values(ascending=False, kind="stable").iloc[:int(top)]
+    other = (counts.sum() if total is None else total) - kept.sum()
+    if other <= 0:
+        return kept
+    index = kept.index.astype(object).append(pd.Index(["Other"], dtype=object))
+    return pd.Series(np.append(kept.to_numpy(), other), index=index)
+
+
+def _frequency_table(counts, column, total):
+    """Build the Frequency / Percent / Cumulative Percent table from value counts."""
+    df_col_1 = pd.DataFrame({'Frequency': counts.to_numpy()},
+                            index=counts.index.rename(column))
+    df_col_1['Percent'] = ((df_col_1['Frequency'] / total) * 100).round(2)
     df_col_1['Cumulative Percent'] = df_col_1['Percent'].cumsum().round(2)
-    plt.figure(figsize=(10, 6))
-    sns.barplot(x=df_col_1.index.astype(str), y='Frequency', data=df_col_1, palette='viridis')
-    for index, value in enumerate(df_col_1['Frequency']):
-        plt.text(index, value, str(value), ha='center', va='bottom')
-    plt.title(f'Frequency Distribution of {column}')
-    plt.xlabel(column)
-    plt.ylabel('Frequency')
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.show()
+    return df_col_1
+
+
+def _finish(df_col_1, column, graph):
+    """Plot the frequency table according to `graph` and return the result."""
+    if graph is False:
+        return df_col_1
+
+    plot = LazyPlot(lambda ax: _draw_tab1(ax, df_col_1, column), figsize=(10, 6))
+    if graph == "lazy":
+        return df_col_1, plot
+    plot.show()
 
     return df_col_1
+
+
+def _draw_tab1(ax, table, column):
+    """Draw the frequency bar chart of a tab1 table on `ax`."""
+    import seaborn as sns
+
+    sns.barplot(x=table.index.astype(str), y='Frequency', data=table,
+                palette='viridis', ax=ax)
+    for index, value in enumerate(table['Frequency']):
+        ax.text(index, value, str(value), ha='center', va='bottom')
+    ax.set_title(f'Frequency Distribution of {column}')
+    ax.set_xlabel(column)
+    ax.set_ylabel('Frequency')
+    ax.tick_params(axis='x', labelrotation=45)
@@ -5,11 +5,12 @@ plots a mosaic diagram with pastel colors.
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
 import numpy as np
+from pyepidisplay.lazyplot import LazyPlot
+from pyepidisplay.crosstab_function import weighted_crosstab
+
 def tabpct(row, column, decimal=1, percent="both", graph=True,
-           main="auto", xlab="auto", ylab="auto"):
+           main="auto", xlab="auto", ylab="auto", weights=None):
     """
     R-style table with row %, column %, and mosaic plot.
     
@@ -17,17 +18,27 @@ def tabpct(row, column, decimal=1, percent="both", graph=True,
         row, column: pd.Series or list-like
         decimal: number of decimals for percentages
         percent: "row", "col", "both"
-        graph: True/False for mosaic plot
+        graph: True/False for mosaic plot, or "lazy" to skip drawing and
+            return a LazyPlot under the "plot" key (matplotlib is only
+            imported when the plot is rendered)
         main, xlab, ylab: plot labels
+        weights: optional frequency weights (one count per row) for
+            aggregated data; counts and percentages are those of the rows
+            repeated that many times
     Returns:
         dict with numeric row and column percentages
     """
+    if graph not in (True, False, "lazy"):
+        raise ValueError("graph must be True, False or 'lazy'.")
 
     row = pd.Series(row)
     column = pd.Series(column)
 
     # Crosstab
-    tab = pd.crosstab(row, column, dropna=False)
+    if weights is None:
+        tab = pd.crosstab(row, column, dropna=False)
+    else:
+        tab = weighted_crosstab(row, column, weights)
 
     # Format helper
     def fmt(x):
@@ -79,69 +90,15 @@ def tabpct(row, column, decimal=1, percent="both", graph=True,
         print()
 
 # --- Plotting Logic ---
+    plot = None
     if graph:
-        tab_plot = tab.copy()
-        tab_plot.index = tab_plot.index.fillna("missing")
-        tab_plot.columns = tab_plot.columns.fillna("missing")
-        tab_plot = tab_plot.iloc[::-1]  # reverse row order
-
-        # Determine colors
-        unique_rows = tab_plot.index.tolist()
-        if len(unique_rows) == 2:
-            row_colors = {str(unique_rows[0]): "#B3FFB3",
-                          str(unique_rows[1]): "#FFB3B3"}
-        else:
-            cmap_list = list(mcolors.TABLEAU_COLORS.values())
-            row_colors = {str(r): cmap_list[i % len(cmap_list)] for i, r in enumerate(unique_rows)}
-
-        fig, ax = plt.subplots(figsize=(8, 6))
-
-        # Calculate percentages
-        if percent == "row":
-            percentage_df = tab_plot.div(tab_plot.sum(axis=1), axis=0) * 100
-        elif percent == "col":
-            percentage_df = tab_plot.div(tab_plot.sum(axis=0), axis=1) * 100
-        else:  # total
-            percentage_df = tab_plot / tab_plot.values.sum() * 100
-
-        bottom = np.zeros(len(tab_plot.columns))
-
-        # Plot each row
-        for i, r_val_raw in enumerate(tab_plot.index):
-            r_val = str(r_val_raw)
-            counts = tab_plot.loc[r_val_raw].values
-            bars = ax.bar(range(len(tab_plot.columns)), counts, bottom=bottom,
-                          label=r_val, color=row_colors.get(r_val, 'gray'))
-
-            # Add labels
-            for col_idx, (bar, count, pct) in enumerate(zip(bars, counts, percentage_df.loc[r_val_raw].values)):
-                if count > 0:
-                    y_pos = bottom[col_idx] + count / 2
-                    label_text = f"{int(count)}\n({pct:.{decimal}f}%)"
-                    ax.text(bar.get_x() + bar.get_width()/2, y_pos,
-                            label_text, ha='center', va='center',
-                            fontsize=10, color='black', weight='bold')
-
-            bottom += counts
-
-        # Labels & Title
-        if main == "auto":
-            title_text = f"Distribution of {column.name} by {row.name}"
-            if len(title_text) > 45:
-                title_text = f"Distribution of {column.name}\nby {row.name}"
-        else:
-            title_text = main
-
-        ax.set_title(title_text, fontsize=16, weight='bold')
-        ax.set_xlabel(xlab if xlab != "auto" else column.name, fontsize=14)
-        ax.set_ylabel(ylab if ylab != "auto" else "Count", fontsize=14)
-        ax.set_xticks(range(len(tab_plot.columns)))
-        ax.set_xticklabels(tab_plot.columns, rotation=0, fontsize=12)
-        ax.tick_params(axis='y', labelsize=12)
-        ax.legend(title=row.name, loc='upper left', bbox_to_anchor=(1, 1))
-
-        plt.tight_layout()
-        plt.show()
+        plot = LazyPlot(
+            lambda ax: _draw_tabpct(ax, tab, row.name, column.name, decimal,
+                                    percent, main, xlab, ylab),
+            figsize=(8, 6))
+        if graph != "lazy":
+            plot.show()
+
     # ---------------- Numeric percentages ----------------
     cpercent_num = tab.div(tab.sum(axis=0), axis=1) * 100
     rpercent_num = tab.div(tab.sum(axis=1), axis=0) * 100
@@ -151,4 +108,70 @@ def tabpct(row, column, decimal=1, percent="both", graph=True,
     rpercent_num.columns.name = column.name
 
     # ---------------- Return ----------------
-    return {"table_row_percent": rpercent_num, "table_column_percent": cpercent_num}
+    result = {"table_row_percent": rpercent_num, "table_column_percent": cpercent_num}
+    if graph == "lazy":
+        result["plot"] = plot
+    return result
+
+
+def _draw_tabpct(ax, tab, row_name, col_name, decimal, percent, main, xlab, ylab):
+    """Draw the stacked bar (mosaic-style) plot of a tabpct table on `ax`."""
+    import matplotlib.colors as mcolors
+
+    tab_plot = tab.copy()
+    tab_plot.index = tab_plot.index.fillna("missing")
+    tab_plot.columns = tab_plot.columns.fillna("missing")
+    tab_plot = tab_plot.iloc[::-1]  # reverse row order
+
+    # Determine colors
+    unique_rows = tab_plot.index.tolist()
+    if len(unique_rows) == 2:
+        row_colors = {str(unique_rows[0]): "#B3FFB3",
+                      str(unique_rows[1]): "#FFB3B3"}
+    else:
+        cmap_list = list(mcolors.TABLEAU_COLORS.values())
+        row_colors = {str(r): cmap_list[i % len(cmap_list)] for i, r in enumerate(unique_rows)}
+
+    # Calculate percentages
+    if percent == "row":
+        percentage_df = tab_plot.div(tab_plot.sum(axis=1), axis=0) * 100
+    elif percent == "col":
+        percentage_df = tab_plot.div(tab_plot.sum(axis=0), axis=1) * 100
+    else:  # total
+        percentage_df = tab_plot / tab_plot.values.sum() * 100
+
+    bottom = np.zeros(len(tab_plot.columns))
+
+    # Plot each row
+    for i, r_val_raw in enumerate(tab_plot.index):
+        r_val = str(r_val_raw)
+        counts = tab_plot.loc[r_val_raw].values
+        bars = ax.bar(range(len(tab_plot.columns)), counts, bottom=bottom,
+                      label=r_val, color=row_colors.get(r_val, 'gray'))
+
+        # Add labels
+        for col_idx, (bar, count, pct) in enumerate(zip(bars, counts, percentage_df.loc[r_val_raw].values)):
+            if count > 0:
+                y_pos = bottom[col_idx] + count / 2
+                label_text = f"{int(count)}\n({pct:.{decimal}f}%)"
+                ax.text(bar.get_x() + bar.get_width()/2, y_pos,
+                        label_text, ha='center', va='center',
+                        fontsize=10, color='black', weight='bold')
+
+        bottom += counts
+
+    # Labels & Title
+    if main == "auto":
+        title_text = f"Distribution of {col_name} by {row_name}"
+        if len(title_text) > 45:
+            title_text = f"Distribution of {col_name}\nby {row_name}"
+    else:
+        title_text = main
+
+    ax.set_title(title_text, fontsize=16, weight='bold')
+    ax.set_xlabel(xlab if xlab != "auto" else col_name, fontsize=14)
+    ax.set_ylabel(ylab if ylab != "auto" else "Count", fontsize=14)
+    ax.set_xticks(range(len(tab_plot.columns)))
+    ax.set_xticklabels(tab_plot.columns, rotation=0, fontsize=12)
+    ax.tick_params(axis='y', labelsize=12)
+    ax.legend(title=row_name, loc='upper left', bbox_to_anchor=(1, 1))
@@ -1,6 +1,15 @@
 #This is for the project itself, for the HW 3 I did ci_prop. Anna 
 # Smoke Test for ci_mean
-from pyepidisplay.ci_mean import ci_mean
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+import pyepidisplay.ci_mean as ci_mean_module
+from pyepidisplay.ci_mean import MeanStats, ci_mean
+from pyepidisplay.data import data
 
 """
 I am still working on this. For HW3, I did ci_prop.
@@ -124,3 +133,141 @@ def test_pattern_se_decreases_with_sample_size():
     for i in range(len(se_values) - 1):
         assert se_values[i] >= se_values[i + 1], \
             f"SE should decrease with sample size: {se_values}"
+
+
+def test_weights_match_expanded_data():
+    """
+    Frequency weights give the same result as the expanded data.
+    """
+    values = np.array([18.0, 20, 25, np.nan, 40])
+    counts = np.array([3, 0, 5, 2, 1])
+    result = ci_mean(values, weights=counts)
+    expected = ci_mean(np.repeat(values, counts))
+    for key, value in expected.items():
+        np.testing.assert_allclose(result[key], value)
+
+
+def test_grouped_matches_per_group_calls():
+    """
+    ci_mean(df, value=, by=) gives one row per group equal to ci_mean of that group.
+    """
+    df = pd.DataFrame({"district": ["a", "a", "a", "b", "b", "c"],
+                       "week": [1, 1, 2, 1, 1, 1],
+                       "y": [1.0, 3.0, 5.0, 2.0, np.nan, 4.0]})
+    result = ci_mean(df, value="y", by=["district", "week"])
+    assert list(result.columns) == ["district", "week", "n", "mean", "sd", "se",
+                                    "ci_lower", "ci_upper"]
+    assert list(result["n"]) == [2, 1, 1, 1]
+    for _, row in result.iterrows():
+        group = df[(df["district"] == row["district"]) & (df["week"] == row["week"])]
+        for key, value in ci_mean(group["y"]).items():
+            np.testing.assert_allclose(row[key], value)
+
+
+def test_grouped_requires_value():
+    """
+    A DataFrame needs value=, and the columns must exist.
+    """
+    df = pd.DataFrame({"y": [1.0, 2.0]})
+    with pytest.raises(ValueError, match="value= is required when x is a DataFrame."):
+        ci_mean(df)
+    with pytest.raises(ValueError, match="Column 'g' not found in DataFrame."):
+        ci_mean(df, value="y", by="g")
+
+
+def test_grouped_missing_key():
+    """
+    Rows whose group key is missing belong to no group.
+    """
+    df = pd.DataFrame({"g": ["a", None, "b", "a"], "v": [1.0, 2.0, 3.0, 5.0]})
+    result = ci_mean(df, value="v", by="g")
+    assert list(result["g"]) == ["a", "b"]
+    assert list(result["n"]) == [2, 1]
+    np.testing.assert_allclose(result["mean"], [3.0, 3.0])
+
+
+def test_bootstrap_matches_scipy():
+    """
+    Percentile and BCa intervals of the skewed HW93 egg counts agree with
+    scipy.stats.bootstrap, and the BCa interval is not symmetric.
+    """
+    epg = data("HW93")["epg"].to_numpy(dtype=float)
+    for method, scipy_method in [("percentile", "percentile"), ("bca", "BCa")]:
+        expected = stats.bootstrap((epg,), np.mean, n_resamples=20_000,
+                                   method=scipy_method, random_state=0).confidence_interval
+        result = ci_mean(epg, method=method, n_boot=20_000, seed=0)
+        np.testing.assert_allclose([result["ci_lower"], result["ci_upper"]],
+                                   [expected.low, expected.high], rtol=0.02)
+    bca = ci_mean(epg, method="bca", n_boot=20_000, seed=0)
+    assert bca["ci_upper"] - bca["mean"] > bca["mean"] - bca["ci_lower"]
+
+
+def test_bootstrap_reproducible_across_jobs():
+    """
+    The same seed gives the same interval whether or not a process pool is used.
+    """
+    values = np.random.default_rng(1).lognormal(size=500)
+    original = ci_mean_module._BOOT_BLOCK_VALUES
+    ci_mean_module._BOOT_BLOCK_VALUES = 500 * 100  # several blocks
+    try:
+        serial = ci_mean(values, method="bca", n_boot=1_000, seed=42)
+        pooled = ci_mean(values, method="bca", n_boot=1_000, seed=42, n_jobs=2)
+    finally:
+        ci_mean_module._BOOT_BLOCK_VALUES = original
+    assert serial == pooled
+    assert serial != ci_mean(values, method="bca", n_boot=1_000, seed=43)
+
+
+def test_bootstrap_slices_large_resamples(monkeypatch):
+    """
+    Data larger than a block are resampled in slices with the same result.
+    """
+    values = np.random.default_rng(2).normal(10, 1, size=300)
+    expected = ci_mean(values, method="percentile", n_boot=1_000, seed=7)
+    drawn = []
+    default_rng = np.random.default_rng
+
+    class RecordingGenerator:
+        def __init__(self, seed):
+            self.rng = default_rng(seed)
+
+        def integers(self, low, high, size):
+            drawn.append(size)
+            return self.rng.integers(low, high, size=size)
+
+    monkeypatch.setattr(np.random, "default_rng", RecordingGenerator)
+    monkeypatch.setattr(ci_mean_module, "_BOOT_BLOCK_VALUES", 64)
+    result = ci_mean(values, method="percentile", n_boot=1_000, seed=7)
+    assert max(rows * cols for rows, cols in drawn) <= 64
+    np.testing.assert_allclose(result["ci_lower"], expected["ci_lower"], rtol=0.01)
+    np.testing.assert_allclose(result["ci_upper"], expected["ci_upper"], rtol=0.01)
+
+
+def test_bootstrap_weights_and_errors():
+    """
+    Weighted resampling approximates resampling the expanded data.
+    """
+    values, counts = np.array([1.0, 2.0, 10.0]), np.array([50, 30, 20])
+    weighted = ci_mean(values, weights=counts, method="percentile", n_boot=20_000, seed=0)
+    expanded = ci_mean(np.repeat(values, counts), method="percentile", n_boot=20_000, seed=0)
+    np.testing.assert_allclose(weighted["ci_lower"], expanded["ci_lower"], rtol=0.05)
+    np.testing.assert_allclose(weighted["ci_upper"], expanded["ci_upper"], rtol=0.05)
+    with pytest.raises(ValueError, match="method must be 't', 'percentile' or 'bca'."):
+        ci_mean(values, method="normal")
+
+
+def test_mean_stats_merge_matches_full_data():
+    """
+    MeanStats of partitions, pickled and merged with +, give the full-data result.
+    """
+    age = data("Outbreak")["age"].to_numpy(dtype=float)
+    parts = [pickle.loads(pickle.dumps(MeanStats.from_values(chunk)))
+             for chunk in np.array_split(age, 7)]
+    total = sum(parts, MeanStats())
+    assert total.n == len(age)
+    np.testing.assert_allclose(total.sum, age.sum())
+    np.testing.assert_allclose(total.sum_of_squares, (age ** 2).sum())
+    for key, value in ci_mean(age).items():
+        np.testing.assert_allclose(ci_mean(total)[key], value)
+    assert len(pickle.dumps(total)) < 200
+    assert np.isnan(ci_mean(MeanStats())["mean"])
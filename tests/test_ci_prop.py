@@ -1,8 +1,9 @@
 # Tests for ci_prop
 
-from pyepidisplay.ci_prop import ci_prop
+from pyepidisplay.ci_prop import ci_prop, PropStats, count_successes
 import warnings
 import numpy as np
+import pandas as pd
 import pytest
 
 # Smoke Test for ci_prop
@@ -158,4 +159,172 @@ def test_pattern_ci_width_decreases_with_sample_size():
     # Verify pattern: CI widths should be decreasing (or equal, never increasing)
     for i in range(len(ci_widths) - 1):
         assert ci_widths[i] >= ci_widths[i + 1], \
-            f"CI width should decrease with sample size: {ci_widths}"
\ No newline at end of file
+            f"CI width should decrease with sample size: {ci_widths}"
+
+def test_prop_stats_merge_matches_full_data():
+    """
+    PropStats of partitions, pickled and merged with +, give the full-data result.
+
+    category: pattern test
+    """
+    import pickle
+
+    values = np.array([1, 0, 1, 1, np.nan, 0, 1, 1, 0, 1])
+    parts = [pickle.loads(pickle.dumps(PropStats.from_values(chunk)))
+             for chunk in np.array_split(values, 3)]
+    total = sum(parts, PropStats())
+    assert (total.x, total.n) == (6, 9)
+    assert ci_prop(total) == ci_prop(values)
+    # Chunks are counted like ci_prop() counts them, whatever their dtype
+    for chunk in [pd.Series([True, None, False, True], dtype="boolean"),
+                  pd.Categorical(["no", "yes", "yes", None])]:
+        stats = PropStats.from_values(chunk)
+        assert (stats.x, stats.n) == (2, 3)
+
+
+def test_vectorized_counts_match_scalar_calls():
+    """
+    Arrays of successes and trials give the same numbers as one call per stratum.
+
+    category: pattern test
+    """
+    x, n = np.array([0, 12, 30, 20]), np.array([15, 40, 95, 20])
+    result = ci_prop(x, n)
+    for i in range(len(x)):
+        expected = ci_prop(int(x[i]), int(n[i]))
+        for key in ("proportion", "se", "ci_lower", "ci_upper"):
+            np.testing.assert_allclose(result[key][i], expected[key])
+    assert result["ci_lower"][0] == 0 and result["ci_upper"][3] == 1
+    np.testing.assert_allclose(ci_prop([1, 2], 10)["proportion"], [0.1, 0.2])
+
+
+def test_grouped_dataframe():
+    """
+    count_successes counts per stratum in one pass; ci_prop(df, by=) adds the intervals.
+
+    category: one_shot test
+    """
+    import pandas as pd
+
+    df = pd.DataFrame({"village": ["a", "a", "b", "b", "b", "c"],
+                       "infected": [1, 0, 1, 1, np.nan, 0]})
+    counts = count_successes(df, "infected", by="village")
+    assert counts.to_dict("list") == {"village": ["a", "b", "c"], "x": [1, 2, 0],
+                                      "n": [2, 2, 1]}
+    result = ci_prop(df, value="infected", by="village")
+    expected = ci_prop(df.loc[df["village"] == "a", "infected"])
+    np.testing.assert_allclose(result.loc[0, ["proportion", "ci_lower", "ci_upper"]],
+                               [expected["proportion"], expected["ci_lower"],
+                                expected["ci_upper"]])
+    with pytest.raises(ValueError, match="Column 'district' not found in DataFrame."):
+        count_successes(df, "infected", by="district")
+
+
+def test_grouped_missing_stratum_key():
+    """
+    Rows whose stratum key is missing belong to no stratum.
+
+    category: edge test
+    """
+    df = pd.DataFrame({"village": ["a", None, "b", np.nan, "a"],
+                       "infected": [1, 1, 0, 1, 0]})
+    counts = count_successes(df, "infected", by="village")
+    assert counts.to_dict("list") == {"village": ["a", "b"], "x": [1, 0], "n": [2, 1]}
+    assert list(ci_prop(df, value="infected", by="village")["n"]) == [2, 1]
+
+
+@pytest.mark.parametrize("method, statsmodels_method", [
+    ("wald", "normal"), ("wilson", "wilson"),
+    ("agresti-coull", "agresti_coull"), ("clopper-pearson", "beta")])
+def test_methods_match_statsmodels(method, statsmodels_method):
+    """
+    Every method agrees with statsmodels' proportion_confint, including x = 0 and x = n.
+
+    category: pattern test
+    """
+    from statsmodels.stats.proportion import proportion_confint
+
+    x = np.array([0, 1, 5, 20, 20, 3])
+    n = np.array([20, 20, 20, 20, 100, 3])
+    result = ci_prop(x, n, method=method)
+    lower, upper = proportion_confint(x, n, alpha=0.05, method=statsmodels_method)
+    np.testing.assert_allclose(result["ci_lower"], np.clip(lower, 0, 1), atol=1e-12)
+    np.testing.assert_allclose(result["ci_upper"], np.clip(upper, 0, 1), atol=1e-12)
+    scalar = ci_prop(5, 20, method=method)
+    np.testing.assert_allclose([scalar["ci_lower"], scalar["ci_upper"]],
+                               [result["ci_lower"][2], result["ci_upper"][2]])
+
+
+def test_clopper_pearson_repeated_pairs():
+    """
+    Repeated small (x, n) pairs reuse memoised beta quantiles with identical results.
+
+    category: edge test
+    """
+    rng = np.random.default_rng(0)
+    n = rng.integers(1, 50, 10_000)
+    x = rng.binomial(n, 0.1)
+    first = ci_prop(x, n, method="clopper-pearson")
+    second = ci_prop(x, n, method="clopper-pearson")
+    np.testing.assert_array_equal(first["ci_lower"], second["ci_lower"])
+    assert first["ci_lower"][x == 0].max() == 0
+    with pytest.raises(ValueError, match="method must be one of"):
+        ci_prop(1, 2, method="exact")
+
+
+@pytest.mark.parametrize("values", [
+    np.array([True, False, True, True]),
+    [True, False, True, True],
+    np.array([1, 0, 1, 1], dtype=np.int8),
+])
+def test_counts_without_missing(values):
+    """
+    Boolean, integer and plain-list inputs give the same counts as the float path.
+
+    category: pattern test
+    """
+    expected = ci_prop([1.0, 0.0, 1.0, 1.0])
+    result = ci_prop(values)
+    assert result["proportion"] == expected["proportion"] == 0.75
+    assert result["ci_lower"] == expected["ci_lower"]
+
+
+def test_nullable_and_categorical_inputs():
+    """
+    Nullable boolean / Int8 data skip <NA>; two-level categoricals count the success level.
+
+    category: edge test
+    """
+    import pandas as pd
+
+    expected = ci_prop([1, 0, 1])
+    for dtype in ("boolean", "Int8"):
+        result = ci_prop(pd.Series([1, 0, None, 1], dtype=dtype))
+        assert result["proportion"] == expected["proportion"]
+        assert result["ci_upper"] == expected["ci_upper"]
+    sick = pd.Categorical(["yes", "no", None, "yes"], categories=["no", "yes"])
+    assert ci_prop(sick)["proportion"] == expected["proportion"]
+    flags = pd.Categorical([1, 0, 1], categories=[1, 0])
+    assert ci_prop(flags)["proportion"] == expected["proportion"]
+    with pytest.raises(ValueError, match="Categorical data must have exactly two levels."):
+        ci_prop(pd.Categorical(["a", "b", "c"]))
+    for strings in (pd.Series(["yes", "no", None]), pd.Series(["yes", "no"], dtype="string")):
+        with pytest.raises(TypeError, match="x must hold 0/1, boolean or two-level"):
+            ci_prop(strings)
+
+
+def test_oswego_typed_and_object_columns():
+    """
+    Oswego's bool/boolean columns count the same as their untyped object copies.
+
+    category: one_shot test
+    """
+    from pyepidisplay.data import data
+
+    df = data("Oswego")
+    for column in ("ill", "mashedpota"):
+        typed = ci_prop(df[column])
+        untyped = ci_prop(df[column].astype(object))
+        assert typed["proportion"] == untyped["proportion"]
+        assert typed["ci_lower"] == untyped["ci_lower"]
+    assert ci_prop(df["ill"])["proportion"] == pytest.approx(46 / 75)
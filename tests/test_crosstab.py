@@ -2,7 +2,8 @@
 
 import pytest
 import pandas as pd
-from pyepidisplay.crosstab_function import my_crosstab   # adjust filename if needed
+from pyepidisplay.crosstab_function import my_crosstab, my_crosstab_chunks
+from pyepidisplay.data import data, stream
 
 def test_one_shot(capsys):
     """One-shot test: verify output structure on known input."""
@@ -66,3 +67,22 @@ def test_pattern_alternating_categories(capsys):
     captured = capsys.readouterr()
     assert "Chi-square Test" in captured.out
 
+
+def test_chunks_match_full_data(capsys):
+    """Pattern test: chunked counts print the same display as my_crosstab."""
+    compaq = data("Compaq")
+    my_crosstab(compaq["stage"], compaq["hospital"])
+    expected = capsys.readouterr().out
+    my_crosstab_chunks("stage", "hospital", stream("Compaq", chunksize=100))
+    assert capsys.readouterr().out == expected
+
+
+def test_weights_match_expanded_data(capsys):
+    """Pattern test: frequency weights print the same display as the expanded rows."""
+    df = data("Outbreak")
+    compact = df.groupby(["sex", "beefcurry"]).size().rename("n").reset_index()
+    expanded = compact.loc[compact.index.repeat(compact["n"])].reset_index(drop=True)
+    my_crosstab(expanded["sex"], expanded["beefcurry"])
+    expected = capsys.readouterr().out
+    my_crosstab(compact["sex"], compact["beefcurry"], weights=compact["n"])
+    assert capsys.readouterr().out == expected
@@ -2,10 +2,14 @@
 Tests for the entropy function
 """
 # tableStack_test.py
+import os
 import pandas as pd
 import numpy as np
 #from pyepidisplay.tableStack import tableStack
-from pyepidisplay.data import data
+from pyepidisplay.data import (data, cache_info, cache_clear, cache_resize,
+                               info, build_manifest, infer_schema, stream,
+                               synthesize)
+from pyepidisplay.datasets.manifest import DATASETS
 from pyepidisplay.datasets import DATA_PATH
 import pytest
 
@@ -152,4 +156,391 @@ def test_compare_python_r_outbreak_rpy2():
     #     assert np.array_equal(py_values[~numeric_mask_final], r_values[~numeric_mask_final]), \
     #         "Non-numeric values mismatch between Python and R"
 
-# ----------------------------------------------------------
\ No newline at end of file
+# ----------------------------------------------------------
+
+# Dataset cache tests
+def test_cache_hits_and_misses():
+    """
+    category: one_shot test
+    """
+    cache_clear()
+    data("Outbreak")
+    data("outbreak")
+    data("BP")
+    info = cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.currsize == 2
+
+
+def test_cache_returns_independent_frames():
+    """
+    Modifying a returned frame must not corrupt the cached copy.
+
+    category: pattern test
+    """
+    first = data("Outbreak")
+    expected_age = first.loc[0, "age"]
+    first.loc[0, "age"] = -1
+    first["extra"] = 1
+    second = data("Outbreak")
+    assert second.loc[0, "age"] == expected_age
+    assert "extra" not in second.columns
+
+
+def test_cache_eviction():
+    """
+    category: edge test
+    """
+    cache_clear()
+    cache_resize(2)
+    try:
+        for name in ["Outbreak", "BP", "Decay"]:
+            data(name)
+        assert cache_info().currsize == 2
+        data("Outbreak")  # evicted, parsed again
+        assert cache_info().misses == 4
+    finally:
+        cache_resize(16)
+        cache_clear()
+
+
+def test_cache_invalidated_by_mtime(tmp_path, monkeypatch):
+    """
+    A dataset file edited on disk is parsed again.
+
+    category: edge test
+    """
+    monkeypatch.setattr("pyepidisplay.data.DATA_PATH", str(tmp_path))
+    path = tmp_path / "Suwit.csv"
+    path.write_text("a\n1\n")
+    assert data("Suwit")["a"].tolist() == [1]
+    path.write_text("a\n2\n")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    assert data("Suwit")["a"].tolist() == [2]
+
+
+# Manifest tests
+def test_manifest_matches_files():
+    """
+    The generated manifest must be regenerated when a dataset changes.
+
+    category: pattern test
+    """
+    assert build_manifest() == DATASETS
+
+
+def test_no_directory_scan(monkeypatch):
+    """
+    data() resolves names from the manifest instead of listing DATA_PATH.
+
+    category: pattern test
+    """
+    def fail(*args):
+        raise AssertionError("os.listdir called")
+
+    monkeypatch.setattr(os, "listdir", fail)
+    assert "Outbreak" in data()
+    assert data("OUTBREAK").shape == (1094, 13)
+
+
+def test_info():
+    """
+    category: one_shot test
+    """
+    entry = info("outbreak")
+    assert entry["n_rows"] == 1094
+    assert entry["n_cols"] == 13
+    assert list(entry["dtypes"])[0] == "id"
+    summary = info()
+    assert list(summary["name"]) == data()
+
+
+@pytest.mark.parametrize("name", DATASETS)
+def test_parquet_copy_matches_csv(name):
+    """
+    The bundled Parquet copies hold the same data and dtypes as the CSVs.
+
+    category: pattern test
+    """
+    pytest.importorskip("pyarrow")
+    from_csv = data(name, format="csv")
+    from_parquet = data(name, format="parquet")
+    assert list(from_parquet.dtypes) == list(from_csv.dtypes)
+    pd.testing.assert_frame_equal(
+        from_parquet.astype(object).where(from_parquet.notna(), None),
+        from_csv.astype(object).where(from_csv.notna(), None),
+    )
+
+
+def test_typed_schema():
+    """
+    Repeated strings load as category, ISO dates as datetime64, integers as
+    int64, and as compact dtypes only with typed="compact".
+
+    category: one_shot test
+    """
+    compaq = data("Compaq")
+    for col in ["hospital", "stage", "agegr", "ses"]:
+        assert isinstance(compaq[col].dtype, pd.CategoricalDtype)
+    assert compaq["status"].dtype == np.int64
+    compact = data("Compaq", typed="compact")
+    assert compact["status"].dtype == np.int8
+    assert isinstance(compact["stage"].dtype, pd.CategoricalDtype)
+    with pytest.raises(ValueError, match="typed must be True, False or 'compact'."):
+        data("Compaq", typed="small")
+    assert data("IudDiscontinue")["d23"].dtype == "category"
+    assert pd.api.types.is_datetime64_any_dtype(data("BP")["birthdate"])
+    assert pd.api.types.is_datetime64_any_dtype(data("IudAdmit")["idate"])
+    assert data("IudFollowup")["vdate"].isna().sum() == 0
+    assert data("Oswego")["mashedpota"].dtype == "boolean"
+
+
+def test_untyped_load():
+    """
+    category: one_shot test
+    """
+    raw = data("Compaq", typed=False)
+    assert raw["status"].dtype == np.int64
+    assert not isinstance(raw["stage"].dtype, pd.CategoricalDtype)
+    with pytest.raises(ValueError, match="typed=False"):
+        data("Compaq", format="parquet", typed=False)
+
+
+@pytest.mark.parametrize("name", DATASETS)
+def test_typed_values_and_memory(name):
+    """
+    Typing keeps every value and never uses more memory.
+
+    category: pattern test
+    """
+    raw = data(name, typed=False)
+    typed = data(name, format="csv")
+    for col in raw.columns:
+        if pd.api.types.is_datetime64_any_dtype(typed[col]):
+            expected = pd.to_datetime(raw[col])
+        else:
+            expected = raw[col]
+        assert typed[col].astype(object).where(typed[col].notna(), None).tolist() == \
+            expected.astype(object).where(expected.notna(), None).tolist()
+    assert typed.memory_usage(deep=True).sum() <= raw.memory_usage(deep=True).sum()
+
+
+def test_smallest_int_headroom():
+    """
+    Integers keep room for max - min and reversed scales.
+
+    category: edge test
+    """
+    frame = pd.DataFrame({"a": [-100, 100], "b": [1, 5], "c": [0, 40000]})
+    assert dict(infer_schema(frame, downcast=True)) == {"a": "int16", "b": "int8", "c": "int32"}
+    assert dict(infer_schema(frame)) == {"a": "int64", "b": "int64", "c": "int64"}
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_default_integers_are_safe_for_arithmetic(fmt):
+    """
+    Default-loaded integer columns are int64, so squares and products do not wrap.
+
+    category: edge test
+    """
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    bp = data("BP", format=fmt)
+    raw = data("BP", typed=False)
+    assert bp["sbp"].dtype == np.int64
+    assert (bp["sbp"] ** 2).tolist() == [v * v for v in raw["sbp"].tolist()]
+    assert (bp["sbp"] ** 2).min() > 0
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_projection_and_filter(fmt):
+    """
+    Projected/filtered reads match selecting from the full dataset.
+
+    category: pattern test
+    """
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    cache_clear()
+    full = data("Attitudes", format=fmt)
+    narrow = data("Attitudes", format=fmt, columns=["qa2", "sex"],
+                  filter=[("sex", "==", "male"), ("qa1", ">", 3)])
+    expected = full.loc[(full["sex"] == "male") & (full["qa1"] > 3), ["qa2", "sex"]]
+    pd.testing.assert_frame_equal(narrow, expected.reset_index(drop=True))
+    # the same answer is served from the cached full frame
+    cached = data("Attitudes", format=fmt, columns=["qa2", "sex"],
+                  filter=[("sex", "==", "male"), ("qa1", ">", 3)])
+    pd.testing.assert_frame_equal(cached, narrow)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_filter_dates_and_missing(fmt):
+    """
+    Date filters accept strings and missing values never match.
+
+    category: edge test
+    """
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    cache_clear()
+    bp = data("BP", format=fmt, filter=[("birthdate", ">=", "1950-01-01")])
+    assert (bp["birthdate"] >= pd.Timestamp("1950-01-01")).all()
+    not_yes = data("BP", format=fmt, filter=[("saltadd", "!=", "yes")])
+    assert not_yes["saltadd"].notna().all()
+    subset = data("Compaq", format=fmt, columns=["stage"],
+                  filter=[("stage", "in", ["Stage 1", "Stage 2"])])
+    assert set(subset["stage"]) == {"Stage 1", "Stage 2"}
+
+
+@pytest.mark.parametrize("source", ["csv", "parquet", "cached"])
+def test_filter_not_in_skips_missing(source):
+    """
+    "not in" never matches missing values, whatever the format or cache state.
+
+    category: edge test
+    """
+    if source != "csv":
+        pytest.importorskip("pyarrow")
+    cache_clear()
+    if source == "cached":
+        data("Outbreak")
+    onset = data("Outbreak", format="csv" if source == "csv" else "parquet",
+                 columns=["onset"], filter=[("onset", "not in", [15.0, 16.0])])
+    full = data("Outbreak", format="csv")["onset"]
+    assert onset["onset"].notna().all()
+    assert len(onset) == (full.notna() & ~full.isin([15.0, 16.0])).sum()
+
+
+def test_projection_errors():
+    """
+    category: edge test
+    """
+    with pytest.raises(ValueError, match="Column 'nope' not found in dataset 'Outbreak'."):
+        data("Outbreak", columns=["age", "nope"])
+    with pytest.raises(ValueError, match="Invalid filter"):
+        data("Outbreak", filter=[("age", "~", 3)])
+
+
+def test_stream_bundled_dataset():
+    """
+    Chunks of a bundled dataset concatenate to the typed dataset.
+
+    category: pattern test
+    """
+    chunks = list(stream("Outbreak", chunksize=300))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 194]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), data("Outbreak"))
+
+
+def test_stream_external_csv(tmp_path):
+    """
+    External CSVs are streamed with dates and categories detected from a sample.
+
+    category: one_shot test
+    """
+    path = tmp_path / "extract.csv"
+    data("BP", typed=False).to_csv(path, index=False)
+    chunks = list(stream(str(path), chunksize=40, columns=["sex", "sbp", "birthdate"],
+                         filter=[("sbp", ">", 120)]))
+    assert [len(chunk) for chunk in chunks] == [
+        (data("BP")["sbp"].iloc[i:i + 40] > 120).sum() for i in (0, 40, 80)]
+    assert list(chunks[0].columns) == ["sex", "sbp", "birthdate"]
+    assert chunks[0]["sex"].dtype == "category"
+    assert pd.api.types.is_datetime64_any_dtype(chunks[0]["birthdate"])
+
+
+def test_stream_external_csv_mixed_tail(tmp_path):
+    """
+    A later chunk that does not fit a type detected from the sample is read untyped.
+
+    category: edge test
+    """
+    path = tmp_path / "mixed.csv"
+    rows = [f"2020-01-{i % 28 + 1:02d},{'True' if i % 3 else ''}" for i in range(100)]
+    path.write_text("visit,fever\n" + "\n".join(rows + ["unknown,maybe"]) + "\n")
+    chunks = list(stream(str(path), chunksize=50))
+    assert [len(chunk) for chunk in chunks] == [50, 50, 1]
+    assert pd.api.types.is_datetime64_any_dtype(chunks[1]["visit"])
+    assert chunks[1]["fever"].dtype == "boolean"
+    assert chunks[2]["visit"].tolist() == ["unknown"]
+    assert chunks[2]["fever"].tolist() == ["maybe"]
+
+
+def test_stream_errors():
+    """
+    category: edge test
+    """
+    with pytest.raises(ValueError, match="chunksize must be a positive integer."):
+        stream("Outbreak", chunksize=0)
+    with pytest.raises(ValueError, match="Column 'nope' not found in dataset 'Outbreak'."):
+        stream("Outbreak", columns=["nope"])
+
+
+def test_synthesize_keeps_dtypes_marginals_and_missingness():
+    """
+    category: pattern test
+    """
+    source = data("BP")
+    result = synthesize("BP", n=20_000, seed=0)
+    assert len(result) == 20_000
+    pd.testing.assert_series_equal(result.dtypes, source.dtypes)
+    np.testing.assert_allclose(result.isna().mean(), source.isna().mean(), atol=0.02)
+    np.testing.assert_allclose(result["sex"].value_counts(normalize=True).sort_index(),
+                               source["sex"].value_counts(normalize=True).sort_index(),
+                               atol=0.02)
+    assert set(result["saltadd"].dropna()) <= set(source["saltadd"].dropna())
+
+
+def test_synthesize_reproducible_and_chunked():
+    """
+    category: one_shot test
+    """
+    whole = synthesize("Outbreak", n=2_500, seed=7)
+    pd.testing.assert_frame_equal(whole, synthesize("Outbreak", n=2_500, seed=7))
+    chunks = list(synthesize("Outbreak", n=2_500, seed=7, chunksize=1_000))
+    assert [len(chunk) for chunk in chunks] == [1_000, 1_000, 500]
+    assert list(pd.concat(chunks).index) == list(range(2_500))
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_synthesize_to_disk(tmp_path, suffix):
+    """
+    category: one_shot test
+    """
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"bp{suffix}")
+    assert synthesize("BP", n=2_500, seed=1, chunksize=1_000, path=path) == path
+    result = pd.concat(stream(path, chunksize=1_000), ignore_index=True)
+    assert len(result) == 2_500
+    assert list(result.columns) == list(data("BP").columns)
+    assert result["sex"].dtype == "category"
+    assert pd.api.types.is_datetime64_any_dtype(result["birthdate"])
+
+
+def test_synthesize_errors():
+    """
+    category: edge test
+    """
+    with pytest.raises(ValueError, match="n must be a non-negative integer."):
+        synthesize("BP", n=-1)
+    with pytest.raises(ValueError, match="path must end with '.csv' or '.parquet'."):
+        synthesize("BP", n=10, path="bp.xlsx")
+    assert synthesize("BP", n=0).shape == (0, 6)
+
+
+def test_wrong_format():
+    """
+    category: edge test
+    """
+    with pytest.raises(ValueError, match="format must be 'auto', 'csv' or 'parquet'."):
+        data("Outbreak", format="xlsx")
+
+
+def test_info_wrong_dataset():
+    """
+    category: edge test
+    """
+    with pytest.raises(ValueError, match="Dataset 'nope' not found."):
+        info("nope")
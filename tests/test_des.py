@@ -63,4 +63,136 @@ def compare_py_r_des(df):
     match = (py_clean == r_clean)
 
     print(f"\nMATCH: {match}\n")
-    return match
\ No newline at end of file
+    return match
+
+
+def test_des_dataset_name_matches_loaded():
+    """
+    des() on a bundled dataset name answers from the manifest.
+    """
+    assert repr(des("outbreak")) == repr(des(df))
+
+
+def test_des_dataset_name_not_found():
+    with pytest.raises(ValueError, match="Dataset 'nope' not found."):
+        des("nope")
+
+
+def test_des_labels_and_classes_on_wide_frame():
+    """
+    Classes, list labels and dict labels line up with the columns of a wide frame.
+
+    category: pattern test
+    """
+    import numpy as np
+    import pandas as pd
+
+    wide = pd.DataFrame(np.zeros((3, 500)), columns=[f"g{i}" for i in range(500)])
+    wide["flag"] = pd.array([True, None, False], dtype="boolean")
+    wide.attrs["var.labels"] = {"g1": "gene 1", "flag": "QC flag"}
+    table = des(wide).table
+    assert table["Class"].tolist() == ["float64"] * 500 + ["boolean"]
+    assert table["Description"].tolist()[:3] == ["", "gene 1", ""]
+    assert table["Description"].iloc[-1] == "QC flag"
+    wide.attrs["var.labels"] = ["first", "second"]
+    assert des(wide).table["Description"].tolist()[:3] == ["first", "second", ""]
+
+
+def test_des_profile_matches_pandas():
+    """
+    memory=, missing= and distinct= agree with pandas on the bundled datasets.
+
+    category: one_shot test
+    """
+    for name in ("Outbreak", "Oswego"):
+        frame = data(name)
+        table = des(frame, memory=True, missing=True, distinct=True).table
+        assert table["Memory"].tolist() == frame.memory_usage(index=False, deep=True).tolist()
+        assert table["Missing"].tolist() == frame.isna().sum().tolist()
+        assert table["Distinct"].tolist() == frame.nunique().tolist()
+
+
+def test_des_distinct_estimate_on_tall_frame():
+    """
+    Beyond the exact limit, HyperLogLog estimates stay within a few percent.
+
+    category: edge test
+    """
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    n = 200_000
+    tall = pd.DataFrame({"id": np.arange(n), "value": rng.integers(0, 20_000, n),
+                         "code": rng.integers(0, 5_000, n).astype(str),
+                         "low": np.where(rng.random(n) < 0.1, np.nan, rng.integers(0, 3, n))})
+    table = des(tall, missing=True, distinct=True).table
+    np.testing.assert_allclose(table["Distinct"], tall.nunique(), rtol=0.05)
+    assert table["Distinct"].iloc[-1] == 3
+    sampled = des(tall, missing=True, sample=10_000, seed=1)
+    assert "sample of 10000 rows" in sampled.header
+    assert abs(sampled.table["Missing"].iloc[-1] - tall["low"].isna().sum()) < 0.2 * n * 0.1
+    with pytest.raises(ValueError, match="sample must be a positive number of rows."):
+        des(tall, missing=True, sample=0)
+
+
+def test_des_file_matches_loaded(tmp_path):
+    """
+    des() on a CSV path matches des() of the loaded frame, sidecar labels included.
+
+    category: pattern test
+    """
+    import json
+    import pandas as pd
+
+    frame = pd.DataFrame({"id": range(25_000), "ill": [True, False] * 12_500,
+                          "weight": [60.5, None] * 12_500})
+    frame.to_csv(tmp_path / "extract.csv", index=False)
+    labels = {"datalabel": "Field extract", "var.labels": {"ill": "Ill after lunch"}}
+    (tmp_path / "extract.labels.json").write_text(json.dumps(labels))
+    frame.attrs.update(labels)
+    assert repr(des(tmp_path / "extract.csv")) == repr(des(frame))
+
+
+def test_des_parquet_matches_loaded(tmp_path):
+    """
+    des() on a Parquet path matches des() of the loaded frame; a sidecar wins over attrs.
+
+    category: pattern test
+    """
+    import json
+    import pandas as pd
+
+    pytest.importorskip("pyarrow")
+    frame = pd.DataFrame({"id": range(25_000), "ill": [True, False] * 12_500,
+                          "weight": [60.5, None] * 12_500})
+    labels = {"datalabel": "Field extract", "var.labels": {"ill": "Ill after lunch"}}
+    (tmp_path / "extract.labels.json").write_text(json.dumps(labels))
+    frame.attrs.update(labels)
+    frame.to_parquet(tmp_path / "other.parquet")
+    assert repr(des(str(tmp_path / "other.parquet"))) == repr(des(frame))
+    frame.attrs = {"datalabel": "From attrs"}
+    frame.to_parquet(tmp_path / "extract.parquet")
+    result = des(tmp_path / "extract.parquet")
+    assert result.header.startswith("Field extract")  # the sidecar wins over attrs
+
+
+def test_des_file_edge_cases(tmp_path):
+    """
+    A missing final newline, a header-only file, a missing path and profiling a path.
+
+    category: edge test
+    """
+    import pandas as pd
+
+    (tmp_path / "short.csv").write_text("a,b\n1,2\n3,4")
+    assert "No. of observations: 2" in des(tmp_path / "short.csv").header
+    (tmp_path / "empty.csv").write_text("a,b\n")
+    assert "No. of observations: 0" in des(tmp_path / "empty.csv").header
+    with pytest.raises(FileNotFoundError):
+        des(tmp_path / "absent.csv")
+    with pytest.raises(ValueError, match="memory, missing and distinct need a loaded DataFrame."):
+        des("Outbreak", missing=True)
+    pd.DataFrame({"a": [1]}).to_csv(tmp_path / "x.csv.gz", index=False)
+    with pytest.raises(ValueError, match="uncompressed CSV or Parquet"):
+        des(tmp_path / "x.csv.gz")
@@ -0,0 +1,61 @@
+# Tests for the lazy submodule loading in pyepidisplay/__init__.py
+
+import subprocess
+import sys
+
+import pytest
+import pyepidisplay
+
+HEAVY_MODULES = ["matplotlib", "seaborn", "sklearn", "statsmodels"]
+
+
+def _modules_after(statement):
+    """Run `statement` in a fresh interpreter and return the loaded module names."""
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+def test_import_budget():
+    """
+    `import pyepidisplay` alone must not import the plotting/modelling stack.
+
+    category: pattern test
+    """
+    loaded = _modules_after("import pyepidisplay")
+    for module in HEAVY_MODULES:
+        assert module not in loaded, f"import pyepidisplay pulled in {module}"
+
+
+def test_light_submodule_budget():
+    """
+    Loading ci_prop through the package stays free of the plotting stack.
+
+    category: pattern test
+    """
+    loaded = _modules_after("import pyepidisplay; pyepidisplay.ci_prop")
+    for module in HEAVY_MODULES:
+        assert module not in loaded, f"pyepidisplay.ci_prop pulled in {module}"
+
+
+def test_attribute_access_loads_submodule():
+    """
+    category: one-shot test
+    """
+    assert callable(pyepidisplay.table_stack.table_stack)
+    assert callable(pyepidisplay.ci_prop.ci_prop)
+    assert "tab1" in dir(pyepidisplay)
+    assert "tab1" in pyepidisplay.__all__
+
+
+def test_unknown_attribute_raises():
+    """
+    category: edge test
+    """
+    with pytest.raises(AttributeError, match="no attribute 'not_a_module'"):
+        pyepidisplay.not_a_module
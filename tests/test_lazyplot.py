@@ -0,0 +1,90 @@
+# Tests for the headless / deferred plotting path (LazyPlot)
+
+import subprocess
+import sys
+
+import pytest
+from pyepidisplay.data import data
+from pyepidisplay.dotplot import dotplot
+from pyepidisplay.lazyplot import LazyPlot
+from pyepidisplay.tab1 import tab1
+from pyepidisplay.tabpct import tabpct
+
+df = data("Outbreak")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def test_headless_calls_never_import_matplotlib():
+    """
+    Compute-only and lazy calls must not import matplotlib or seaborn.
+
+    category: pattern test
+    """
+    code = (
+        "import sys\n"
+        "from pyepidisplay.data import data\n"
+        "from pyepidisplay.tab1 import tab1\n"
+        "from pyepidisplay.tabpct import tabpct\n"
+        "from pyepidisplay.dotplot import dotplot\n"
+        "df = data('Outbreak')\n"
+        "tab1('sex', df, graph=False)\n"
+        "tab1('sex', df, graph='lazy')\n"
+        "tabpct(df['sex'], df['beefcurry'], graph=False, percent='none')\n"
+        "tabpct(df['sex'], df['beefcurry'], graph='lazy', percent='none')\n"
+        "dotplot(df['age'], graph='lazy')\n"
+        "print('matplotlib' in sys.modules, 'seaborn' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code],
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_tab1_lazy_returns_table_and_plot():
+    """
+    category: one-shot test
+    """
+    table, plot = tab1("sex", df, graph="lazy")
+    assert isinstance(plot, LazyPlot)
+    assert table.equals(tab1("sex", df, graph=False))
+    assert "not rendered" in repr(plot)
+
+
+def test_tabpct_lazy_plot_key():
+    """
+    category: one-shot test
+    """
+    result = tabpct(df["sex"], df["beefcurry"], graph="lazy", percent="none")
+    assert isinstance(result["plot"], LazyPlot)
+    assert "plot" not in tabpct(df["sex"], df["beefcurry"], graph=False,
+                                percent="none")
+
+
+def test_render_and_png():
+    """
+    category: pattern test
+    """
+    plot = dotplot(df["age"], by=df["sex"], graph="lazy")
+    figure = plot.render()
+    assert plot.render() is figure  # rendered only once
+    assert plot._repr_png_().startswith(PNG_SIGNATURE)
+
+
+def test_savefig(tmp_path):
+    """
+    category: one-shot test
+    """
+    _, plot = tab1("sex", df, graph="lazy")
+    path = tmp_path / "sex.png"
+    plot.savefig(path)
+    assert path.read_bytes().startswith(PNG_SIGNATURE)
+
+
+def test_invalid_graph_argument():
+    """
+    category: edge test
+    """
+    with pytest.raises(ValueError, match="graph must be True, False or 'lazy'."):
+        tab1("sex", df, graph="later")
+    with pytest.raises(ValueError, match="graph must be True, False or 'lazy'."):
+        dotplot(df["age"], graph="later")
@@ -5,7 +5,10 @@
 import pytest
 import pandas as pd
 import numpy as np
-from pyepidisplay.summ_function import summ
+import pickle
+from pyepidisplay.summ_function import summ, summ_chunks, SummAccumulator
+from pyepidisplay.data import data, stream
+from pyepidisplay.lazyplot import LazyPlot
 
 def test_one_shot():
     """
@@ -61,3 +64,192 @@ def test_pattern_alternating_values():
     np.testing.assert_allclose(result["median"], 1.5)
     return
 
+
+def test_summ_chunks_matches_summ():
+    """
+    category: pattern test
+    """
+    for name, column in [("Outbreak", "age"), ("Outbreak", "onset"), ("HW93", "epg")]:
+        expected = summ(data(name)[column])
+        result = summ_chunks(column, stream(name, chunksize=97))
+        for key, value in expected.items():
+            np.testing.assert_allclose(result[key], value)
+
+
+def test_summ_chunks_series_and_empty():
+    """
+    category: edge test
+    """
+    result = summ_chunks([pd.Series([1, 2]), pd.Series([np.nan, 3, 4])])
+    assert result["obs"] == 4
+    np.testing.assert_allclose(result["median"], 2.5)
+    assert np.isnan(summ_chunks([])["mean"])
+    assert summ_chunks(None, [pd.Series([1, 2])])["obs"] == 2
+
+
+def test_summ_dataframe_matches_series():
+    """
+    category: pattern test
+    """
+    df = data("BP")
+    result = summ(df).set_index("variable")
+    assert list(result.index) == ["id", "sbp", "dbp"]
+    for column in result.index:
+        for key, value in summ(df[column]).items():
+            np.testing.assert_allclose(result.loc[column, key], value)
+
+
+def test_summ_by_group():
+    """
+    category: pattern test
+    """
+    df = data("Outbreak")[["sex", "age", "exptime"]]
+    result = summ(df, by="sex")
+    assert list(result.columns) == ["sex", "variable", "obs", "mean", "median",
+                                    "s.d.", "min", "max"]
+    assert len(result) == 4
+    for (sex, column), row in result.set_index(["sex", "variable"]).iterrows():
+        expected = summ(df.loc[df["sex"] == sex, column])
+        for key, value in expected.items():
+            np.testing.assert_allclose(row[key], value)
+
+
+def test_summ_by_missing_key_and_large_values():
+    """
+    category: edge test
+    """
+    df = data("BP")[["sex", "saltadd", "sbp"]]
+    df["stamp"] = 1.7e9 + df["sbp"]
+    result = summ(df, by=["sex", "saltadd"]).set_index(["sex", "saltadd", "variable"])
+    assert not result.index.get_level_values("saltadd").isna().any()
+    for (sex, salt, column), row in result.iterrows():
+        expected = summ(df.loc[(df["sex"] == sex) & (df["saltadd"] == salt), column])
+        for key, value in expected.items():
+            np.testing.assert_allclose(row[key], value)
+
+
+def test_summ_by_shares_the_value_name():
+    """
+    category: edge test
+    """
+    age = data("Outbreak")["age"]
+    result = summ(age, by=age > 30)
+    assert list(result.columns[:2]) == ["age", "variable"]
+    assert list(result["age"]) == [False, True]
+    assert list(result["variable"]) == ["age", "age"]
+    assert result["obs"].sum() == age.notna().sum()
+    unnamed = summ(pd.Series([1.0, 2.0, 3.0]), by=pd.Series(["a", "b", "a"], name="x"))
+    assert list(unnamed["x"]) == ["a", "b"] and list(unnamed["obs"]) == [2, 1]
+    named = summ(pd.Series([1.0, 2.0, 3.0], name="group"), by=["a", "b", "a"])
+    assert list(named["group"]) == ["a", "b"] and list(named["variable"]) == ["group"] * 2
+
+
+def test_summ_by_errors():
+    """
+    category: edge test
+    """
+    with pytest.raises(ValueError, match="by= of a Series must be group labels"):
+        summ(pd.Series([1, 2]), by="sex")
+    with pytest.raises(ValueError, match="Column 'nope' not found in DataFrame."):
+        summ(data("BP"), by="nope")
+    with pytest.raises(ValueError, match="DataFrame has no numeric columns to summarize."):
+        summ(data("BP")[["sex"]], by="sex")
+
+
+def test_accumulator_merge_across_partitions():
+    """
+    category: pattern test
+    """
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.lognormal(3, 2, 100_000), -rng.exponential(5, 10_000),
+                             np.zeros(100), [np.nan] * 10])
+    partials = [SummAccumulator().update(part) for part in np.array_split(values, 5)]
+    merged = pickle.loads(pickle.dumps(partials[0]))
+    for partial in partials[1:]:
+        merged.merge(pickle.loads(pickle.dumps(partial)))
+    result = summ(merged)
+    expected = summ(pd.Series(values))
+    for key in ["obs", "mean", "s.d.", "min", "max"]:
+        np.testing.assert_allclose(result[key], expected[key])
+    assert abs(result["median"] - expected["median"]) <= 0.01 * abs(expected["median"])
+    assert len(merged.counts) <= merged.max_bins
+
+
+def test_accumulator_median_accuracy():
+    """
+    category: pattern test
+    """
+    for values in [np.arange(1, 102.0), -np.arange(1, 102.0), np.array([-3.0, -1, 0, 0, 2])]:
+        for accuracy in [0.05, 0.001]:
+            median = SummAccumulator(accuracy).update(values).median()
+            assert abs(median - np.median(values)) <= accuracy * abs(np.median(values))
+    exact = SummAccumulator(None).update([1, 2, 2]).merge(SummAccumulator(None).update([3, 10]))
+    assert exact.median() == 2
+    np.testing.assert_allclose(summ_chunks([pd.Series([1, 2]), pd.Series([3, 10])],
+                                           relative_accuracy=0.01)["median"], 2.5, rtol=0.01)
+
+
+def test_accumulator_errors():
+    """
+    category: edge test
+    """
+    with pytest.raises(ValueError, match="relative_accuracy must be between 0 and 1, or None."):
+        SummAccumulator(1.5)
+    with pytest.raises(ValueError, match="Cannot merge accumulators with different"):
+        SummAccumulator(0.01).merge(SummAccumulator(0.02).update([1]))
+    assert np.isnan(summ(SummAccumulator())["median"])
+
+
+def test_summ_graph_downsamples():
+    """
+    category: pattern test
+    """
+    values = pd.Series(np.random.default_rng(0).normal(size=100_000), name="z")
+    result, plot = summ(values, graph="lazy")
+    assert isinstance(plot, LazyPlot)
+    assert result == summ(values)
+    dots = plot.render().axes[0].collections[0].get_offsets()
+    assert len(dots) == 2000
+    assert dots[0][0] == values.min() and dots[-1][0] == values.max()
+    assert list(dots[[0, -1], 1]) == [1, 100_000]
+
+
+def test_summ_graph_by_group():
+    """
+    category: one_shot test
+    """
+    df = data("Outbreak")
+    result, plot = summ(df["age"], by=df["sex"], graph="lazy")
+    assert list(result["sex"]) == [0, 1]
+    assert list(result["obs"]) == [373, 721]
+    axes = plot.render().axes[0]
+    assert len(axes.get_legend().get_texts()) == 2
+    with pytest.raises(ValueError, match="graph is only available for a single variable"):
+        summ(df, graph=True)
+    with pytest.raises(ValueError, match="graph must be True, False or 'lazy'."):
+        summ(df["age"], graph="yes")
+
+
+def test_summ_weights_match_expanded_data():
+    """
+    category: pattern test
+    """
+    df = data("Outbreak")
+    compact = df.groupby(["sex", "age"], observed=True).size().rename("n").reset_index()
+    expanded = compact.loc[np.repeat(compact.index, compact["n"])]
+    result = summ(compact["age"], weights=compact["n"])
+    for key, value in summ(expanded["age"]).items():
+        np.testing.assert_allclose(result[key], value)
+    pd.testing.assert_frame_equal(summ(compact, by="sex", weights="n"),
+                                  summ(expanded[["sex", "age"]], by="sex"),
+                                  check_dtype=False)
+
+
+def test_summ_weights_errors():
+    """
+    category: edge test
+    """
+    with pytest.raises(ValueError, match="weights must have the same length as the data."):
+        summ(pd.Series([1, 2]), weights=[1])
+    with pytest.raises(ValueError, match="weights must be non-negative numbers."):
+        summ(pd.Series([1, 2]), weights=[1, -1])
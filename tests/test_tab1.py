@@ -4,8 +4,9 @@ This is docstring for test_tab1.py
 
 import numpy as np
 import pytest
-from pyepidisplay.data import data
-from pyepidisplay.tab1 import tab1
+import pandas as pd
+from pyepidisplay.data import data, stream
+from pyepidisplay.tab1 import tab1, tab1_chunks, tab1_many
 
 outbreak = data("Outbreak")
 
@@ -90,3 +91,173 @@ def test_tab1_pattern():
 
     # Cumulative Percent must be non-decreasing ----
     assert result["Cumulative Percent"].is_monotonic_increasing
+
+
+def test_tab1_chunks_matches_tab1():
+    """
+    category: pattern test
+    """
+    for column in ["age", "sex"]:
+        expected = tab1(column, outbreak, graph=False)
+        result = tab1_chunks(column, stream("Outbreak", chunksize=100), graph=False)
+        pd.testing.assert_frame_equal(result, expected)
+
+
+def test_tab1_chunks_na():
+    """
+    category: edge test
+    """
+    with pytest.raises(ValueError, match="Column contains NA values."):
+        tab1_chunks("onset", stream("Outbreak", chunksize=100), graph=False)
+
+
+def test_tab1_weights_match_expanded_data():
+    """
+    category: pattern test
+    """
+    for column in ["age", "sex"]:
+        compact = outbreak.groupby(column).size().rename("n").reset_index()
+        expanded = compact.loc[np.repeat(compact.index, compact["n"])]
+        pd.testing.assert_frame_equal(tab1(column, compact, graph=False, weights="n"),
+                                      tab1(column, expanded, graph=False))
+    with pytest.raises(ValueError, match="weights must be non-negative numbers."):
+        tab1("sex", compact, graph=False, weights=-compact["n"])
+
+
+def test_tab1_na_options():
+    """
+    na="drop" tabulates the non-missing rows; na="count" adds a last NA level.
+
+    category: pattern test
+    """
+    dropped = tab1("onset", outbreak, graph=False, na="drop")
+    expected = tab1("onset", outbreak.dropna(subset=["onset"]), graph=False)
+    pd.testing.assert_frame_equal(dropped, expected)
+
+    counted = tab1("onset", outbreak, graph=False, na="count")
+    assert pd.isna(counted.index[-1])
+    assert counted["Frequency"].iloc[-1] == outbreak["onset"].isna().sum()
+    assert counted["Frequency"].sum() == len(outbreak)
+    np.testing.assert_almost_equal(counted["Cumulative Percent"].iloc[-1], 100.0, decimal=0)
+    with pytest.raises(ValueError, match="na must be 'error', 'drop' or 'count'."):
+        tab1("onset", outbreak, graph=False, na="keep")
+
+
+def test_tab1_na_categorical_and_weights():
+    """
+    Unused categories stay at zero and weights follow the dropped or counted rows.
+
+    category: edge test
+    """
+    df = pd.DataFrame({"grade": pd.Categorical(["a", None, "a", "c"], categories=["a", "b", "c"]),
+                       "n": [1, 5, 2, 4]})
+    counted = tab1("grade", df, graph=False, na="count")
+    assert counted["Frequency"].tolist() == [2, 0, 1, 1]
+    weighted = tab1("grade", df, graph=False, weights="n", na="drop")
+    assert weighted["Frequency"].tolist() == [3, 0, 4]
+    assert weighted["Percent"].tolist() == [42.86, 0.0, 57.14]
+    with pytest.raises(ValueError, match="Column contains NA values."):
+        tab1("grade", df, graph=False)
+
+
+def test_tab1_many_matches_tab1():
+    """
+    Every table of tab1_many (dict, threaded or long) equals the tab1 table.
+
+    category: pattern test
+    """
+    oswego = data("Oswego")
+    tables = tab1_many(oswego, na="count", n_jobs=2)
+    assert "age" not in tables and "sex" in tables and "mashedpota" in tables
+    for column, table in tables.items():
+        pd.testing.assert_frame_equal(table, tab1(column, oswego, graph=False, na="count"))
+
+    long = tab1_many(outbreak, columns=["sex", "age"], long=True)
+    assert long.columns.tolist() == ["variable", "level", "Frequency", "Percent",
+                                     "Cumulative Percent"]
+    age = long[long["variable"] == "age"]
+    np.testing.assert_array_equal(age["Frequency"], tab1("age", outbreak, graph=False)["Frequency"])
+
+
+def test_tab1_many_errors_and_lazy_plots():
+    """
+    Errors name the column; graph="lazy" returns one undrawn plot per column.
+
+    category: edge test
+    """
+    with pytest.raises(ValueError, match="Column 'onset': Column contains NA values."):
+        tab1_many(outbreak, columns=["sex", "onset"])
+    with pytest.raises(ValueError, match="Columns not found in DataFrame: region."):
+        tab1_many(outbreak, columns=["sex", "region"])
+    tables, plots = tab1_many(outbreak, columns=["sex", "nausea"], graph="lazy")
+    assert list(plots) == list(tables) == ["sex", "nausea"]
+    assert tab1_many(outbreak.iloc[:, :0], long=True).empty
+
+
+def test_tab1_top_and_min_freq():
+    """
+    top= keeps the most frequent levels and min_freq= the common ones, with the rest in "Other".
+
+    category: pattern test
+    """
+    full = tab1("age", outbreak, graph=False)
+    top = tab1("age", outbreak, graph=False, top=5)
+    expected = full["Frequency"].sort_values(ascending=False, kind="stable").iloc[:5]
+    assert top.index[:5].tolist() == expected.index.tolist()
+    assert top.index[-1] == "Other"
+    assert top["Frequency"].sum() == len(outbreak)
+    np.testing.assert_almost_equal(top["Cumulative Percent"].iloc[-1], 100.0, decimal=1)
+
+    common = tab1("age", outbreak, graph=False, min_freq=50)
+    assert (common["Frequency"].iloc[:-1] >= 50).all()
+    assert common.index[:-1].is_monotonic_increasing
+    assert common.loc["Other", "Frequency"] == full.loc[full["Frequency"] < 50, "Frequency"].sum()
+    few = tab1("sex", outbreak, graph=False, top=5)
+    assert "Other" not in few.index
+    pd.testing.assert_series_equal(few["Frequency"].sort_index(),
+                                   tab1("sex", outbreak, graph=False)["Frequency"])
+    with pytest.raises(ValueError, match="top must be a positive integer."):
+        tab1("age", outbreak, graph=False, top=0)
+    with pytest.raises(ValueError, match="min_freq must be a non-negative number."):
+        tab1("age", outbreak, graph=False, min_freq=-1)
+
+
+def test_tab1_chunks_top_heavy_hitters():
+    """
+    The Misra-Gries summary is exact when it has room and within rows / (counters + 1) otherwise.
+
+    category: edge test
+    """
+    exact = tab1("age", outbreak, graph=False, top=5)
+    roomy = tab1_chunks("age", stream("Outbreak", chunksize=100), graph=False, top=5)
+    pd.testing.assert_frame_equal(roomy, exact)
+
+    rng = np.random.default_rng(0)
+    codes = pd.DataFrame({"facility": np.minimum(rng.zipf(1.3, 200_000), 50_000)})
+    expected = tab1("facility", codes, graph=False, top=10)
+    chunks = (codes.iloc[i:i + 20_000] for i in range(0, len(codes), 20_000))
+    result = tab1_chunks("facility", chunks, graph=False, top=10, counters=500)
+    assert result.index.tolist() == expected.index.tolist()
+    error = expected["Frequency"] - result["Frequency"]
+    assert (error.iloc[:-1] >= 0).all() and (error.iloc[:-1] <= len(codes) / 501).all()
+    assert result["Frequency"].sum() == len(codes)
+    with pytest.raises(ValueError, match="counters must be a positive integer of at least top."):
+        tab1_chunks("facility", [codes], graph=False, top=10, counters=5)
+
+
+def test_tab1_chunks_na_and_weights():
+    """
+    tab1_chunks passes na= and a weights column through like tab1.
+
+    category: pattern test
+    """
+    for na in ("drop", "count"):
+        pd.testing.assert_frame_equal(
+            tab1_chunks("onset", stream("Outbreak", chunksize=100), graph=False, na=na),
+            tab1("onset", outbreak, graph=False, na=na))
+    compact = outbreak.groupby("age").size().rename("n").reset_index()
+    pd.testing.assert_frame_equal(
+        tab1_chunks("age", [compact.iloc[:20], compact.iloc[20:]], graph=False, weights="n"),
+        tab1("age", compact, graph=False, weights="n"))
+    with pytest.raises(ValueError, match="weights of chunked data must be a column name."):
+        tab1_chunks("age", [compact], graph=False, weights=compact["n"])
@@ -215,3 +215,21 @@ def compare_py_r_tabpct_graph_col(df):
     print(f"\nMATCH: {match}\n")
     return match
 tabpct(df["sex"], df["beefcurry"], graph=True, percent="col")
+
+
+def test_weights_match_expanded_data(capsys):
+    """Pattern test: frequency weights give the tables of the expanded rows."""
+    compact = df.groupby(["sex", "beefcurry"]).size().rename("n").reset_index()
+    expanded = compact.loc[compact.index.repeat(compact["n"])].reset_index(drop=True)
+    expected = tabpct(expanded["sex"], expanded["beefcurry"], graph=False)
+    expected_out = capsys.readouterr().out
+    result = tabpct(compact["sex"], compact["beefcurry"], graph=False, weights=compact["n"])
+    assert capsys.readouterr().out == expected_out
+    for key, table in expected.items():
+        pd.testing.assert_frame_equal(result[key], table)
+
+
+def test_graph_must_be_valid():
+    """Edge test: a misspelt graph option is rejected like in tab1 and dotplot."""
+    with pytest.raises(ValueError, match="graph must be True, False or 'lazy'."):
+        tabpct(df["sex"], df["beefcurry"], graph="lazzy")